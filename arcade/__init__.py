@@ -177,9 +177,12 @@ def configure_logging(level: int | None = None):
 from .sprite import SpriteSolidColor
 
 from .sprite_list import SpriteList
+from .sprite_list import ChunkedSpriteList
 from .sprite_list import check_for_collision
 from .sprite_list import check_for_collision_with_list
 from .sprite_list import check_for_collision_with_lists
+from .sprite_list import check_for_collision_with_lists_at
+from .sprite_list import check_for_collisions_between_lists
 from .sprite_list import get_closest_sprite
 from .sprite_list import get_sprites_at_exact_point
 from .sprite_list import get_sprites_at_point
@@ -191,6 +194,7 @@ def configure_logging(level: int | None = None):
 from .scene import Scene
 from .scene import SceneKeyError
 
+from .physics_engines import PhysicsEngineGroup
 from .physics_engines import PhysicsEnginePlatformer
 from .physics_engines import PhysicsEngineSimple
 
@@ -206,6 +210,8 @@ def configure_logging(level: int | None = None):
 
 from .paths import has_line_of_sight
 from .paths import AStarBarrierList
+from .paths import AStarPathCache
+from .paths import FlowField
 from .paths import astar_calculate_path
 
 from .context import ArcadeContext
@@ -247,10 +253,13 @@ def configure_logging(level: int | None = None):
     load_font,
     create_text_sprite,
     Text,
+    TextBatch,
+    GlyphText,
 )
 
 __all__ = [
     "AStarBarrierList",
+    "AStarPathCache",
     "AnimatedWalkingSprite",
     "TextureAnimationSprite",
     "TextureAnimation",
@@ -261,11 +270,13 @@ def configure_logging(level: int | None = None):
     "FACE_LEFT",
     "FACE_RIGHT",
     "FACE_UP",
+    "FlowField",
     "MOUSE_BUTTON_LEFT",
     "MOUSE_BUTTON_MIDDLE",
     "MOUSE_BUTTON_RIGHT",
     "NoOpenGLException",
     "PerfGraph",
+    "PhysicsEngineGroup",
     "PhysicsEnginePlatformer",
     "PhysicsEngineSimple",
     "PyMunk",
@@ -287,8 +298,11 @@ def configure_logging(level: int | None = None):
     "PymunkMixin",
     "SpriteCircle",
     "SpriteList",
+    "ChunkedSpriteList",
     "SpriteSolidColor",
     "Text",
+    "TextBatch",
+    "GlyphText",
     "Texture",
     "TextureCacheManager",
     "SpriteSheet",
@@ -304,6 +318,8 @@ def configure_logging(level: int | None = None):
     "check_for_collision",
     "check_for_collision_with_list",
     "check_for_collision_with_lists",
+    "check_for_collision_with_lists_at",
+    "check_for_collisions_between_lists",
     "close_window",
     "disable_timings",
     "draw_arc_filled",
@@ -4,6 +4,8 @@
 from .hit_box import HitBoxCache
 from .texture import TextureCache
 from .image_data import ImageDataCache
+from .label import LabelCache
+from .glyph import CachedGlyph, GlyphCache
 
 
 def crate_str_from_values(*args, sep: str = "_") -> str:
@@ -46,4 +48,7 @@ def crate_str_from_list(entries: list[Any], sep: str = "_") -> str:
     "crate_str_from_list",
     "crate_str_from_values",
     "ImageDataCache",
+    "LabelCache",
+    "CachedGlyph",
+    "GlyphCache",
 ]
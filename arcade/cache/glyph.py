@@ -0,0 +1,151 @@
+"""
+A cache for glyph textures used to draw text with sprites.
+
+Each glyph is rendered once for every font, size and style into a texture
+atlas. Text made of glyph sprites can then change without allocating new
+space in the atlas.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING, NamedTuple
+from weakref import WeakKeyDictionary
+
+if TYPE_CHECKING:
+    from arcade import Texture
+    from arcade.texture_atlas import TextureAtlasBase
+
+
+class CachedGlyph(NamedTuple):
+    """
+    A glyph rendered into a texture atlas.
+
+    All glyphs of the same font, size and style have the same height
+    and baseline, so they can be placed next to each other on a line.
+    """
+
+    texture: Texture | None
+    """The texture of the glyph. ``None`` for glyphs without pixels such as spaces."""
+    advance: float
+    """How far to move to the right before placing the next glyph."""
+    height: float
+    """The height of a line of text."""
+    baseline: float
+    """Distance from the bottom of the texture to the baseline."""
+
+
+class GlyphCache:
+    """
+    Glyph textures rendered into texture atlases.
+
+    Glyphs are rendered in white using :py:class:`~arcade.Text`, so the
+    color of the sprites showing them sets the color of the text. Each
+    atlas gets its own textures since they are rendered directly into it.
+
+    .. warning:: Glyphs are rendered into the atlas, not uploaded from an image.
+
+        :py:meth:`TextureAtlasBase.rebuild() <arcade.texture_atlas.TextureAtlasBase.rebuild>`
+        clears them. Call :py:meth:`flush` after rebuilding an atlas.
+    """
+
+    def __init__(self) -> None:
+        # atlas -> style and character -> glyph
+        self._glyphs: WeakKeyDictionary[TextureAtlasBase, dict[str, CachedGlyph]] = (
+            WeakKeyDictionary()
+        )
+        self.hits = 0
+        """Number of glyphs found in the cache"""
+        self.misses = 0
+        """Number of glyphs rendered"""
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Counters and current size of the cache."""
+        return {
+            "entries": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def get(
+        self,
+        char: str,
+        atlas: TextureAtlasBase,
+        font_size: float = 12,
+        font_name: str | tuple[str, ...] = ("calibri", "arial"),
+        bold: bool | str = False,
+        italic: bool = False,
+    ) -> CachedGlyph:
+        """
+        Get a glyph, rendering it into the atlas if needed.
+
+        Args:
+            char: The character to get the glyph for
+            atlas: The texture atlas the glyph is used with
+            font_size: Size of the text in points
+            font_name: A font name, path to a font file, or list of names
+            bold: Whether the text is bold, and if a string, how bold
+            italic: Whether the text is italic
+        """
+        glyphs = self._glyphs.get(atlas)
+        if glyphs is None:
+            glyphs = self._glyphs[atlas] = {}
+
+        key = f"{font_size}|{font_name}|{bold}|{italic}|{ord(char)}"
+        glyph = glyphs.get(key)
+        if glyph is not None:
+            self.hits += 1
+            return glyph
+
+        self.misses += 1
+        glyph = glyphs[key] = self._render(key, char, atlas, font_size, font_name, bold, italic)
+        return glyph
+
+    def _render(
+        self,
+        key: str,
+        char: str,
+        atlas: TextureAtlasBase,
+        font_size: float,
+        font_name: str | tuple[str, ...],
+        bold: bool | str,
+        italic: bool,
+    ) -> CachedGlyph:
+        """Render a glyph into the atlas like :py:func:`~arcade.create_text_sprite`."""
+        from arcade import Texture, color
+        from arcade.text import Text
+
+        text = Text(char, 0, 0, font_size=font_size, font_name=font_name, bold=bold, italic=italic)
+        advance = text.right - text.left
+        height = text.top - text.bottom
+        baseline = -text.bottom
+        size = math.ceil(advance), math.ceil(height)
+        if char.isspace() or size[0] == 0 or size[1] == 0:
+            return CachedGlyph(None, advance, height, baseline)
+
+        texture = Texture.create_empty(f"glyph|{key}", size)
+        atlas.add(texture)
+        text.y = baseline
+        with atlas.render_into(texture) as fbo:
+            fbo.clear(color=color.TRANSPARENT_BLACK)
+            text.draw()
+        return CachedGlyph(texture, advance, height, baseline)
+
+    def flush(self, atlas: TextureAtlasBase | None = None) -> None:
+        """
+        Remove glyphs from the cache.
+
+        Args:
+            atlas: Only remove the glyphs of this atlas
+        """
+        if atlas is None:
+            self._glyphs.clear()
+        else:
+            self._glyphs.pop(atlas, None)
+
+    def __len__(self) -> int:
+        return sum(len(glyphs) for glyphs in self._glyphs.values())
+
+    def __repr__(self) -> str:
+        return f"GlyphCache(entries={len(self)})"
@@ -7,12 +7,17 @@
 * None     : Simply a box around the whole texture. No caching needed.
 * Simple   : Scanning the corners for the texture
 * Detailed : fairly detailed hit box generated by pymunk with detail parameter
+
+The cache can be given a directory where hit boxes are persisted in a
+compact binary file so they don't need to be recalculated between runs.
 """
 
 from __future__ import annotations
 
 import gzip
 import json
+import struct
+from array import array
 from collections import OrderedDict
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -24,6 +29,116 @@
     from arcade import Texture
 
 
+class _HitBoxFile:
+    """
+    Append-only binary file storing hit box points by cache name.
+
+    The file starts with a magic string and a version. Each record is
+    the length of the name, the number of points, the utf-8 encoded name
+    and the points as packed float32 values. The file is read once when
+    first needed, but only the record headers are parsed. Points are
+    unpacked when they are requested.
+
+    Args:
+        path: Path to the file. It's created when the first record is written.
+    """
+
+    MAGIC = b"ARCADEHB"
+    VERSION = 1
+    _header = struct.Struct("<8sI")
+    _record = struct.Struct("<HI")
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._data = bytearray()
+        # name -> (offset of the points, number of points)
+        self._index: dict[str, tuple[int, int]] | None = None
+
+    def _load(self) -> dict[str, tuple[int, int]]:
+        """Read the file and index its records."""
+        index: dict[str, tuple[int, int]] = {}
+        self._index = index
+        try:
+            data = bytearray(self.path.read_bytes())
+        except FileNotFoundError:
+            return index
+
+        header = self._header
+        if len(data) < header.size or header.unpack_from(data) != (self.MAGIC, self.VERSION):
+            # Unknown or outdated file. Start over.
+            self.path.unlink()
+            return index
+
+        record = self._record
+        offset = header.size
+        while offset + record.size <= len(data):
+            name_length, point_count = record.unpack_from(data, offset)
+            points_offset = offset + record.size + name_length
+            end = points_offset + point_count * 8
+            if end > len(data):
+                break
+            name = data[offset + record.size : points_offset].decode("utf-8")
+            index[name] = points_offset, point_count
+            offset = end
+
+        if offset != len(data):
+            # Drop an incomplete record left by an interrupted write
+            del data[offset:]
+            with open(self.path, mode="r+b") as fd:
+                fd.truncate(offset)
+
+        self._data = data
+        return index
+
+    def __contains__(self, name: str) -> bool:
+        index = self._load() if self._index is None else self._index
+        return name in index
+
+    def get(self, name: str) -> Point2List | None:
+        """
+        Get the points stored for a name.
+
+        Args:
+            name: The cache name of the hit box
+        """
+        index = self._load() if self._index is None else self._index
+        entry = index.get(name)
+        if entry is None:
+            return None
+        offset, point_count = entry
+        values = struct.unpack_from(f"<{point_count * 2}f", self._data, offset)
+        return tuple(zip(values[0::2], values[1::2]))
+
+    def put(self, name: str, points: Point2List) -> None:
+        """
+        Append points for a name to the file.
+
+        Args:
+            name: The cache name of the hit box
+            points: The hit box points
+        """
+        index = self._load() if self._index is None else self._index
+        name_bytes = name.encode("utf-8")
+        values = array("f", [value for point in points for value in point])
+        record = bytearray()
+        if not self._data:
+            record += self._header.pack(self.MAGIC, self.VERSION)
+        record += self._record.pack(len(name_bytes), len(points))
+        record += name_bytes
+        points_offset = len(self._data) + len(record)
+        record += values.tobytes()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, mode="ab") as fd:
+            fd.write(record)
+        self._data += record
+        index[name] = points_offset, len(points)
+
+    def __len__(self) -> int:
+        index = self._load() if self._index is None else self._index
+        return len(index)
+
+
 class HitBoxCache:
     """
     A simple cache for hit box points for textures.
@@ -33,12 +148,67 @@ class HitBoxCache:
 
     Points are stored as a tuple of xy points since
     it's important that they are immutable.
+
+    If a directory is given, hit boxes are also persisted in a binary
+    file in that directory. Entries missing from memory are looked up in
+    that file and new entries are appended to it, so hit boxes calculated
+    in one run are reused in the next. Points are stored as 32 bit floats.
+
+    If ``max_entries`` is set, the least recently used entries are evicted
+    from memory when adding new entries exceeds the limit. Evicted entries
+    are kept in the persisted file.
+
+    Args:
+        directory:
+            Optional directory to persist hit boxes in.
+        max_entries:
+            The maximum number of entries to keep in memory.
+            ``None`` means no limit.
     """
 
     VERSION = 1
+    #: Name of the file hit boxes are persisted in
+    FILE_NAME = "hit_boxes.bin"
 
-    def __init__(self):
+    def __init__(self, directory: str | Path | None = None, max_entries: int | None = None):
         self._entries: OrderedDict[str, Point2List] = OrderedDict()
+        self._max_entries = max_entries
+        self.hits = 0
+        """Number of successful lookups"""
+        self.misses = 0
+        """Number of lookups not finding an entry"""
+        self.evictions = 0
+        """Number of entries evicted to stay within the limit"""
+        self._directory: Path | None = None
+        self._file: _HitBoxFile | None = None
+        if directory is not None:
+            self._directory = Path(directory)
+            self._file = _HitBoxFile(self._directory / self.FILE_NAME)
+
+    @property
+    def directory(self) -> Path | None:
+        """The directory hit boxes are persisted in, if any (read only)."""
+        return self._directory
+
+    @property
+    def max_entries(self) -> int | None:
+        """Get or set the maximum number of entries in memory. ``None`` means no limit."""
+        return self._max_entries
+
+    @max_entries.setter
+    def max_entries(self, value: int | None) -> None:
+        self._max_entries = value
+        self._evict()
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Counters and current size of the cache."""
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
 
     def __len__(self) -> int:
         return len(self._entries)
@@ -67,12 +237,27 @@ def get(self, name_or_texture: str | Texture) -> Point2List | None:
         from arcade import Texture
 
         if isinstance(name_or_texture, Texture):
-            return self._entries.get(name_or_texture.cache_name, None)
+            name = name_or_texture.cache_name
         elif isinstance(name_or_texture, str):
-            return self._entries.get(name_or_texture, None)
+            name = name_or_texture
         else:
             raise TypeError(f"Expected str or Texture: {name_or_texture}")
 
+        points = self._entries.get(name, None)
+        if points is not None:
+            self._entries.move_to_end(name)
+        elif self._file is not None:
+            points = self._file.get(name)
+            if points is not None:
+                self._entries[name] = points
+                self._evict()
+
+        if points is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return points
+
     def put(self, name_or_texture: str | Texture, points: Point2List) -> None:
         """
         Store hit box points for a texture.
@@ -97,12 +282,18 @@ def put(self, name_or_texture: str | Texture, points: Point2List) -> None:
             raise ValueError(f"Hit box must have at least 3 points: {points}")
 
         if isinstance(name_or_texture, Texture):
-            self._entries[name_or_texture.cache_name] = tuple(points)
+            name = name_or_texture.cache_name
         elif isinstance(name_or_texture, str):
-            self._entries[name_or_texture] = tuple(points)
+            name = name_or_texture
         else:
             raise TypeError(f"Expected str or Texture: {name_or_texture}")
 
+        self._entries[name] = tuple(points)
+        self._entries.move_to_end(name)
+        if self._file is not None and name not in self._file:
+            self._file.put(name, points)
+        self._evict()
+
     def load(self, path: str | Path) -> None:
         """
         Load a json file containing hit boxes.
@@ -125,6 +316,7 @@ def load(self, path: str | Path) -> None:
 
         for key, value in data.items():
             self._entries[key] = tuple(value)
+        self._evict()
 
     def save(self, path: Path, indent: int = 0) -> None:
         """
@@ -155,8 +347,21 @@ def save(self, path: Path, indent: int = 0) -> None:
             fd.write(data)
 
     def flush(self) -> None:
-        """Clear the cache."""
+        """
+        Clear the cache.
+
+        Hit boxes persisted in the cache directory are kept.
+        """
         self._entries.clear()
 
+    def _evict(self) -> None:
+        """Evict the least recently used entries until the cache is within the limit."""
+        max_entries = self._max_entries
+        if max_entries is None:
+            return
+        while len(self._entries) > max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
     def __repr__(self) -> str:
         return f"HitBoxCache(entries={len(self)})"
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Callable
 
 if TYPE_CHECKING:
     from arcade.texture import ImageData
@@ -20,10 +21,80 @@ class ImageDataCache:
     The reasoning for caching the ImageData object instead of the
     PIL.Image object is to avoid re-calculating the hash in addition
     to eliminating the need to load it and convert the pixel format.
+
+    The cache is unbounded by default. If ``max_entries`` or ``max_bytes``
+    is set, the least recently used entries are evicted when adding new
+    entries exceeds the budget. The size of an image is estimated as
+    ``width * height * 4`` bytes. Entries for which ``in_use`` returns
+    ``True`` are never evicted, so the cache can temporarily exceed
+    its budget.
+
+    Args:
+        max_entries:
+            The maximum number of entries to keep. ``None`` means no limit.
+        max_bytes:
+            The maximum estimated size of the cached images in bytes.
+            ``None`` means no limit.
+        in_use:
+            Optional function returning ``True`` for images that should
+            not be evicted, for example because a texture atlas still
+            contains them.
     """
 
-    def __init__(self):
-        self._entries: dict[str, "ImageData"] = {}
+    def __init__(
+        self,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        in_use: Callable[[ImageData], bool] | None = None,
+    ):
+        self._entries: OrderedDict[str, "ImageData"] = OrderedDict()
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._bytes = 0
+        self.in_use = in_use
+        """Function deciding if an image is still in use and can't be evicted"""
+        self.hits = 0
+        """Number of successful lookups"""
+        self.misses = 0
+        """Number of lookups not finding an entry"""
+        self.evictions = 0
+        """Number of entries evicted to stay within the budget"""
+
+    @property
+    def max_entries(self) -> int | None:
+        """Get or set the maximum number of entries. ``None`` means no limit."""
+        return self._max_entries
+
+    @max_entries.setter
+    def max_entries(self, value: int | None) -> None:
+        self._max_entries = value
+        self._evict()
+
+    @property
+    def max_bytes(self) -> int | None:
+        """Get or set the maximum estimated size in bytes. ``None`` means no limit."""
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: int | None) -> None:
+        self._max_bytes = value
+        self._evict()
+
+    @property
+    def total_bytes(self) -> int:
+        """The estimated size of all cached images in bytes (read only)."""
+        return self._bytes
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Counters and current size of the cache."""
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
 
     def put(self, name: str, image: "ImageData"):
         """
@@ -41,7 +112,12 @@ def put(self, name: str, image: "ImageData"):
         if not isinstance(image, ImageData):
             raise TypeError("image must be an instance of ImageData")
 
+        old = self._entries.pop(name, None)
+        if old is not None:
+            self._bytes -= old.width * old.height * 4
         self._entries[name] = image
+        self._bytes += image.width * image.height * 4
+        self._evict()
 
     def get(self, name: str) -> ImageData | None:
         """
@@ -52,7 +128,13 @@ def get(self, name: str) -> ImageData | None:
         Returns:
             ImageData instance or ``None`` if not found
         """
-        return self._entries.get(name)
+        image = self._entries.get(name)
+        if image is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(name)
+        return image
 
     def delete(self, name: str, raise_if_not_exist: bool = False) -> None:
         """
@@ -65,14 +147,39 @@ def delete(self, name: str, raise_if_not_exist: bool = False) -> None:
                 If ``True``, raises ``KeyError`` if the entry does not exist
         """
         try:
-            del self._entries[name]
+            image = self._entries.pop(name)
         except KeyError:
             if raise_if_not_exist:
                 raise
+        else:
+            self._bytes -= image.width * image.height * 4
 
     def flush(self):
         """Clears the cache."""
         self._entries.clear()
+        self._bytes = 0
+
+    def _evict(self) -> None:
+        """Evict the least recently used entries until the cache is within budget."""
+        max_entries, max_bytes = self._max_entries, self._max_bytes
+        if max_entries is None and max_bytes is None:
+            return
+
+        def over_budget() -> bool:
+            return (max_entries is not None and len(self._entries) > max_entries) or (
+                max_bytes is not None and self._bytes > max_bytes
+            )
+
+        if not over_budget():
+            return
+        for name, image in list(self._entries.items()):
+            if self.in_use is not None and self.in_use(image):
+                continue
+            del self._entries[name]
+            self._bytes -= image.width * image.height * 4
+            self.evictions += 1
+            if not over_budget():
+                return
 
     def __len__(self):
         return len(self._entries)
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from arcade import Text
+
+
+class LabelCache:
+    """
+    A bounded cache for the labels used by :py:func:`arcade.draw_text`.
+
+    Labels are grouped by a style key describing the settings that are
+    expensive to change, such as the font and the width. Each style can
+    hold several labels with different text, so drawing a few different
+    strings with the same style doesn't lay out the text again every time.
+
+    When a style has ``max_variants`` labels, the least recently used one
+    is handed out for new text instead of creating another label. When the
+    cache holds more than ``capacity`` labels, the least recently used
+    labels of the least recently used styles are dropped. Dropped labels
+    are deleted.
+
+    ``cache[style]`` and ``cache[style] = label`` get and add the most
+    recently used label of a style, like the dict used by older versions.
+
+    Args:
+        capacity:
+            The maximum number of labels to keep.
+        max_variants:
+            The maximum number of labels with different text for each style.
+    """
+
+    def __init__(self, capacity: int = 256, max_variants: int = 8):
+        if capacity < 1 or max_variants < 1:
+            raise ValueError("capacity and max_variants must be positive")
+        # style -> text -> label, both in least recently used order
+        self._entries: OrderedDict[str, OrderedDict[str, Text]] = OrderedDict()
+        self._capacity = capacity
+        self._max_variants = max_variants
+        self._size = 0
+        self.hits = 0
+        """Number of lookups finding a label with the same style and text"""
+        self.misses = 0
+        """Number of lookups not finding a label"""
+        self.evictions = 0
+        """Number of labels dropped to stay within the capacity"""
+
+    @property
+    def capacity(self) -> int:
+        """Get or set the maximum number of labels."""
+        return self._capacity
+
+    @capacity.setter
+    def capacity(self, value: int) -> None:
+        if value < 1:
+            raise ValueError("capacity must be positive")
+        self._capacity = value
+        self._evict()
+
+    @property
+    def max_variants(self) -> int:
+        """The maximum number of labels for each style (read only)."""
+        return self._max_variants
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Counters and current size of the cache."""
+        return {
+            "entries": self._size,
+            "styles": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def get(self, style: str, text: str) -> Text | None:
+        """
+        Get the label for a style and text.
+
+        Args:
+            style: The style key of the label
+            text: The text of the label
+        Returns:
+            The label if found, otherwise ``None``
+        """
+        variants = self._entries.get(style)
+        if variants is None:
+            self.misses += 1
+            return None
+        label = variants.get(text)
+        if label is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(style)
+        variants.move_to_end(text)
+        return label
+
+    def take_reusable(self, style: str) -> Text | None:
+        """
+        Remove and return the least recently used label of a style
+        if the style has no room for another label.
+
+        The label can then be given new text and added back with :py:meth:`put`.
+
+        Args:
+            style: The style key of the label
+        Returns:
+            A label to reuse, otherwise ``None``
+        """
+        variants = self._entries.get(style)
+        if variants is None or len(variants) < self._max_variants:
+            return None
+        _, label = variants.popitem(last=False)
+        self._size -= 1
+        return label
+
+    def put(self, style: str, text: str, label: Text) -> None:
+        """
+        Add a label to the cache.
+
+        Args:
+            style: The style key of the label
+            text: The text of the label
+            label: The label
+        """
+        variants = self._entries.get(style)
+        if variants is None:
+            variants = self._entries[style] = OrderedDict()
+        else:
+            self._entries.move_to_end(style)
+
+        old_label = variants.pop(text, None)
+        if old_label is not None:
+            self._size -= 1
+            if old_label is not label:
+                old_label.delete()
+        elif len(variants) >= self._max_variants:
+            _, old_label = variants.popitem(last=False)
+            old_label.delete()
+            self._size -= 1
+            self.evictions += 1
+        variants[text] = label
+        self._size += 1
+        self._evict()
+
+    def flush(self) -> None:
+        """Remove and delete all labels in the cache."""
+        for variants in self._entries.values():
+            for label in variants.values():
+                label.delete()
+        self._entries.clear()
+        self._size = 0
+
+    def clear(self) -> None:
+        """Same as :py:meth:`flush`."""
+        self.flush()
+
+    def _evict(self) -> None:
+        """Drop the least recently used labels until the cache is within capacity."""
+        while self._size > self._capacity:
+            style, variants = next(iter(self._entries.items()))
+            _, label = variants.popitem(last=False)
+            label.delete()
+            self._size -= 1
+            self.evictions += 1
+            if not variants:
+                del self._entries[style]
+
+    def __getitem__(self, style: str) -> Text:
+        variants = self._entries.get(style)
+        if not variants:
+            raise KeyError(style)
+        return next(reversed(variants.values()))
+
+    def __setitem__(self, style: str, label: Text) -> None:
+        self.put(style, label.text, label)
+
+    def __contains__(self, style: object) -> bool:
+        return style in self._entries
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __repr__(self) -> str:
+        return f"LabelCache(entries={self._size}, capacity={self._capacity})"
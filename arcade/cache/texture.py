@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 
 from arcade.texture.texture import Texture
 
@@ -13,10 +14,12 @@
 class TextureBucket:
     """
     A simple dict based cache for textures.
+
+    Entries are kept in the order they were last added or fetched.
     """
 
     def __init__(self):
-        self._entries: dict[str, Texture] = {}
+        self._entries: OrderedDict[str, Texture] = OrderedDict()
 
     def put(self, name: str, texture: Texture) -> None:
         """
@@ -40,7 +43,22 @@ def get(self, name: str) -> Texture | None:
         Returns:
             The texture if found, otherwise ``None``
         """
-        return self._entries.get(name)
+        texture = self._entries.get(name)
+        if texture is not None:
+            self._entries.move_to_end(name)
+        return texture
+
+    def pop(self, name: str) -> Texture | None:
+        """
+        Remove and return a texture from the cache by cache name.
+
+        Args:
+            name:
+                The cache name of the texture
+        Returns:
+            The texture if found, otherwise ``None``
+        """
+        return self._entries.pop(name, None)
 
     def delete(self, name: str, raise_if_not_exist: bool = True) -> None:
         """
@@ -94,11 +112,81 @@ class TextureCache:
     for making different configurations of the same texture such as flipped
     and rotated versions including textures with different hit box configurations
     for the same image.
+
+    The cache is unbounded by default. If ``max_entries`` or ``max_bytes``
+    is set, the least recently used textures are evicted when adding new
+    textures exceeds the budget. The size of a texture is estimated as
+    ``width * height * 4`` bytes of its image. Textures for which ``in_use``
+    returns ``True`` are never evicted, so the cache can temporarily
+    exceed its budget.
+
+    Args:
+        max_entries:
+            The maximum number of textures to keep. ``None`` means no limit.
+        max_bytes:
+            The maximum estimated size of the cached textures in bytes.
+            ``None`` means no limit.
+        in_use:
+            Optional function returning ``True`` for textures that should
+            not be evicted, for example because a texture atlas still
+            contains them.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        in_use: Callable[[Texture], bool] | None = None,
+    ):
         self._entries = TextureBucket()
         self._file_entries = TextureBucket()
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._bytes = 0
+        self.in_use = in_use
+        """Function deciding if a texture is still in use and can't be evicted"""
+        self.hits = 0
+        """Number of successful lookups"""
+        self.misses = 0
+        """Number of lookups not finding a texture"""
+        self.evictions = 0
+        """Number of textures evicted to stay within the budget"""
+
+    @property
+    def max_entries(self) -> int | None:
+        """Get or set the maximum number of textures. ``None`` means no limit."""
+        return self._max_entries
+
+    @max_entries.setter
+    def max_entries(self, value: int | None) -> None:
+        self._max_entries = value
+        self._evict()
+
+    @property
+    def max_bytes(self) -> int | None:
+        """Get or set the maximum estimated size in bytes. ``None`` means no limit."""
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: int | None) -> None:
+        self._max_bytes = value
+        self._evict()
+
+    @property
+    def total_bytes(self) -> int:
+        """The estimated size of all cached textures in bytes (read only)."""
+        return self._bytes
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Counters and current size of the cache."""
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
 
     def put(self, texture: "Texture") -> None:
         """
@@ -109,7 +197,11 @@ def put(self, texture: "Texture") -> None:
         Args:
             texture: The texture to add
         """
+        old = self._entries.pop(texture.cache_name)
+        if old is not None:
+            self._bytes -= old.image.width * old.image.height * 4
         self._entries.put(texture.cache_name, texture)
+        self._bytes += texture.image.width * texture.image.height * 4
 
         # Only cache by file path if it's the whole texture and not a crop
         # if texture.file_path and texture.crop_values in [None, (0, 0, 0, 0)]:
@@ -118,6 +210,8 @@ def put(self, texture: "Texture") -> None:
         if image_cache_name:
             self._file_entries.put(image_cache_name, texture)
 
+        self._evict()
+
     def get(self, name: str) -> Texture | None:
         """
         Get a texture from the cache by cache name
@@ -127,7 +221,12 @@ def get(self, name: str) -> Texture | None:
         Returns:
             The texture if found, otherwise ``None``
         """
-        return self._entries.get(name)
+        texture = self._entries.get(name)
+        if texture is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return texture
 
     def get_with_config(self, hash: str, hit_box_algorithm: "HitBoxAlgorithm") -> Texture | None:
         """
@@ -164,7 +263,14 @@ def get_texture_by_filepath(
         from arcade import Texture
 
         file_cache_name = Texture.create_image_cache_name(file_path, crop)
-        return self._file_entries.get(file_cache_name)
+        texture = self._file_entries.get(file_cache_name)
+        if texture is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            # Mark the texture as recently used
+            self._entries.get(texture.cache_name)
+        return texture
 
     def delete(self, texture_or_name: Texture | str, raise_if_not_exist: bool = False) -> None:
         """
@@ -180,22 +286,58 @@ def delete(self, texture_or_name: Texture | str, raise_if_not_exist: bool = Fals
             texture = texture_or_name
             name = texture.cache_name
             # Delete from texture buckets
-            self._entries.delete(name, raise_if_not_exist=raise_if_not_exist)
+            self._delete_entry(name, raise_if_not_exist=raise_if_not_exist)
             # Delete from file bucket. Only present if file_path was provided
             self._file_entries.delete_by_value(texture)
         elif isinstance(texture_or_name, str):
             name = texture_or_name
             # Delete from texture buckets
-            self._entries.delete(name, raise_if_not_exist=raise_if_not_exist)
+            self._delete_entry(name, raise_if_not_exist=raise_if_not_exist)
             # Delete from file buckets
             self._file_entries.delete(name, raise_if_not_exist=False)
         else:
             raise TypeError(f"Expected Texture or str, got {type(texture_or_name)}")
 
+    def _delete_entry(self, name: str, raise_if_not_exist: bool) -> None:
+        """Delete a texture from the texture bucket keeping track of the size."""
+        texture = self._entries.pop(name)
+        if texture is None:
+            if raise_if_not_exist:
+                raise KeyError(name)
+            return
+        self._bytes -= texture.image.width * texture.image.height * 4
+
     def flush(self) -> None:
         """Clear the cache"""
         self._entries.flush()
         self._file_entries.flush()
+        self._bytes = 0
+
+    def _evict(self) -> None:
+        """Evict the least recently used textures until the cache is within budget."""
+        max_entries, max_bytes = self._max_entries, self._max_bytes
+        if max_entries is None and max_bytes is None:
+            return
+
+        def over_budget() -> bool:
+            return (max_entries is not None and len(self._entries) > max_entries) or (
+                max_bytes is not None and self._bytes > max_bytes
+            )
+
+        if not over_budget():
+            return
+        for name, texture in list(self._entries._entries.items()):
+            if self.in_use is not None and self.in_use(texture):
+                continue
+            self._entries.pop(name)
+            self._bytes -= texture.image.width * texture.image.height * 4
+            # The file bucket only references textures by their image cache name
+            image_cache_name = texture.image_cache_name
+            if image_cache_name and self._file_entries._entries.get(image_cache_name) is texture:
+                self._file_entries.delete(image_cache_name)
+            self.evictions += 1
+            if not over_budget():
+                return
 
     def get_all_textures(self) -> set["Texture"]:
         """Get all textures in the cache"""
@@ -14,7 +14,6 @@
 from pyglet.graphics.shader import UniformBufferObject
 from pyglet.math import Mat4
 
-import arcade
 from arcade.camera import Projector
 from arcade.camera.default import DefaultProjector
 from arcade.gl import BufferDescription, Context
@@ -202,9 +201,15 @@ def __init__(
         self.geometry_empty: Geometry = self.geometry()
 
         self._atlas: TextureAtlasBase | None = None
+        # Imported here since arcade.cache imports modules depending on this one
+        from arcade.cache.glyph import GlyphCache
+        from arcade.cache.label import LabelCache
+
         # Global labels we modify in `arcade.draw_text`.
         # These multiple labels with different configurations are stored
-        self.label_cache: dict[str, arcade.Text] = {}
+        self.label_cache = LabelCache()
+        # Glyph textures used by `arcade.GlyphText`
+        self.glyph_cache = GlyphCache()
 
         # self.active_program = None
         self.point_size = 1.0
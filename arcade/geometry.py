@@ -1,7 +1,9 @@
 """
 Functions for handling collisions with geometry.
 
-These are the pure python versions of the functions.
+These are the pure python versions of the functions. Batched versions
+testing many polygons or points at once are available when NumPy is
+installed.
 
 Point in polygon function from https://www.geeksforgeeks.org/how-to-check-if-a-given-point-lies-inside-a-polygon/
 """
@@ -9,9 +11,39 @@
 from __future__ import annotations
 
 from sys import maxsize as sys_int_maxsize
+from typing import Sequence
 
 from arcade.types import Point2, Point2List
 
+# NumPy is an optional dependency only used by the batched functions
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore
+
+
+def _get_rectangle_bounds(polygon: Point2List) -> tuple[float, float, float, float] | None:
+    """
+    Get the bounds of an axis-aligned rectangle.
+
+    Args:
+        polygon: List of points that define the polygon.
+
+    Returns:
+        ``(left, right, bottom, top)`` if the polygon is an unrotated
+        rectangle with a non-zero area, ``None`` otherwise.
+    """
+    if len(polygon) != 4:
+        return None
+    (ax, ay), (bx, by), (cx, cy), (dx, dy) = polygon
+    if ax == cx or ay == cy:
+        return None
+    if (ax == bx and by == cy and cx == dx and dy == ay) or (
+        ay == by and bx == cx and cy == dy and dx == ax
+    ):
+        return min(ax, cx), max(ax, cx), min(ay, cy), max(ay, cy)
+    return None
+
 
 def are_polygons_intersecting(poly_a: Point2List, poly_b: Point2List) -> bool:
     """
@@ -27,6 +59,19 @@ def are_polygons_intersecting(poly_a: Point2List, poly_b: Point2List) -> bool:
     # if either are [], they don't intersect
     if not poly_a or not poly_b:
         return False
+
+    # Unrotated rectangles, like most tile hit boxes, only need their bounds compared
+    bounds_a = _get_rectangle_bounds(poly_a)
+    if bounds_a is not None:
+        bounds_b = _get_rectangle_bounds(poly_b)
+        if bounds_b is not None:
+            return (
+                bounds_a[0] < bounds_b[1]
+                and bounds_b[0] < bounds_a[1]
+                and bounds_a[2] < bounds_b[3]
+                and bounds_b[2] < bounds_a[3]
+            )
+
     for polygon in (poly_a, poly_b):
         for i1 in range(len(polygon)):
             i2 = (i1 + 1) % len(polygon)
@@ -218,3 +263,167 @@ def is_point_in_polygon(x: float, y: float, polygon: Point2List) -> bool:
 
     # Return true if count is odd, false otherwise
     return count % 2 == 1
+
+
+def _get_edge_normals(points):
+    """
+    Get the (unnormalized) normals of the edges of one or more polygons.
+
+    Args:
+        points: Array of shape ``(..., vertices, 2)``.
+    """
+    edges = np.roll(points, -1, axis=-2) - points
+    return np.stack((edges[..., 1], -edges[..., 0]), axis=-1)
+
+
+def _are_rectangles(edges) -> bool:
+    """
+    Check if all quadrilaterals are unrotated rectangles with a non-zero area.
+
+    Args:
+        edges: Edge vectors of the quadrilaterals, with shape ``(n, 4, 2)``.
+    """
+    vertical = edges[..., 0] == 0
+    horizontal = edges[..., 1] == 0
+    alternating = (vertical[:, 0::2].all(axis=1) & horizontal[:, 1::2].all(axis=1)) | (
+        horizontal[:, 0::2].all(axis=1) & vertical[:, 1::2].all(axis=1)
+    )
+    return bool((alternating & ~(vertical & horizontal).any(axis=1)).all())
+
+
+def are_polygons_intersecting_many(
+    polygon: Point2List, polygons: Sequence[Point2List]
+) -> list[bool]:
+    """
+    Check if a polygon intersects each polygon in a sequence.
+
+    This gives the same results as calling :py:func:`are_polygons_intersecting`
+    for every polygon, but polygons with the same number of points are
+    tested together using NumPy. Requires NumPy.
+
+    Args:
+        polygon: List of points that define the polygon to test.
+        polygons: Sequence of polygons to test against. An array of shape
+            ``(n, points, 2)`` is used without copying it.
+
+    Returns:
+        A list with ``True`` for each polygon intersecting ``polygon``,
+        ``False`` otherwise.
+    """
+    if np is None:
+        raise ImportError("are_polygons_intersecting_many requires NumPy to be installed")
+
+    result = [False] * len(polygons)
+    if len(polygon) == 0:
+        return result
+
+    # Group the polygons by point count so each group can be stacked in one array
+    groups: dict[int, list[int]] = {}
+    if isinstance(polygons, np.ndarray):
+        # Already stacked
+        groups[polygons.shape[1]] = list(range(len(polygons)))
+    else:
+        lengths = [len(other) for other in polygons]
+        if len(set(lengths)) == 1:
+            groups[lengths[0]] = list(range(len(polygons)))
+        else:
+            for i, length in enumerate(lengths):
+                groups.setdefault(length, []).append(i)
+    groups.pop(0, None)
+
+    bounds_a = _get_rectangle_bounds(polygon)
+    poly_a = np.asarray(polygon, dtype=np.float64)
+    normals_a = _get_edge_normals(poly_a)
+    projected_a = poly_a @ normals_a.T
+    min_a = projected_a.min(axis=0)
+    max_a = projected_a.max(axis=0)
+
+    for length, indices in groups.items():
+        if len(indices) == len(polygons):
+            poly_b = np.asarray(polygons, dtype=np.float64)
+        else:
+            poly_b = np.array([polygons[i] for i in indices], dtype=np.float64)
+        edges_b = np.roll(poly_b, -1, axis=1) - poly_b
+
+        if bounds_a is not None and length == 4 and _are_rectangles(edges_b):
+            # Unrotated rectangles only need their bounds compared
+            left, right, bottom, top = bounds_a
+            min_b = poly_b.min(axis=1)
+            max_b = poly_b.max(axis=1)
+            intersecting = (
+                (left < max_b[:, 0])
+                & (min_b[:, 0] < right)
+                & (bottom < max_b[:, 1])
+                & (min_b[:, 1] < top)
+            )
+        else:
+            # Project everything onto the edge normals of the first polygon ...
+            projected_b = poly_b @ normals_a.T
+            separated = (
+                (max_a <= projected_b.min(axis=1)) | (projected_b.max(axis=1) <= min_a)
+            ).any(axis=1)
+
+            # ... and onto the edge normals of each of the other polygons
+            normals_b = np.stack((edges_b[..., 1], -edges_b[..., 0]), axis=-1)
+            projected_b = normals_b @ poly_b.transpose(0, 2, 1)
+            projected_a = normals_b @ poly_a.T
+            separated |= (
+                (projected_a.max(axis=2) <= projected_b.min(axis=2))
+                | (projected_b.max(axis=2) <= projected_a.min(axis=2))
+            ).any(axis=1)
+            intersecting = ~separated
+
+        if len(indices) == len(polygons):
+            return intersecting.tolist()
+        for i, is_intersecting in zip(indices, intersecting.tolist()):
+            result[i] = is_intersecting
+
+    return result
+
+
+def are_points_in_polygon(points: Point2List, polygon: Point2List) -> list[bool]:
+    """
+    Check which of a list of points are inside a polygon.
+
+    As with :py:func:`is_point_in_polygon`, points on the edge of the
+    polygon are not inside it. Requires NumPy.
+
+    Args:
+        points: List of points to check.
+        polygon: List of points that define the polygon.
+
+    Returns:
+        A list with ``True`` for each point inside the polygon,
+        ``False`` otherwise.
+    """
+    if np is None:
+        raise ImportError("are_points_in_polygon requires NumPy to be installed")
+
+    if len(polygon) < 3 or len(points) == 0:
+        return [False] * len(points)
+
+    # Points along the first axis, polygon edges along the second
+    xy = np.asarray(points, dtype=np.float64).reshape(-1, 1, 2)
+    x, y = xy[..., 0], xy[..., 1]
+    start = np.asarray(polygon, dtype=np.float64)
+    end = np.roll(start, -1, axis=0)
+    x1, y1 = start[:, 0], start[:, 1]
+    x2, y2 = end[:, 0], end[:, 1]
+
+    # Points on an edge are outside
+    cross = (x2 - x1) * (y - y1) - (y2 - y1) * (x - x1)
+    on_edge = (
+        (cross == 0)
+        & (np.minimum(x1, x2) <= x)
+        & (x <= np.maximum(x1, x2))
+        & (np.minimum(y1, y2) <= y)
+        & (y <= np.maximum(y1, y2))
+    ).any(axis=1)
+
+    # Count crossings of a ray towards +x, including each edge's lower end only
+    straddles = (y1 <= y) != (y2 <= y)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        crossing_x = x1 + (y - y1) * (x2 - x1) / (y2 - y1)
+    crossings = (straddles & (x < crossing_x)).sum(axis=1)
+
+    return ((crossings % 2 == 1) & ~on_edge).tolist()
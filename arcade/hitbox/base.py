@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from math import cos, radians, sin
-from typing import Any
+from typing import Any, Callable, Iterable, cast
 
 from PIL.Image import Image
 from typing_extensions import Self
@@ -57,6 +61,41 @@ def calculate(self, image: Image, **kwargs) -> Point2List:
         """
         raise NotImplementedError
 
+    def calculate_many(
+        self, images: Iterable[Image], processes: int | None = None, **kwargs
+    ) -> list[Point2List]:
+        """
+        Calculate hit box points for many images using a pool of processes.
+
+        This is intended for asset pipelines tracing a large number of
+        images with an expensive algorithm such as
+        :py:class:`~arcade.hitbox.PymunkHitBoxAlgorithm`. As with any use
+        of :py:mod:`multiprocessing`, scripts calling this should guard
+        their entry point with ``if __name__ == "__main__":``.
+
+        Args:
+            images:
+                The images to calculate hit box points for
+            processes:
+                The number of worker processes to use. Defaults to the number
+                of CPUs. With ``1`` all images are calculated in this process.
+            kwargs:
+                keyword arguments passed to :py:meth:`calculate`
+        Returns:
+            The hit box points of each image, in the same order as the images
+        """
+        images = list(images)
+        workers = min(processes or os.cpu_count() or 1, len(images))
+        if workers <= 1:
+            return [self.calculate(image, **kwargs) for image in images]
+
+        # A partial of the bound method can be pickled for the workers
+        calculate = cast(Callable[[Image], Point2List], partial(self.calculate, **kwargs))
+        # Send a few chunks to each worker to balance uneven image sizes
+        chunksize = max(1, len(images) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(calculate, images, chunksize=chunksize))
+
     def __call__(self, *args: Any, **kwds: Any) -> Self:
         """
         Shorthand allowing any instance to be used identically to the base type.
@@ -99,6 +138,12 @@ class HitBox:
     use :py:meth:`.create_rotatable` to create an instance of
     :py:class:`RotatableHitBox`.
 
+    The points are stored as a flat array of floats. Adjusted points
+    and their bounds are calculated together in a single pass and cached
+    until the position, scale or rotation changes. The list of tuples
+    returned by :py:meth:`.get_adjusted_points` is only built when it
+    is requested.
+
     Args:
         points:
             The unmodified points bounding the hit box
@@ -118,10 +163,23 @@ def __init__(
         self._position = position
         self._scale = scale
 
-        # This empty tuple will be replaced the first time
-        # get_adjusted_points is called
-        self._adjusted_points: Point2List = EMPTY_POINT_LIST
+        # x0, y0, x1, y1, ... of the unmodified points
+        self._flat_points = array("d", [value for point in points for value in point])
+        self._x_points = self._flat_points[0::2]
+        self._y_points = self._flat_points[1::2]
+
+        # These empty values will be replaced the first time
+        # the adjusted points or bounds are needed
+        self._adjusted_x: list[float] = []
+        self._adjusted_y: list[float] = []
+        self._adjusted_bounds = (0.0, 0.0, 0.0, 0.0)
         self._adjusted_cache_dirty = True
+        # The flat array and the tuple view of the adjusted points
+        # are only built when requested
+        self._adjusted_flat_points = array("d")
+        self._adjusted_flat_points_dirty = True
+        self._adjusted_points: Point2List = EMPTY_POINT_LIST
+        self._adjusted_points_dirty = True
 
     @property
     def points(self) -> Point2List:
@@ -145,45 +203,42 @@ def position(self, position: Point2):
         self._position = position
         self._adjusted_cache_dirty = True
 
-    # Per Clepto's testing as of around May 2023, these are better
-    # left uncached because caching them is somehow slower than what
-    # we currently do. Any readers should feel free to retest /
-    # investigate further.
     @property
     def left(self) -> float:
         """
         Calculates the leftmost adjusted x position of this hit box
         """
-        points = self.get_adjusted_points()
-        x_points = [point[0] for point in points]
-        return min(x_points)
+        return self.bounds[0]
 
     @property
     def right(self) -> float:
         """
         Calculates the rightmost adjusted x position of this hit box
         """
-        points = self.get_adjusted_points()
-        x_points = [point[0] for point in points]
-        return max(x_points)
+        return self.bounds[1]
 
     @property
     def top(self) -> float:
         """
         Calculates the topmost adjusted y position of this hit box
         """
-        points = self.get_adjusted_points()
-        y_points = [point[1] for point in points]
-        return max(y_points)
+        return self.bounds[3]
 
     @property
     def bottom(self) -> float:
         """
         Calculates the bottommost adjusted y position of this hit box
         """
-        points = self.get_adjusted_points()
-        y_points = [point[1] for point in points]
-        return min(y_points)
+        return self.bounds[2]
+
+    @property
+    def bounds(self) -> tuple[float, float, float, float]:
+        """
+        The ``(left, right, bottom, top)`` bounds of the adjusted points.
+        """
+        if self._adjusted_cache_dirty:
+            self._update_adjusted()
+        return self._adjusted_bounds
 
     @property
     def scale(self) -> tuple[float, float]:
@@ -217,6 +272,64 @@ def create_rotatable(
             self._points, position=self._position, scale=self._scale, angle=angle
         )
 
+    def _get_matrix(self) -> tuple[float, float, float, float]:
+        """
+        Get the ``(a, b, c, d)`` part of the matrix transforming the points.
+
+        The adjusted points are ``(a * x + b * y + px, c * x + d * y + py)``
+        where ``(px, py)`` is the position.
+        """
+        return self._scale[0], 0.0, 0.0, self._scale[1]
+
+    def _update_adjusted(self) -> None:
+        """
+        Transform the points and calculate their bounds.
+        """
+        a, b, c, d = self._get_matrix()
+        position_x, position_y = self._position
+        x_points = self._x_points
+        y_points = self._y_points
+
+        if b or c:
+            adjusted_x = [a * x + b * y + position_x for x, y in zip(x_points, y_points)]
+            adjusted_y = [c * x + d * y + position_y for x, y in zip(x_points, y_points)]
+        else:
+            adjusted_x = [x * a + position_x for x in x_points]
+            adjusted_y = [y * d + position_y for y in y_points]
+
+        self._adjusted_x = adjusted_x
+        self._adjusted_y = adjusted_y
+        if adjusted_x:
+            self._adjusted_bounds = (
+                min(adjusted_x),
+                max(adjusted_x),
+                min(adjusted_y),
+                max(adjusted_y),
+            )
+        else:
+            self._adjusted_bounds = (position_x, position_x, position_y, position_y)
+        self._adjusted_cache_dirty = False
+        self._adjusted_points_dirty = True
+        self._adjusted_flat_points_dirty = True
+
+    def get_adjusted_flat_points(self) -> array:
+        """
+        Return the adjusted points as a flat ``x0, y0, x1, y1, ...`` array.
+
+        The array is replaced rather than modified when the hit box changes,
+        so it can be kept by the caller. Like :py:meth:`.get_adjusted_points`,
+        it is only recalculated when necessary.
+        """
+        if self._adjusted_cache_dirty:
+            self._update_adjusted()
+        if self._adjusted_flat_points_dirty:
+            adjusted = array("d", self._flat_points)
+            adjusted[0::2] = array("d", self._adjusted_x)
+            adjusted[1::2] = array("d", self._adjusted_y)
+            self._adjusted_flat_points = adjusted
+            self._adjusted_flat_points_dirty = False
+        return self._adjusted_flat_points
+
     def get_adjusted_points(self) -> Point2List:
         """
         Return the positions of points, scaled and offset from the center.
@@ -226,21 +339,16 @@ def get_adjusted_points(self) -> Point2List:
 
         * The first time this method is called
         * After properties affecting adjusted position were changed
-        """
-        if not self._adjusted_cache_dirty:
-            return self._adjusted_points  # type: ignore
-
-        def _adjust_point(point) -> Point2:
-            x, y = point
-
-            x *= self.scale[0]
-            y *= self.scale[1]
-
-            return (x + self.position[0], y + self.position[1])
 
-        self._adjusted_points = [_adjust_point(point) for point in self.points]
-        self._adjusted_cache_dirty = False
-        return self._adjusted_points  # type: ignore [return-value]
+        The points are the same as :py:meth:`.get_adjusted_flat_points`
+        returns, as a list of tuples.
+        """
+        if self._adjusted_cache_dirty:
+            self._update_adjusted()
+        if self._adjusted_points_dirty:
+            self._adjusted_points = list(zip(self._adjusted_x, self._adjusted_y))
+            self._adjusted_points_dirty = False
+        return self._adjusted_points
 
 
 class RotatableHitBox(HitBox):
@@ -271,6 +379,9 @@ def __init__(
     ):
         super().__init__(points, position=position, scale=scale)
         self._angle: float = angle
+        # The rotation and scale part of the transform is kept
+        # while only the position changes
+        self._matrix: tuple[float, float, float, float] | None = None
 
     @property
     def angle(self) -> float:
@@ -282,39 +393,37 @@ def angle(self) -> float:
     @angle.setter
     def angle(self, angle: float):
         self._angle = angle
+        self._matrix = None
         self._adjusted_cache_dirty = True
 
-    def get_adjusted_points(self) -> Point2List:
+    @property
+    def scale(self) -> tuple[float, float]:
         """
-        Return the offset, scaled, & rotated points of this hitbox.
+        The X & Y scaling factors for the points in this hit box.
 
-        As with :py:meth:`.HitBox.get_adjusted_points`, this method only
-        recalculates the adjusted values when necessary.
+        These are used to calculate the final adjusted positions of points.
         """
-        if not self._adjusted_cache_dirty:
-            return self._adjusted_points
-
-        rad = radians(-self._angle)
-        rad_cos = cos(rad)
-        rad_sin = sin(rad)
-
-        def _adjust_point(point) -> Point2:
-            x, y = point
+        return self._scale
 
-            x *= self.scale[0]
-            y *= self.scale[1]
+    @scale.setter
+    def scale(self, scale: tuple[float, float]):
+        self._scale = scale
+        self._matrix = None
+        self._adjusted_cache_dirty = True
 
+    def _get_matrix(self) -> tuple[float, float, float, float]:
+        if self._matrix is None:
+            scale_x, scale_y = self._scale
+            rad = radians(-self._angle)
             if rad:
-                rot_x = x * rad_cos - y * rad_sin
-                rot_y = x * rad_sin + y * rad_cos
-                x = rot_x
-                y = rot_y
-
-            return (
-                x + self.position[0],
-                y + self.position[1],
-            )
-
-        self._adjusted_points = [_adjust_point(point) for point in self.points]
-        self._adjusted_cache_dirty = False
-        return self._adjusted_points
+                rad_cos = cos(rad)
+                rad_sin = sin(rad)
+                self._matrix = (
+                    scale_x * rad_cos,
+                    -scale_y * rad_sin,
+                    scale_x * rad_sin,
+                    scale_y * rad_cos,
+                )
+            else:
+                self._matrix = scale_x, 0.0, 0.0, scale_y
+        return self._matrix
@@ -13,6 +13,9 @@
 
 from .base import HitBoxAlgorithm
 
+# Lookup table turning alpha values into a 0 or 255 mask
+_ALPHA_TO_MASK = [0] + [255] * 255
+
 
 class PymunkHitBoxAlgorithm(HitBoxAlgorithm):
     """
@@ -90,6 +93,18 @@ def to_points_list(self, image: Image, line_set: list[Vec2d]) -> Point2List:
         # Return immutable data
         return tuple(points)
 
+    @staticmethod
+    def get_alpha_mask(image: Image) -> bytes:
+        """
+        Get a mask of the image with one byte per pixel, row by row.
+
+        Each byte is 255 where the pixel isn't fully transparent and 0 where it is.
+
+        Args:
+            image: RGBA image to get the mask for.
+        """
+        return image.getchannel("A").point(_ALPHA_TO_MASK).tobytes()
+
     def trace_image(self, image: Image) -> PolylineSet:
         """
         Trace the image and return a list of line sets.
@@ -102,19 +117,17 @@ def trace_image(self, image: Image) -> PolylineSet:
             image: Image to trace.
         """
 
+        # Look up samples in a precomputed alpha mask instead
+        # of reading each pixel through the image
+        width, height = image.width, image.height
+        mask = self.get_alpha_mask(image)
+
         def sample_func(sample_point: Point2) -> int:
             """Method used to sample image."""
-            if (
-                sample_point[0] < 0
-                or sample_point[1] < 0
-                or sample_point[0] >= image.width
-                or sample_point[1] >= image.height
-            ):
+            x, y = sample_point
+            if x < 0 or y < 0 or x >= width or y >= height:
                 return 0
-
-            point_tuple = int(sample_point[0]), int(sample_point[1])
-            color = image.getpixel(point_tuple)
-            return 255 if color[3] > 0 else 0
+            return mask[int(y) * width + int(x)]
 
         # Do a quick check if it is a full tile
         # Points are pixel coordinates
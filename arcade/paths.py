@@ -4,14 +4,24 @@
 
 from __future__ import annotations
 
+import heapq
 import math
+import time
+from array import array
+from collections import OrderedDict
 from typing import cast
 
 from arcade import Sprite, SpriteList, check_for_collision_with_list, get_sprites_at_point
 from arcade.math import get_distance, lerp_2d
-from arcade.types import Point, Point2
+from arcade.types import Point, Point2, Rect
 
-__all__ = ["AStarBarrierList", "astar_calculate_path", "has_line_of_sight"]
+__all__ = [
+    "AStarBarrierList",
+    "AStarPathCache",
+    "FlowField",
+    "astar_calculate_path",
+    "has_line_of_sight",
+]
 
 
 def _spot_is_blocked(position: Point2, moving_sprite: Sprite, blocking_sprites: SpriteList) -> bool:
@@ -71,6 +81,10 @@ class _AStarGraph(object):
             Far top side y value
         diagonal_movement (bool):
             Whether or not to use diagonals in the AStarSearch Algorithm
+        grid (bytearray | None):
+            Optional barrier grid with one byte per cell, row by row from
+            ``bottom`` to ``top``. A non-zero byte marks a barrier.
+            When given it is used instead of ``barriers``.
     """
 
     def __init__(
@@ -81,12 +95,15 @@ def __init__(
         bottom: int,
         top: int,
         diagonal_movement: bool,
+        grid: bytearray | None = None,
     ):
-        self.barriers = barriers if barriers is set else set(barriers)
+        self.barriers = barriers if isinstance(barriers, set) else set(barriers)
         self.left = left
         self.right = right
         self.top = top
         self.bottom = bottom
+        self.grid = grid
+        self.width = right - left + 1
 
         if diagonal_movement:
             self.movement_directions = (  # type: ignore
@@ -123,6 +140,23 @@ def get_vertex_neighbours(self, pos: Point) -> list[tuple[float, float]]:
             n.append((x2, y2))
         return n
 
+    def is_blocked(self, pos: Point) -> bool:
+        """
+        Return if a grid position is a barrier
+
+        Args:
+            pos: The grid position to check
+        Returns:
+            ``True`` if the position can't be entered
+        """
+        if self.grid is None:
+            return pos in self.barriers
+        x = int(pos[0]) - self.left
+        y = int(pos[1]) - self.bottom
+        if x < 0 or y < 0 or x >= self.width or y > self.top - self.bottom:
+            return False
+        return self.grid[y * self.width + x] != 0
+
     def move_cost(self, a: Point, b: Point) -> float:
         """
         Returns a float of the cost to move
@@ -137,7 +171,7 @@ def move_cost(self, a: Point, b: Point) -> float:
         Returns:
             The move cost of moving between of the 2 points
         """
-        if b in self.barriers:
+        if self.is_blocked(b):
             return float("inf")  # Infinitely high cost to enter barrier squares
 
         elif a[0] == b[0] or a[1] == b[1]:
@@ -146,81 +180,87 @@ def move_cost(self, a: Point, b: Point) -> float:
             return 1.42
 
 
-def _AStarSearch(start: Point2, end: Point2, graph: _AStarGraph) -> list[Point2] | None:
+def _AStarSearch(
+    start: Point2,
+    end: Point2,
+    graph: _AStarGraph,
+    max_iterations: int | None = None,
+    time_budget: float | None = None,
+) -> list[Point2] | None:
     """
     Returns a path from start to end using the AStarSearch Algorithm
 
-    Graph is used to check for barriers.
+    Graph is used to check for barriers. The open set is kept in a binary heap
+    ordered by estimated cost, ties are broken by the lowest position.
 
     Args:
         start: point to start at
         end: point to end at
         graph: Graph to use
+        max_iterations: Give up after expanding this many vertices
+        time_budget: Give up after this many seconds
     Returns:
         The path from start to end. Returns ``None`` if is path is not found
     """
     G: dict[Point2, float] = dict()  # Actual movement cost to each position from the start position
-    F: dict[Point2, float] = (
-        dict()
-    )  # Estimated movement cost of start to end going via this position
 
     # Initialize starting values
     G[start] = 0
-    F[start] = _heuristic(start, end)
 
     closed_vertices = set()
-    open_vertices = {start}  # type: ignore
+    # Heap of (estimated cost of start to end going via this position, position).
+    # Positions are pushed again when a cheaper route is found, so outdated
+    # entries are skipped when they are popped.
+    open_heap = [(_heuristic(start, end), start)]
     came_from = {}  # type: ignore
 
+    deadline = None if time_budget is None else time.perf_counter() + time_budget
+
     count = 0
-    while len(open_vertices) > 0:
-        count += 1
-        if count > 500:
-            break
+    while open_heap:
         # Get the vertex in the open list with the lowest F score
-        current = None
-        current_fscore = math.inf
-        for pos in sorted(open_vertices):
-            if current is None or F[pos] < current_fscore:
-                current_fscore = F[pos]
-                current = pos
+        _, current = heapq.heappop(open_heap)
+        if current in closed_vertices:
+            continue
 
         # Check if we have reached the goal
-        if current == end and current is not None:
+        if current == end:
             # Retrace our route backward
             path = [current]
             while current in came_from:
                 current = came_from[current]
-                path.append(current)  # type: ignore
+                path.append(current)
             path.reverse()
-            if F[end] >= 10000:
-                return None
-            else:
-                return path
-            # return path, F[end]  # Done!
+            return path
+
+        count += 1
+        if max_iterations is not None and count > max_iterations:
+            break
+        if deadline is not None and time.perf_counter() > deadline:
+            break
 
         # Mark the current vertex as closed
-        open_vertices.remove(current)  # type: ignore
-        closed_vertices.add(current)  # type: ignore
+        closed_vertices.add(current)
+        current_g = G[current]
 
         # Update scores for vertices near the current position
-        for neighbour in sorted(graph.get_vertex_neighbours(current)):  # type: ignore
+        for neighbour in graph.get_vertex_neighbours(current):
             if neighbour in closed_vertices:
                 continue  # We have already processed this node exhaustively
-            candidate_g = G[current] + graph.move_cost(current, neighbour)  # type: ignore
+            cost = graph.move_cost(current, neighbour)
+            if cost == math.inf:
+                continue  # Barriers are never entered
+            candidate_g = current_g + cost
 
-            if neighbour not in open_vertices:
-                open_vertices.add(neighbour)  # Discovered a new vertex
-            elif candidate_g >= G[neighbour]:
+            if candidate_g >= G.get(neighbour, math.inf):
                 continue  # This G score is worse than previously found
 
             # Adopt this G score
             came_from[neighbour] = current
             G[neighbour] = candidate_g
-            h = _heuristic(neighbour, end)
-            F[neighbour] = G[neighbour] + h
+            heapq.heappush(open_heap, (candidate_g + _heuristic(neighbour, end), neighbour))
 
-    # Out-of-bounds
+    # Out-of-bounds or out of budget
     return None
 
 
@@ -239,6 +279,11 @@ class AStarBarrierList:
     Class that manages a list of barriers that can be encountered during
     A* path finding.
 
+    The barriers are stored in :py:attr:`grid`. When only a few blocking
+    sprites change, use :py:meth:`add_blocking_sprite`,
+    :py:meth:`remove_blocking_sprite` or :py:meth:`update_region` instead
+    of :py:meth:`recalculate` so only the affected cells are tested again.
+
     Args:
         moving_sprite:
             Sprite that will be moving
@@ -254,9 +299,10 @@ class AStarBarrierList:
             Bottom of playing field
         top (int):
             Top of playing field
-        barrier_list:
-            SpriteList of barriers to use in _AStarSearch,
-            ``None`` if not recalculated
+        rasterize (bool):
+            Build the initial barriers from the bounding boxes of the
+            blocking sprites instead of a collision check per grid cell.
+            See :py:meth:`recalculate`.
 
     Attributes:
         grid_size:
@@ -273,9 +319,12 @@ class AStarBarrierList:
             Sprite that will be moving
         blocking_sprites:
             Sprites that can block movement
-        barrier_list:
-            SpriteList of barriers to use in _AStarSearch,
-            ``None`` if not recalculated
+        grid:
+            The barriers as one byte per grid cell, row by row from
+            ``bottom`` to ``top``. A non-zero byte marks a barrier.
+        version:
+            Increased every time the barriers change. Used to
+            invalidate :py:class:`AStarPathCache` and :py:class:`FlowField`.
     """
 
     def __init__(
@@ -287,6 +336,7 @@ def __init__(
         right: int,
         bottom: int,
         top: int,
+        rasterize: bool = False,
     ):
         self.grid_size = grid_size
         self.bottom = int(bottom // grid_size)
@@ -295,37 +345,410 @@ def __init__(
         self.right = int(right // grid_size)
         self.moving_sprite = moving_sprite
         self.blocking_sprites = blocking_sprites
-        self.barrier_list = None
+        self.grid = bytearray()
+        self.version = 0
+        self._barrier_list: list[Point2] | None = None
 
-        self.recalculate()
+        self.recalculate(rasterize=rasterize)
+
+    @property
+    def width(self) -> int:
+        """Number of grid cells along the x axis"""
+        return self.right - self.left + 1
+
+    @property
+    def height(self) -> int:
+        """Number of grid cells along the y axis"""
+        return self.top - self.bottom + 1
+
+    @property
+    def barrier_list(self) -> list[Point2]:
+        """
+        Sorted list of the grid positions that are blocked.
+
+        This is created from :py:attr:`grid` when it's first read
+        after the barriers changed.
+        """
+        if self._barrier_list is None:
+            width = self.width
+            barriers = [
+                (i % width + self.left, i // width + self.bottom)
+                for i, blocked in enumerate(self.grid)
+                if blocked
+            ]
+            self._barrier_list = sorted(barriers)
+        return self._barrier_list
+
+    @barrier_list.setter
+    def barrier_list(self, barriers: list[Point2] | tuple | set) -> None:
+        width = self.width
+        grid = bytearray(width * self.height)
+        for cx, cy in barriers:
+            if self.left <= cx <= self.right and self.bottom <= cy <= self.top:
+                grid[(int(cy) - self.bottom) * width + int(cx) - self.left] = 1
+        self.grid = grid
+        self._barrier_list = None
+        self.version += 1
+
+    def is_blocked(self, cx: int, cy: int) -> bool:
+        """
+        Return if a grid cell is blocked.
 
-    def recalculate(self):
-        """Recalculate blocking sprites."""
+        Args:
+            cx: Grid x position
+            cy: Grid y position
+        """
+        if not (self.left <= cx <= self.right and self.bottom <= cy <= self.top):
+            return False
+        return self.grid[(cy - self.bottom) * self.width + cx - self.left] != 0
+
+    def recalculate(self, rasterize: bool = False):
+        """
+        Recalculate blocking sprites.
+
+        By default the moving sprite is placed on every grid cell and checked
+        for collisions with the blocking sprites. With ``rasterize`` the cells
+        are instead marked from the bounding boxes of the blocking sprites,
+        which only costs one pass over the sprites. This is exact for
+        unrotated rectangular hit boxes and blocks a bit more than needed
+        for other shapes.
+
+        Args:
+            rasterize: Mark cells from bounding boxes instead of collision checks
+        """
+        self.grid = bytearray(self.width * self.height)
+        self._barrier_list = None
+        self.version += 1
+
+        if rasterize:
+            for sprite in self.blocking_sprites:
+                self._rasterize(sprite)
+        else:
+            self._update_cells(self.left, self.right, self.bottom, self.top)
+
+    def update_region(self, rect: Rect) -> None:
+        """
+        Test again all grid cells where the moving sprite could touch ``rect``.
+
+        Call this with the old and new area of a blocking sprite that moved,
+        or with the area of a door that opened or closed.
+
+        Args:
+            rect: The area in pixels that changed
+        """
+        m_left, m_right, m_bottom, m_top = self._moving_extents()
+        g = self.grid_size
+        self._update_cells(
+            max(self.left, math.floor((rect.left - m_right) / g)),
+            min(self.right, math.ceil((rect.right - m_left) / g)),
+            max(self.bottom, math.floor((rect.bottom - m_top) / g)),
+            min(self.top, math.ceil((rect.top - m_bottom) / g)),
+        )
+
+    def add_blocking_sprite(self, sprite: Sprite) -> None:
+        """
+        Add a sprite to the blocking sprites and update the cells it blocks.
+
+        Args:
+            sprite: The sprite to add
+        """
+        if sprite not in self.blocking_sprites:
+            self.blocking_sprites.append(sprite)
+        self.update_region(sprite.rect)
+
+    def remove_blocking_sprite(self, sprite: Sprite) -> None:
+        """
+        Remove a sprite from the blocking sprites and update the cells it blocked.
+
+        Args:
+            sprite: The sprite to remove
+        """
+        self.blocking_sprites.remove(sprite)
+        self.update_region(sprite.rect)
+
+    def _moving_extents(self) -> tuple[float, float, float, float]:
+        """Bounds of the moving sprite relative to its position"""
+        sprite = self.moving_sprite
+        x, y = sprite.position
+        return sprite.left - x, sprite.right - x, sprite.bottom - y, sprite.top - y
+
+    def _rasterize(self, sprite: Sprite) -> None:
+        """Mark the cells where the moving sprite overlaps the sprite's bounds"""
+        m_left, m_right, m_bottom, m_top = self._moving_extents()
+        g = self.grid_size
+        # A cell is blocked if the bounds overlap, touching edges don't collide
+        cx_min = max(self.left, math.floor((sprite.left - m_right) / g) + 1)
+        cx_max = min(self.right, math.ceil((sprite.right - m_left) / g) - 1)
+        cy_min = max(self.bottom, math.floor((sprite.bottom - m_top) / g) + 1)
+        cy_max = min(self.top, math.ceil((sprite.top - m_bottom) / g) - 1)
+        if cx_min > cx_max:
+            return
+
+        grid = self.grid
+        width = self.width
+        row = b"\x01" * (cx_max - cx_min + 1)
+        for cy in range(cy_min, cy_max + 1):
+            start = (cy - self.bottom) * width + cx_min - self.left
+            grid[start : start + len(row)] = row
+        self._barrier_list = None
+
+    def _update_cells(self, cx_min: int, cx_max: int, cy_min: int, cy_max: int) -> None:
+        """Test the grid cells in a range for collisions with the blocking sprites"""
         # --- Iterate through the blocking sprites and find where we are blocked
 
         # Save original location
         original_pos = self.moving_sprite.position
-        # Create a set of barriers
-        self.barrier_list = set()
+        grid = self.grid
+        width = self.width
+        changed = False
         # Loop through the grid
-        for cx in range(self.left, self.right + 1):
-            for cy in range(self.bottom, self.top + 1):
-                # Grid location
-                cpos = cx, cy
+        for cx in range(cx_min, cx_max + 1):
+            for cy in range(cy_min, cy_max + 1):
                 # Pixel location
-                pos = _expand(cpos, self.grid_size)
+                pos = _expand((cx, cy), self.grid_size)
 
                 # See if we'll have a collision if our sprite is at this location
                 self.moving_sprite.position = pos
-                if (
+                blocked = (
                     len(check_for_collision_with_list(self.moving_sprite, self.blocking_sprites))
                     > 0
-                ):
-                    self.barrier_list.add(cpos)
+                )
+                i = (cy - self.bottom) * width + cx - self.left
+                if grid[i] != blocked:
+                    grid[i] = blocked
+                    changed = True
 
         # Restore original location
         self.moving_sprite.position = original_pos
-        self.barrier_list = sorted(self.barrier_list)
+        if changed:
+            self._barrier_list = None
+            self.version += 1
+
+
+class AStarPathCache:
+    """
+    Least recently used cache of paths for :py:func:`astar_calculate_path`.
+
+    Paths are stored by start cell, end cell and diagonal movement. The
+    cache is cleared when it's used with a different barrier list or when
+    the :py:attr:`AStarBarrierList.version` changes.
+
+    .. code-block:: python
+
+        cache = arcade.AStarPathCache()
+        path = arcade.astar_calculate_path(start, end, barrier_list, cache=cache)
+
+    Args:
+        capacity: Maximum number of paths to keep
+
+    Attributes:
+        hits: Number of paths returned from the cache
+        misses: Number of paths that had to be calculated
+    """
+
+    def __init__(self, capacity: int = 256):
+        if capacity <= 0:
+            raise ValueError("capacity must be greater than zero")
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self._paths: OrderedDict[tuple, list[Point2] | None] = OrderedDict()
+        self._barrier_list: AStarBarrierList | None = None
+        self._version = -1
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def clear(self) -> None:
+        """Remove all paths from the cache."""
+        self._paths.clear()
+
+    def _validate(self, barrier_list: AStarBarrierList) -> None:
+        """Clear the cache if the barriers changed since the paths were stored"""
+        if barrier_list is not self._barrier_list or barrier_list.version != self._version:
+            self._paths.clear()
+            self._barrier_list = barrier_list
+            self._version = barrier_list.version
+
+    def _get(self, key: tuple) -> tuple[bool, list[Point2] | None]:
+        """Return if the key was found and the cached path"""
+        try:
+            path = self._paths[key]
+        except KeyError:
+            self.misses += 1
+            return False, None
+        self._paths.move_to_end(key)
+        self.hits += 1
+        return True, path
+
+    def _put(self, key: tuple, path: list[Point2] | None) -> None:
+        self._paths[key] = path
+        if len(self._paths) > self.capacity:
+            self._paths.popitem(last=False)
+
+
+class FlowField:
+    """
+    Distances and directions from every grid cell to a single goal.
+
+    Useful when many sprites path find to the same goal. The field is
+    calculated once with a Dijkstra search from the goal. After that each
+    sprite can look up its next step in constant time.
+
+    The field is calculated again when the barrier list changes.
+
+    .. code-block:: python
+
+        field = arcade.FlowField(barrier_list, player.position)
+        for enemy in enemy_list:
+            next_point = field.get_next_point(enemy.position)
+
+    Args:
+        barrier_list: The barriers to path around
+        goal: The goal position in pixels
+        diagonal_movement: Whether or not to allow diagonal steps
+    """
+
+    def __init__(
+        self,
+        barrier_list: AStarBarrierList,
+        goal: Point,
+        diagonal_movement: bool = True,
+    ):
+        self.barrier_list = barrier_list
+        self.goal = goal
+        self.diagonal_movement = diagonal_movement
+        self._distances: array = array("f")
+        self._next_cells: array = array("i")
+        self._version = -1
+        self.recalculate()
+
+    def recalculate(self) -> None:
+        """Calculate the distance and next step of every cell."""
+        barrier_list = self.barrier_list
+        self._version = barrier_list.version
+
+        width = barrier_list.width
+        height = barrier_list.height
+        grid = barrier_list.grid
+        distances = [math.inf] * (width * height)
+        next_cells = [-1] * (width * height)
+
+        directions: tuple[tuple[int, int, float], ...]
+        if self.diagonal_movement:
+            directions = (
+                (1, 0, 1.0),
+                (-1, 0, 1.0),
+                (0, 1, 1.0),
+                (0, -1, 1.0),
+                (1, 1, 1.42),
+                (-1, 1, 1.42),
+                (1, -1, 1.42),
+                (-1, -1, 1.42),
+            )
+        else:
+            directions = (1, 0, 1.0), (-1, 0, 1.0), (0, 1, 1.0), (0, -1, 1.0)
+
+        gx, gy = _collapse(self.goal, barrier_list.grid_size)
+        gx -= barrier_list.left
+        gy -= barrier_list.bottom
+        if 0 <= gx < width and 0 <= gy < height and not grid[gy * width + gx]:
+            goal_index = gy * width + gx
+            distances[goal_index] = 0.0
+            heap = [(0.0, goal_index)]
+            while heap:
+                distance, index = heapq.heappop(heap)
+                if distance > distances[index]:
+                    continue
+                x = index % width
+                y = index // width
+                for dx, dy, cost in directions:
+                    x2 = x + dx
+                    y2 = y + dy
+                    if x2 < 0 or x2 >= width or y2 < 0 or y2 >= height:
+                        continue
+                    index2 = y2 * width + x2
+                    if grid[index2]:
+                        continue
+                    distance2 = distance + cost
+                    if distance2 < distances[index2]:
+                        distances[index2] = distance2
+                        next_cells[index2] = index
+                        heapq.heappush(heap, (distance2, index2))
+
+        self._distances = array("f", distances)
+        self._next_cells = array("i", next_cells)
+
+    def _index(self, position: Point) -> int:
+        """Cell index of a pixel position, -1 if outside the grid"""
+        if self._version != self.barrier_list.version:
+            self.recalculate()
+        barrier_list = self.barrier_list
+        cx, cy = _collapse(position, barrier_list.grid_size)
+        cx -= barrier_list.left
+        cy -= barrier_list.bottom
+        width = barrier_list.width
+        if cx < 0 or cx >= width or cy < 0 or cy >= barrier_list.height:
+            return -1
+        return cy * width + cx
+
+    def _point(self, index: int) -> Point2:
+        barrier_list = self.barrier_list
+        width = barrier_list.width
+        return _expand(
+            (index % width + barrier_list.left, index // width + barrier_list.bottom),
+            barrier_list.grid_size,
+        )
+
+    def get_distance(self, position: Point) -> float:
+        """
+        Get the path length in grid cells from a position to the goal.
+
+        Args:
+            position: Position in pixels
+        Returns:
+            The distance, ``math.inf`` if the goal can't be reached
+        """
+        index = self._index(position)
+        if index < 0:
+            return math.inf
+        return self._distances[index]
+
+    def get_next_point(self, position: Point) -> Point2 | None:
+        """
+        Get the next point to move to from a position.
+
+        Args:
+            position: Position in pixels
+        Returns:
+            The next point in pixels, the goal cell itself when already
+            at the goal or ``None`` if the goal can't be reached
+        """
+        index = self._index(position)
+        if index < 0 or self._distances[index] == math.inf:
+            return None
+        next_index = self._next_cells[index]
+        return self._point(index if next_index < 0 else next_index)
+
+    def get_path(self, position: Point) -> list[Point2] | None:
+        """
+        Follow the field from a position to the goal.
+
+        Args:
+            position: Position in pixels
+        Returns:
+            List of points including the start and goal cells,
+            or ``None`` if the goal can't be reached
+        """
+        index = self._index(position)
+        if index < 0 or self._distances[index] == math.inf:
+            return None
+        path = [self._point(index)]
+        next_cells = self._next_cells
+        while next_cells[index] >= 0:
+            index = next_cells[index]
+            path.append(self._point(index))
+        return path
 
 
 def astar_calculate_path(
@@ -333,10 +756,17 @@ def astar_calculate_path(
     end_point: Point,
     astar_barrier_list: AStarBarrierList,
     diagonal_movement: bool = True,
+    max_iterations: int | None = None,
+    time_budget: float | None = None,
+    cache: AStarPathCache | None = None,
 ) -> list[Point] | None:
     """
     Calculates the path using AStarSearch Algorithm and returns the path
 
+    By default the search only stops when the end is reached or every
+    reachable grid cell has been visited. Use ``max_iterations`` or
+    ``time_budget`` to bound the work done for a single path.
+
     Args:
         start_point:
             Where it starts
@@ -346,6 +776,12 @@ def astar_calculate_path(
             AStarBarrierList with the boundaries to use in the AStarSearch Algorithm
         diagonal_movement:
             Whether of not to use diagonals in the AStarSearch Algorithm
+        max_iterations:
+            Give up after expanding this many grid cells
+        time_budget:
+            Give up after this many seconds
+        cache:
+            Optional :py:class:`AStarPathCache` to look up and store paths in
 
     Returns:
         List of points (the path), or ``None`` if no path is found
@@ -355,23 +791,36 @@ def astar_calculate_path(
     mod_start = _collapse(start_point, grid_size)
     mod_end = _collapse(end_point, grid_size)
 
+    key = mod_start, mod_end, diagonal_movement
+    if cache is not None:
+        cache._validate(astar_barrier_list)
+        found, path = cache._get(key)
+        if found:
+            return None if path is None else list(path)
+
     left = astar_barrier_list.left
     right = astar_barrier_list.right
 
     bottom = astar_barrier_list.bottom
     top = astar_barrier_list.top
 
-    barrier_list = astar_barrier_list.barrier_list
-
-    graph = _AStarGraph(barrier_list, left, right, bottom, top, diagonal_movement)  # type: ignore
-    result = _AStarSearch(mod_start, mod_end, graph)
+    graph = _AStarGraph(
+        (), left, right, bottom, top, diagonal_movement, grid=astar_barrier_list.grid
+    )
+    result = _AStarSearch(mod_start, mod_end, graph, max_iterations, time_budget)
 
     if result is None:
+        # Searches stopped by a budget may find a path next time
+        if cache is not None and max_iterations is None and time_budget is None:
+            cache._put(key, None)
         return None
 
     # Currently 'result' is in grid locations. We need to convert them to pixel
     # locations.
     revised_result = [_expand(p, grid_size) for p in result]
+    if cache is not None:
+        cache._put(key, revised_result)
+        return cast(list[Point], list(revised_result))
     return cast(list[Point], revised_result)
 
 
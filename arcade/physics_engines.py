@@ -5,7 +5,7 @@
 from __future__ import annotations
 
 import math
-from typing import Iterable
+from typing import Iterable, Iterator
 
 from arcade import (
     BasicSprite,
@@ -14,10 +14,14 @@
     SpriteType,
     check_for_collision,
     check_for_collision_with_lists,
+    check_for_collision_with_lists_at,
 )
 from arcade.math import get_distance
+from arcade.sprite_list import is_sprite_outside_rect
+from arcade.types import Point2List
+from arcade.types.rect import LRBT, Rect
 
-__all__ = ["PhysicsEngineSimple", "PhysicsEnginePlatformer"]
+__all__ = ["PhysicsEngineSimple", "PhysicsEnginePlatformer", "PhysicsEngineGroup"]
 
 from arcade.utils import Chain, copy_dunders_unimplemented
 
@@ -72,17 +76,343 @@ def _wiggle_until_free(colliding: Sprite, walls: Iterable[SpriteList]) -> None:
         # Iterate and slice the try_list
         for strided_index in range(0, 16, 2):
             x, y = try_list[strided_index:strided_index + 2]
-            colliding.position = x, y
-            check_hit_list = check_for_collision_with_lists(colliding, walls)
+            # Probe without moving so only the free position is written
+            check_hit_list = check_for_collision_with_lists_at(
+                colliding, (x - o_x, y - o_y), walls
+            )
             # print(f"Vary {vary} ({trapped.center_x} {trapped.center_y}) "
             #       f"= {len(check_hit_list)}")
             if len(check_hit_list) == 0:
+                colliding.position = x, y
                 return
         wiggle_distance *= 2
 
 
+def _contact_distance(
+    moving_points: Point2List,
+    other_points: Point2List,
+    direction_x: float,
+    direction_y: float,
+    distance: float,
+) -> float | None:
+    """Find how far a polygon can move before it hits another one.
+
+    This is a swept version of the separating axis test used by
+    :py:func:`~arcade.geometry.are_polygons_intersecting`. Polygons that
+    only touch are not colliding.
+
+    Args:
+        moving_points:
+            Adjusted hit box points of the moving polygon.
+        other_points:
+            Adjusted hit box points of the polygon to check against.
+        direction_x:
+            X component of the unit direction of the movement.
+        direction_y:
+            Y component of the unit direction of the movement.
+        distance:
+            How far the polygon wants to move.
+    Returns:
+        The distance to the first contact, ``0.0`` if the polygons already
+        overlap or ``None`` if they don't collide during the movement.
+    """
+    enter = -math.inf
+    leave = math.inf
+    for polygon in (moving_points, other_points):
+        for i1 in range(len(polygon)):
+            i2 = (i1 + 1) % len(polygon)
+            normal_x = polygon[i2][1] - polygon[i1][1]
+            normal_y = polygon[i1][0] - polygon[i2][0]
+
+            min_a = min_b = math.inf
+            max_a = max_b = -math.inf
+            for x, y in moving_points:
+                projected = normal_x * x + normal_y * y
+                if projected < min_a:
+                    min_a = projected
+                if projected > max_a:
+                    max_a = projected
+            for x, y in other_points:
+                projected = normal_x * x + normal_y * y
+                if projected < min_b:
+                    min_b = projected
+                if projected > max_b:
+                    max_b = projected
+
+            # How fast the moving polygon's projection moves along this axis
+            speed = normal_x * direction_x + normal_y * direction_y
+            if speed == 0:
+                if max_a <= min_b or max_b <= min_a:
+                    return None
+                continue
+
+            start = (min_b - max_a) / speed
+            end = (max_b - min_a) / speed
+            if start > end:
+                start, end = end, start
+            if start > enter:
+                enter = start
+            if end < leave:
+                leave = end
+            if enter >= leave or enter >= distance or leave <= 0:
+                return None
+
+    return enter if enter > 0 else 0.0
+
+
+def _iter_sprites_near_rect(
+    sprite_lists: Iterable[SpriteList[SpriteType]], rect: Rect
+) -> Iterator[SpriteType]:
+    """Yield the sprites of each list close to a rectangle.
+
+    Lists with a spatial hash are queried for the rectangle. All the
+    sprites of the other lists are yielded.
+    """
+    for sprite_list in sprite_lists:
+        if sprite_list.spatial_hash is not None:
+            yield from sprite_list.spatial_hash.get_sprites_near_rect(rect)
+        else:
+            yield from sprite_list
+
+
+def _check_for_collision_with_candidates(
+    moving_sprite: Sprite,
+    can_collide: Iterable[SpriteList[SpriteType]],
+    candidates: list[SpriteType] | None,
+) -> list[SpriteType]:
+    """Check for collisions with ``candidates``, or ``can_collide`` if it's ``None``."""
+    if candidates is None:
+        return check_for_collision_with_lists(moving_sprite, can_collide)
+    return [
+        other
+        for other in candidates
+        if other is not moving_sprite and check_for_collision(moving_sprite, other)
+    ]
+
+
+def _sweep(
+    moving_sprite: Sprite,
+    can_collide: Iterable[SpriteList[SpriteType]],
+    direction_x: float,
+    direction_y: float,
+    distance: float,
+    offset_y: float = 0.0,
+    candidates: list[SpriteType] | None = None,
+) -> tuple[list[SpriteType], float]:
+    """Find what a sprite would hit moving in a straight line.
+
+    Each sprite list is queried once for the area the sprite sweeps over.
+    The sprite itself is not moved.
+
+    Args:
+        moving_sprite:
+            The sprite to move.
+        can_collide:
+            SpriteLists with sprites that can block the movement.
+        direction_x:
+            X component of the unit direction of the movement.
+        direction_y:
+            Y component of the unit direction of the movement.
+        distance:
+            How far the sprite wants to move.
+        offset_y:
+            Start the movement this far above the sprite's position.
+        candidates:
+            Only check these sprites instead of querying ``can_collide``.
+    Returns:
+        The sprites hit, ordered by distance, and how far the sprite
+        can move before the first contact.
+    """
+    points = moving_sprite.hit_box.get_adjusted_points()
+    if offset_y:
+        points = [(x, y + offset_y) for x, y in points]
+    left = min(x for x, _ in points)
+    right = max(x for x, _ in points)
+    bottom = min(y for _, y in points)
+    top = max(y for _, y in points)
+
+    move_x = direction_x * distance
+    move_y = direction_y * distance
+    if move_x < 0:
+        left += move_x
+    else:
+        right += move_x
+    if move_y < 0:
+        bottom += move_y
+    else:
+        top += move_y
+
+    others: Iterable[SpriteType]
+    if candidates is None:
+        others = _iter_sprites_near_rect(can_collide, LRBT(left, right, bottom, top))
+    else:
+        others = candidates
+
+    hits: list[tuple[float, SpriteType]] = []
+    for other in others:
+        if other is moving_sprite:
+            continue
+        if is_sprite_outside_rect(other, left, right, bottom, top):
+            continue
+        contact = _contact_distance(
+            points, other.hit_box.get_adjusted_points(), direction_x, direction_y, distance
+        )
+        if contact is not None:
+            hits.append((contact, other))
+
+    if not hits:
+        return [], distance
+    hits.sort(key=lambda hit: hit[0])
+    return [sprite for _, sprite in hits], hits[0][0]
+
+
+def _move_to_contact(
+    moving_sprite: Sprite,
+    hit_sprite: BasicSprite,
+    original: float,
+    direction: float,
+    allowed: float,
+    axis: int,
+) -> None:
+    """Move a sprite along an axis to a contact point found by :py:func:`_sweep`.
+
+    Rounding errors can leave the sprite overlapping the sprite it hit by a
+    tiny amount. If so it's backed off until it only touches it.
+    """
+    back_off = 1e-9
+    while True:
+        value = original + allowed * direction
+        if axis == 0:
+            moving_sprite.center_x = value
+        else:
+            moving_sprite.center_y = value
+        if allowed <= 0 or not check_for_collision(moving_sprite, hit_sprite):
+            return
+        allowed = max(0.0, allowed - back_off)
+        back_off *= 16
+
+
+def _ramp_up_x(
+    moving_sprite: Sprite,
+    can_collide: Iterable[SpriteList[SpriteType]],
+    original_x: float,
+    original_y: float,
+    complete_hit_list: list[SpriteType],
+) -> None:
+    """Move a sprite in the x direction, stepping up any ramps in the way.
+
+    This binary searches the x position with full collision checks, trying
+    to move the sprite up at each blocked position. It's only used when the
+    straight movement found by :py:func:`_sweep` is blocked.
+
+    Args:
+        moving_sprite:
+            The sprite to move.
+        can_collide:
+            An iterable source of SpriteList objects which can be
+            collided with.
+        original_x:
+            The x position before moving.
+        original_y:
+            The y position before moving in the y direction.
+        complete_hit_list:
+            List of collisions to add any new sprites hit to.
+    """
+    loop_count = 0
+    # Keep track of our current y, used in ramping up
+    almost_original_y = moving_sprite.center_y
+
+    # Positions are probed without moving the sprite until the end
+    start_x, start_y = moving_sprite.position
+    probe_x, probe_y = start_x, start_y
+
+    # Strip off sign so we only have to write one version of this for
+    # both directions
+    direction = math.copysign(1, moving_sprite.change_x)
+    cur_x_change = abs(moving_sprite.change_x)
+    upper_bound = cur_x_change
+    lower_bound: float = 0
+    cur_y_change: float = 0
+
+    exit_loop = False
+    while not exit_loop:
+
+        loop_count += 1
+        # print(f"{cur_x_change=}, {upper_bound=}, {lower_bound=}, {loop_count=}")
+
+        # Move sprite and check for collisions
+        probe_x = original_x + cur_x_change * direction
+        collision_check = check_for_collision_with_lists_at(
+            moving_sprite, (probe_x - start_x, probe_y - start_y), can_collide
+        )
+
+        # Update collision list
+        for sprite in collision_check:
+            if sprite not in complete_hit_list:
+                complete_hit_list.append(sprite)
+
+        # Did we collide?
+        if len(collision_check) > 0:
+            # We did collide. Can we ramp up and not collide?
+            cur_y_change = cur_x_change
+            probe_y = original_y + cur_y_change
+
+            collision_check = check_for_collision_with_lists_at(
+                moving_sprite, (probe_x - start_x, probe_y - start_y), can_collide
+            )
+            if len(collision_check) > 0:
+                cur_y_change -= cur_x_change
+            else:
+                while (len(collision_check) == 0) and cur_y_change > 0:
+                    # print("Ramp up check")
+                    cur_y_change -= 1
+                    probe_y = almost_original_y + cur_y_change
+                    collision_check = check_for_collision_with_lists_at(
+                        moving_sprite, (probe_x - start_x, probe_y - start_y), can_collide
+                    )
+                cur_y_change += 1
+                collision_check = []
+
+            if len(collision_check) > 0:
+                # print(f"Yes @ {cur_x_change}")
+                upper_bound = cur_x_change - 1
+                if upper_bound - lower_bound <= 0:
+                    cur_x_change = lower_bound
+                    exit_loop = True
+                    # print(f"Exit 2 @ {cur_x_change}")
+                else:
+                    cur_x_change = (upper_bound + lower_bound) // 2
+            else:
+                exit_loop = True
+                # print(f"Exit 1 @ {cur_x_change}")
+
+        else:
+            # No collision. Keep this new position and exit
+            lower_bound = cur_x_change
+            if upper_bound - lower_bound <= 0:
+                # print(f"Exit 3 @ {cur_x_change}")
+                exit_loop = True
+            else:
+                # print(f"No @ {cur_x_change}")
+                cur_x_change = (upper_bound + lower_bound) // 2 + (
+                    upper_bound + lower_bound
+                ) % 2
+
+    # print(cur_x_change * direction, cur_y_change)
+    moved_x = original_x + cur_x_change * direction
+    moved_y = almost_original_y + cur_y_change
+    moving_sprite.position = moved_x, moved_y
+    # print(
+    #     f"({moving_sprite.center_x}, {moving_sprite.center_y}) "
+    #     f"{cur_x_change * direction}, {cur_y_change}"
+    # )
+
+
 def _move_sprite(
-    moving_sprite: Sprite, can_collide: Iterable[SpriteList[SpriteType]], ramp_up: bool
+    moving_sprite: Sprite,
+    can_collide: Iterable[SpriteList[SpriteType]],
+    ramp_up: bool,
+    candidates: list[SpriteType] | None = None,
 ) -> list[SpriteType]:
     """Update a sprite's angle and position, returning a list of collisions.
 
@@ -101,13 +431,20 @@ def _move_sprite(
         ramp_up:
             Whether to enable platformer-like ramp support for x
             direction movement.
+        candidates:
+            Sprites from ``can_collide`` found by a broad phase covering
+            everything the sprite can reach with its velocity. Only these
+            are checked until the sprite is moved further by a wiggle or a
+            moving platform. ``can_collide`` is used after that and for
+            the ramp search.
     Returns:
         A list of other individual sprites the ``moving_sprite``
         collided with.
     """
     # See if we are starting this turn with a sprite already colliding with us.
-    if len(check_for_collision_with_lists(moving_sprite, can_collide)) > 0:
+    if _check_for_collision_with_candidates(moving_sprite, can_collide, candidates):
         _wiggle_until_free(moving_sprite, can_collide)
+        candidates = None
 
     original_x, original_y = moving_sprite.position
     original_angle = moving_sprite.angle
@@ -120,7 +457,9 @@ def _move_sprite(
         moving_sprite.angle += moving_sprite.change_angle
 
         # Resolve collisions caused by rotating
-        rotating_hit_list = check_for_collision_with_lists(moving_sprite, can_collide)
+        rotating_hit_list = _check_for_collision_with_candidates(
+            moving_sprite, can_collide, candidates
+        )
 
         if len(rotating_hit_list) > 0:
 
@@ -128,6 +467,7 @@ def _move_sprite(
 
             # Resolve any collisions by this weird kludge
             _wiggle_until_free(moving_sprite, can_collide)
+            candidates = None
             if (
                 get_distance(original_x, original_y, moving_sprite.center_x, moving_sprite.center_y)
                 > max_distance
@@ -137,135 +477,81 @@ def _move_sprite(
                 moving_sprite.angle = original_angle
 
     # --- Move in the y direction
-    moving_sprite.center_y += moving_sprite.change_y
-
-    # Check for wall hit
-    hit_list_x = check_for_collision_with_lists(moving_sprite, can_collide)
+    # Sweep the sprite along y to find the first contact in a single query
+    change_y = moving_sprite.change_y
+    start_y = moving_sprite.center_y
+    if change_y:
+        hit_list_x, allowed = _sweep(
+            moving_sprite,
+            can_collide,
+            0.0,
+            math.copysign(1, change_y),
+            abs(change_y),
+            candidates=candidates,
+        )
+    else:
+        hit_list_x = _check_for_collision_with_candidates(moving_sprite, can_collide, candidates)
+        allowed = 0.0
     # print(f"Post-y move {hit_list_x}")
     complete_hit_list = hit_list_x
 
     # If we hit a wall, move so the edges are at the same point
     if len(hit_list_x) > 0:
-        if moving_sprite.change_y > 0:
-            while len(check_for_collision_with_lists(moving_sprite, can_collide)) > 0:
-                moving_sprite.center_y -= 1
-            # print(f"Spot X ({self.player_sprite.center_x}, {self.player_sprite.center_y})"
-            #       f" {self.player_sprite.change_y}")
-        elif moving_sprite.change_y < 0:
-            # Reset number of jumps
+        _move_to_contact(
+            moving_sprite, hit_list_x[0], start_y, math.copysign(1, change_y), allowed, 1
+        )
+        if change_y < 0:
             for item in hit_list_x:
-                while check_for_collision(moving_sprite, item):
-                    # self.player_sprite.bottom = item.top <- Doesn't work for ramps
-                    moving_sprite.center_y += 0.25
-
                 # NOTE: Not all sprites have velocity
                 if getattr(item, "change_x", 0.0) != 0:
                     moving_sprite.center_x += item.change_x  # type: ignore
+                    candidates = None
 
             # print(f"Spot Y ({self.player_sprite.center_x}, {self.player_sprite.center_y})")
-        else:
-            pass
-            # TODO: The code below can't execute, as "item" doesn't
-            # exist. In theory, this condition should never be arrived at.
-            # Collision while player wasn't moving, most likely
-            # moving platform.
-            # if self.player_sprite.center_y >= item.center_y:
-            #     self.player_sprite.bottom = item.top
-            # else:
-            #     self.player_sprite.top = item.bottom
         moving_sprite.change_y = min(0.0, getattr(hit_list_x[0], "change_y", 0.0))
 
-    # print(f"Spot D ({self.player_sprite.center_x}, {self.player_sprite.center_y})")
-    moving_sprite.center_y = round(moving_sprite.center_y, 2)
-    # print(f"Spot Q ({self.player_sprite.center_x}, {self.player_sprite.center_y})")
+        # Round away from what we hit so we don't end up inside it
+        if change_y < 0:
+            moving_sprite.center_y = math.ceil(moving_sprite.center_y * 100) / 100
+        elif change_y > 0:
+            moving_sprite.center_y = math.floor(moving_sprite.center_y * 100) / 100
+    else:
+        moving_sprite.center_y += change_y
+        moving_sprite.center_y = round(moving_sprite.center_y, 2)
 
     # end_time = time.time()
     # print(f"Move 1 - {end_time - start_time:7.4f}")
     # start_time = time.time()
 
-    loop_count = 0
     # --- Move in the x direction
-    if moving_sprite.change_x:
-        # Keep track of our current y, used in ramping up
-        almost_original_y = moving_sprite.center_y
-
-        # Strip off sign so we only have to write one version of this for
-        # both directions
-        direction = math.copysign(1, moving_sprite.change_x)
-        cur_x_change = abs(moving_sprite.change_x)
-        upper_bound = cur_x_change
-        lower_bound: float = 0
-        cur_y_change: float = 0
-
-        exit_loop = False
-        while not exit_loop:
-
-            loop_count += 1
-            # print(f"{cur_x_change=}, {upper_bound=}, {lower_bound=}, {loop_count=}")
-
-            # Move sprite and check for collisions
-            moving_sprite.center_x = original_x + cur_x_change * direction
-            collision_check = check_for_collision_with_lists(moving_sprite, can_collide)
-
-            # Update collision list
-            for sprite in collision_check:
-                if sprite not in complete_hit_list:
-                    complete_hit_list.append(sprite)
-
-            # Did we collide?
-            if len(collision_check) > 0:
-                # We did collide. Can we ramp up and not collide?
-                if ramp_up:
-                    cur_y_change = cur_x_change
-                    moving_sprite.center_y = original_y + cur_y_change
-
-                    collision_check = check_for_collision_with_lists(moving_sprite, can_collide)
-                    if len(collision_check) > 0:
-                        cur_y_change -= cur_x_change
-                    else:
-                        while (len(collision_check) == 0) and cur_y_change > 0:
-                            # print("Ramp up check")
-                            cur_y_change -= 1
-                            moving_sprite.center_y = almost_original_y + cur_y_change
-                            collision_check = check_for_collision_with_lists(
-                                moving_sprite, can_collide
-                            )
-                        cur_y_change += 1
-                        collision_check = []
-
-                if len(collision_check) > 0:
-                    # print(f"Yes @ {cur_x_change}")
-                    upper_bound = cur_x_change - 1
-                    if upper_bound - lower_bound <= 0:
-                        cur_x_change = lower_bound
-                        exit_loop = True
-                        # print(f"Exit 2 @ {cur_x_change}")
-                    else:
-                        cur_x_change = (upper_bound + lower_bound) // 2
-                else:
-                    exit_loop = True
-                    # print(f"Exit 1 @ {cur_x_change}")
-
-            else:
-                # No collision. Keep this new position and exit
-                lower_bound = cur_x_change
-                if upper_bound - lower_bound <= 0:
-                    # print(f"Exit 3 @ {cur_x_change}")
-                    exit_loop = True
-                else:
-                    # print(f"No @ {cur_x_change}")
-                    cur_x_change = (upper_bound + lower_bound) // 2 + (
-                        upper_bound + lower_bound
-                    ) % 2
-
-        # print(cur_x_change * direction, cur_y_change)
-        moved_x = original_x + cur_x_change * direction
-        moved_y = almost_original_y + cur_y_change
-        moving_sprite.position = moved_x, moved_y
-        # print(
-        #     f"({moving_sprite.center_x}, {moving_sprite.center_y}) "
-        #     f"{cur_x_change * direction}, {cur_y_change}"
-        # )
+    change_x = moving_sprite.change_x
+    if change_x:
+        if moving_sprite.center_x != original_x:
+            moving_sprite.center_x = original_x
+        direction = math.copysign(1, change_x)
+        x_hit_list, allowed = _sweep(
+            moving_sprite, can_collide, direction, 0.0, abs(change_x), candidates=candidates
+        )
+        for sprite in x_hit_list:
+            if sprite not in complete_hit_list:
+                complete_hit_list.append(sprite)
+
+        if not x_hit_list:
+            moving_sprite.center_x = original_x + change_x
+        elif ramp_up and _sweep(
+            moving_sprite,
+            can_collide,
+            direction,
+            0.0,
+            abs(change_x),
+            offset_y=abs(change_x),
+            candidates=candidates,
+        )[1] > allowed:
+            # Stepping up gets us further, so this may be a ramp. Search for
+            # a position with collision checks to walk up it.
+            _ramp_up_x(moving_sprite, can_collide, original_x, original_y, complete_hit_list)
+        else:
+            _move_to_contact(moving_sprite, x_hit_list[0], original_x, direction, allowed, 0)
 
     # Add in rotating hit list
     for sprite in rotating_hit_list:
@@ -278,6 +564,49 @@ def _move_sprite(
     return complete_hit_list
 
 
+def _move_platforms(platforms: Iterable[SpriteList]) -> None:
+    """Move platforms by their velocity, bouncing them inside their boundaries.
+
+    See :py:attr:`PhysicsEnginePlatformer.platforms` for the attributes used.
+
+    Args:
+        platforms:
+            The SpriteLists of platforms to move.
+    """
+    for platform_list in platforms:
+        for platform in platform_list:
+            if platform.change_x != 0 or platform.change_y != 0:
+
+                # Check x boundaries and move the platform in x direction
+                if platform.boundary_left and platform.left <= platform.boundary_left:
+                    platform.left = platform.boundary_left
+                    if platform.change_x < 0:
+                        platform.change_x *= -1
+
+                if platform.boundary_right and platform.right >= platform.boundary_right:
+                    platform.right = platform.boundary_right
+                    if platform.change_x > 0:
+                        platform.change_x *= -1
+
+                platform.center_x += platform.change_x
+
+                # Check y boundaries and move the platform in y direction
+                if platform.boundary_top is not None and platform.top >= platform.boundary_top:
+                    platform.top = platform.boundary_top
+                    if platform.change_y > 0:
+                        platform.change_y *= -1
+
+                if (
+                    platform.boundary_bottom is not None
+                    and platform.bottom <= platform.boundary_bottom
+                ):
+                    platform.bottom = platform.boundary_bottom
+                    if platform.change_y < 0:
+                        platform.change_y *= -1
+
+                platform.center_y += platform.change_y
+
+
 def _add_to_list(dest: list[SpriteList], source: SpriteList | Iterable[SpriteList] | None) -> None:
     """Helper function to add a SpriteList or list of SpriteLists to a list."""
     if not source:
@@ -675,10 +1004,10 @@ def can_jump(self, y_distance: float = 5) -> bool:
 
         """
 
-        # Temporarily move the player down to collide floor-like sprites
-        self.player_sprite.center_y -= y_distance
-        hit_list = check_for_collision_with_lists(self.player_sprite, self._all_obstacles)
-        self.player_sprite.center_y += y_distance
+        # Check for floor-like sprites below the player without moving it
+        hit_list = check_for_collision_with_lists_at(
+            self.player_sprite, (0, -y_distance), self._all_obstacles
+        )
 
         # Reset the number jumps if the player touched a floor-like sprite
         if len(hit_list) > 0:
@@ -779,38 +1108,7 @@ def update(self) -> list[BasicSprite]:
 
         # print(f"Spot B ({self.player_sprite.center_x}, {self.player_sprite.center_y})")
 
-        for platform_list in self.platforms:
-            for platform in platform_list:
-                if platform.change_x != 0 or platform.change_y != 0:
-
-                    # Check x boundaries and move the platform in x direction
-                    if platform.boundary_left and platform.left <= platform.boundary_left:
-                        platform.left = platform.boundary_left
-                        if platform.change_x < 0:
-                            platform.change_x *= -1
-
-                    if platform.boundary_right and platform.right >= platform.boundary_right:
-                        platform.right = platform.boundary_right
-                        if platform.change_x > 0:
-                            platform.change_x *= -1
-
-                    platform.center_x += platform.change_x
-
-                    # Check y boundaries and move the platform in y direction
-                    if platform.boundary_top is not None and platform.top >= platform.boundary_top:
-                        platform.top = platform.boundary_top
-                        if platform.change_y > 0:
-                            platform.change_y *= -1
-
-                    if (
-                        platform.boundary_bottom is not None
-                        and platform.bottom <= platform.boundary_bottom
-                    ):
-                        platform.bottom = platform.boundary_bottom
-                        if platform.change_y < 0:
-                            platform.change_y *= -1
-
-                    platform.center_y += platform.change_y
+        _move_platforms(self.platforms)
 
         complete_hit_list = _move_sprite(self.player_sprite, self._all_obstacles, ramp_up=True)
 
@@ -820,3 +1118,158 @@ def update(self) -> list[BasicSprite]:
         # print(f"Update - {end_time - start_time:7.4f}\n")
 
         return complete_hit_list
+
+
+@copy_dunders_unimplemented
+class PhysicsEngineGroup:
+    """Move many sprites against the same walls and platforms in one engine.
+
+    This works like one :py:class:`PhysicsEngineSimple` (or
+    :py:class:`PhysicsEnginePlatformer` with gravity) per sprite in
+    ``sprites``, but shares the work between them:
+
+    * :py:attr:`platforms` are moved once per :py:meth:`update` instead of
+      once per engine
+    * Each sprite makes a single query against the walls and platforms
+      for the whole area it could reach this update. Sprites with nothing
+      nearby are moved directly, and the others are only checked against
+      the obstacles this query found. Sprites pushed further than that by
+      a wiggle or a moving platform go back to checking every list.
+
+    The sprites don't collide with each other.
+
+    Args:
+        sprites:
+            The :py:class:`.SpriteList` of sprites to move. It will be
+            stored on the engine as :py:attr:`sprites`.
+        walls:
+            A :py:class:`.SpriteList` or :py:class:`list` of them which
+            should stop movement. See :py:attr:`PhysicsEnginePlatformer.walls`.
+        platforms:
+            Sprites which stop movement and can move. See
+            :py:attr:`PhysicsEnginePlatformer.platforms`.
+        gravity_constant:
+            A constant to subtract from each sprite's
+            :py:attr:`~.Sprite.change_y` each :py:meth:`update`.
+            The default of ``0`` is for top-down games.
+        ramp_up:
+            Whether the sprites can walk up ramps like the player of
+            :py:class:`PhysicsEnginePlatformer`.
+    """
+
+    def __init__(
+        self,
+        sprites: SpriteList[Sprite],
+        walls: SpriteList | Iterable[SpriteList] | None = None,
+        platforms: SpriteList | Iterable[SpriteList] | None = None,
+        gravity_constant: float = 0.0,
+        ramp_up: bool = False,
+    ) -> None:
+        self.sprites: SpriteList[Sprite] = sprites
+        """The sprites moved by the engine."""
+        self.gravity_constant: float = gravity_constant
+        """Subtracted from each sprite's :py:attr:`~.Sprite.change_y` every update."""
+        self.ramp_up: bool = ramp_up
+        """Whether the sprites can walk up ramps."""
+
+        self._platforms: list[SpriteList] = []
+        self._walls: list[SpriteList] = []
+        self._all_obstacles = Chain(self._walls, self._platforms)
+
+        _add_to_list(self._platforms, platforms)
+        _add_to_list(self._walls, walls)
+
+    @property
+    def platforms(self) -> list[SpriteList]:
+        """Sprites the moving sprites collide with, but which can still move.
+
+        See :py:attr:`PhysicsEnginePlatformer.platforms` for how to make
+        them move automatically.
+        """
+        return self._platforms
+
+    @platforms.setter
+    def platforms(self, platforms: SpriteList | Iterable[SpriteList] | None = None) -> None:
+        if platforms:
+            _add_to_list(self._platforms, platforms)
+        else:
+            self._platforms.clear()
+
+    @platforms.deleter
+    def platforms(self) -> None:
+        self._platforms.clear()
+
+    @property
+    def walls(self) -> list[SpriteList]:
+        """Non-moving sprites the moving sprites collide with.
+
+        See :py:attr:`PhysicsEnginePlatformer.walls` for performance tips.
+        """
+        return self._walls
+
+    @walls.setter
+    def walls(self, walls: SpriteList | Iterable[SpriteList] | None = None) -> None:
+        if walls:
+            _add_to_list(self._walls, walls)
+        else:
+            self._walls.clear()
+
+    @walls.deleter
+    def walls(self) -> None:
+        self._walls.clear()
+
+    def _get_nearby_obstacles(self, sprite: Sprite) -> list[BasicSprite]:
+        """Get the obstacles close to the area the sprite can reach this update."""
+        x, y = sprite._position
+        # Covers the hit box at any angle
+        radius = (sprite._width if sprite._width > sprite._height else sprite._height) * 0.71
+        change_x = sprite.change_x
+        change_y = sprite.change_y
+        left = x - radius + (change_x if change_x < 0 else 0)
+        right = x + radius + (change_x if change_x > 0 else 0)
+        bottom = y - radius + (change_y if change_y < 0 else 0)
+        top = y + radius + (change_y if change_y > 0 else 0)
+        if self.ramp_up:
+            # Walking up a ramp can lift the sprite as far as it moves along x
+            top += abs(change_x)
+        rect = LRBT(left, right, bottom, top)
+
+        return [
+            other
+            for other in _iter_sprites_near_rect(self._all_obstacles, rect)
+            if not is_sprite_outside_rect(other, left, right, bottom, top)
+        ]
+
+    def update(self) -> dict[Sprite, list[BasicSprite]]:
+        """Move the platforms once, then move every sprite.
+
+        Returns:
+            A :py:class:`dict` from each sprite that collided with anything
+            to the list of sprites it collided with. Sprites without
+            collisions are left out.
+        """
+        _move_platforms(self._platforms)
+
+        hits: dict[Sprite, list[BasicSprite]] = {}
+        gravity_constant = self.gravity_constant
+        for sprite in self.sprites:
+            if gravity_constant:
+                sprite.change_y -= gravity_constant
+
+            nearby = self._get_nearby_obstacles(sprite)
+            if not nearby:
+                # Nothing to collide with. Move in one position update.
+                if sprite.change_angle:
+                    sprite.angle += sprite.change_angle
+                x, y = sprite._position
+                sprite.position = x + sprite.change_x, round(y + sprite.change_y, 2)
+                continue
+
+            # The narrow phase only checks the obstacles found above
+            hit_list = _move_sprite(
+                sprite, self._all_obstacles, ramp_up=self.ramp_up, candidates=nearby
+            )
+            if hit_list:
+                hits[sprite] = hit_list
+
+        return hits
@@ -12,6 +12,7 @@
 from pyglet.math import Vec2
 
 from arcade import Sprite
+from arcade.sprite.mixins import PymunkMixin
 
 __all__ = ["PymunkPhysicsObject", "PymunkException", "PymunkPhysicsEngine"]
 
@@ -601,36 +602,50 @@ def resync_sprites(self) -> None:
         """
         Set visual sprites to be the same location as physics engine sprites.
         Call this after stepping the pymunk physics engine
+
+        Positions and angles are set together with
+        :py:meth:`~arcade.Sprite.set_position_and_angle`, updating each sprite
+        list once. Sleeping bodies are skipped and
+        :py:meth:`~arcade.sprite.mixins.PymunkMixin.pymunk_moved` is only
+        called for sprite classes overriding it.
         """
         # Create copy in case a sprite wants to remove itself from the list as
         # we iterate through the list.
         sprites = self.non_static_sprite_list.copy()
+        physics_objects = self.sprites
+        degrees = math.degrees
+        # Sprite class -> whether it overrides pymunk_moved
+        overrides: dict[type, bool] = {}
 
         for sprite in sprites:
             # Get physics object for this sprite
-            physics_object = self.sprites[sprite]
-
-            original_position = sprite.position
+            body = physics_objects[sprite].body
 
-            if physics_object.body:
-                # Item is sleeping, skip
-                if physics_object.body.is_sleeping:
-                    continue
+            # Item is sleeping, skip
+            if body is None or body.is_sleeping:
+                continue
 
-                new_position = physics_object.body.position
-                new_angle = -math.degrees(physics_object.body.angle)
+            new_x, new_y = body.position
+            new_angle = -degrees(body.angle)
+            original_x, original_y = sprite._position
+            original_angle = sprite._angle
 
-                # Calculate change in location, used in call-back
-                dx = new_position[0] - original_position[0]
-                dy = new_position[1] - original_position[1]
-                d_angle = new_angle - sprite.angle
+            # Update sprite to new location
+            sprite.set_position_and_angle((new_x, new_y), new_angle)
 
-                # Update sprite to new location
-                sprite.position = new_position
-                sprite.angle = new_angle
+            sprite_type = type(sprite)
+            overridden = overrides.get(sprite_type)
+            if overridden is None:
+                overridden = getattr(sprite_type, "pymunk_moved", None) is not (
+                    PymunkMixin.pymunk_moved
+                )
+                overrides[sprite_type] = overridden
 
+            if overridden:
                 # Notify sprite we moved, in case animation needs to be updated
-                sprite.pymunk_moved(self, dx, dy, d_angle)
+                sprite.pymunk_moved(
+                    self, new_x - original_x, new_y - original_y, new_angle - original_angle
+                )
 
     def step(self, delta_time: float = 1 / 60.0, resync_sprites: bool = True) -> None:
         """
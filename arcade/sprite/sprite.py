@@ -341,6 +341,32 @@ def stop(self) -> None:
         self.velocity = 0, 0
         self.change_angle = 0.0
 
+    def set_position_and_angle(self, position: Point2, angle: float) -> None:
+        """
+        Set the position and angle of the sprite at the same time.
+
+        This is the same as setting :py:attr:`position` and :py:attr:`angle`,
+        but the sprite lists and spatial hashes are only updated once.
+        Physics engines moving many sprites use this. Subclasses reacting to
+        movement should override it along with the property setters.
+
+        Args:
+            position: The new center x and y position
+            angle: The new angle in degrees
+        """
+        if position == self._position and angle == self._angle:
+            return
+
+        self._position = position
+        self._angle = angle
+        self._hit_box.position = position
+        self._hit_box.angle = angle
+
+        for sprite_list in self.sprite_lists:
+            sprite_list._update_position_and_angle(self)
+
+        self.update_spatial_hash()
+
     # ----Update Methods ----
 
     def update(self, delta_time: float = 1 / 60, *args, **kwargs) -> None:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from .sprite_list import SpriteList
+from .chunked import ChunkedSpriteList
 from .spatial_hash import SpatialHash
 from .collision import (
     get_distance_between_sprites,
@@ -8,6 +9,9 @@
     check_for_collision,
     check_for_collision_with_list,
     check_for_collision_with_lists,
+    check_for_collision_with_lists_at,
+    check_for_collisions_between_lists,
+    is_sprite_outside_rect,
     get_sprites_at_point,
     get_sprites_at_exact_point,
     get_sprites_in_rect,
@@ -16,12 +20,16 @@
 
 __all__ = [
     "SpriteList",
+    "ChunkedSpriteList",
     "SpatialHash",
     "get_distance_between_sprites",
     "get_closest_sprite",
     "check_for_collision",
     "check_for_collision_with_list",
     "check_for_collision_with_lists",
+    "check_for_collision_with_lists_at",
+    "check_for_collisions_between_lists",
+    "is_sprite_outside_rect",
     "get_sprites_at_point",
     "get_sprites_at_exact_point",
     "get_sprites_in_rect",
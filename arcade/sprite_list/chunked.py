@@ -0,0 +1,300 @@
+"""
+A sprite list split into chunks for large tile map layers.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING, Iterable
+
+from arcade import SpriteType, get_window
+from arcade.gl.types import BlendFunction, OpenGlFilter, PyGLenum
+
+from .sprite_list import SpriteList, _get_view_bounds
+
+if TYPE_CHECKING:
+    from arcade.texture_atlas import TextureAtlasBase
+
+__all__ = ["ChunkedSpriteList"]
+
+
+class ChunkedSpriteList(SpriteList[SpriteType]):
+    """
+    A sprite list split into square regions of the world, each drawn
+    from its own sprite list.
+
+    Drawing only renders the chunks overlapping the view of the current
+    camera. Changing a sprite only updates the buffers of its chunk, so
+    editing one tile in a large map doesn't upload the whole layer.
+
+    In every other way this works like a regular :py:class:`SpriteList`
+    and can be used for collisions, physics engines and in a
+    :py:class:`~arcade.Scene`. Sprites are placed in the chunk containing
+    their center. Moved sprites change chunk before the next draw, but
+    lists of sprites that move a lot are better served by a
+    :py:class:`SpriteList`. The draw order is only kept within each chunk.
+
+    Each sprite is kept in both this list and the list of its chunk, so
+    the python side sprite data (about 36 bytes per sprite) is stored
+    twice. Only the chunks create OpenGL buffers.
+
+    Args:
+        chunk_size:
+            The width and height of each chunk in pixels.
+        use_spatial_hash:
+            If set to True, this will make creating a sprite, and moving a sprite
+            in the SpriteList slower, but it will speed up collision detection
+            with items in the SpriteList.
+        spatial_hash_cell_size:
+            The cell size of the spatial hash (default: 128)
+        atlas:
+            (Advanced) The texture atlas for the chunks. If no
+            atlas is supplied the global/default one will be used.
+        capacity:
+            (Advanced) The initial capacity of the internal buffer.
+        lazy:
+            (Advanced) ``True`` delays creating OpenGL resources
+            for each chunk until it's drawn.
+        visible:
+            Setting this to False will cause the list to not be drawn.
+    """
+
+    def __init__(
+        self,
+        chunk_size: float = 1024,
+        use_spatial_hash: bool = False,
+        spatial_hash_cell_size: int = 128,
+        atlas: TextureAtlasBase | None = None,
+        capacity: int = 100,
+        lazy: bool = False,
+        visible: bool = True,
+    ) -> None:
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+
+        # This list only keeps the sprite data on the python side. It's
+        # never drawn, so it's always lazy and doesn't create any buffers.
+        super().__init__(
+            use_spatial_hash=use_spatial_hash,
+            spatial_hash_cell_size=spatial_hash_cell_size,
+            atlas=atlas,
+            capacity=capacity,
+            lazy=True,
+            visible=visible,
+        )
+        self._chunk_size = chunk_size
+        self._chunk_lazy = lazy
+        # Chunk key -> sprite list for the chunk
+        self._chunks: dict[tuple[int, int], SpriteList[SpriteType]] = {}
+        # Chunk key -> how far sprites reach outside the chunk
+        self._chunk_padding: dict[tuple[int, int], float] = {}
+        # Sprite -> key of the chunk containing it
+        self._sprite_chunk: dict[SpriteType, tuple[int, int]] = {}
+        # Sprites moved or resized since their chunk was last checked
+        self._moved: set[SpriteType] = set()
+
+    @property
+    def chunk_size(self) -> float:
+        """The width and height of each chunk in pixels (read only)."""
+        return self._chunk_size
+
+    @property
+    def chunks(self) -> dict[tuple[int, int], SpriteList[SpriteType]]:
+        """
+        The sprite lists of the chunks by chunk coordinate (read only).
+
+        The chunk at ``(i, j)`` covers x from ``i * chunk_size`` to
+        ``(i + 1) * chunk_size`` and y from ``j * chunk_size`` to
+        ``(j + 1) * chunk_size``.
+        """
+        self._update_chunks()
+        return self._chunks
+
+    def _get_chunk_key(self, sprite: SpriteType) -> tuple[int, int]:
+        x, y = sprite._position
+        return math.floor(x / self._chunk_size), math.floor(y / self._chunk_size)
+
+    def _get_chunk(self, key: tuple[int, int]) -> SpriteList[SpriteType]:
+        chunk = self._chunks.get(key)
+        if chunk is None:
+            chunk = SpriteList(atlas=self._atlas, lazy=self._chunk_lazy)
+            self._chunks[key] = chunk
+            self._chunk_padding[key] = 0.0
+        return chunk
+
+    def _grow_padding(self, key: tuple[int, int], sprite: SpriteType) -> None:
+        # Half of the width plus the height covers the half diagonal
+        padding = (abs(sprite._width) + abs(sprite._height)) / 2
+        if padding > self._chunk_padding[key]:
+            self._chunk_padding[key] = padding
+
+    def _add_to_chunks(self, sprites: Iterable[SpriteType]) -> None:
+        """Add sprites already in this list to their chunks."""
+        groups: dict[tuple[int, int], list[SpriteType]] = {}
+        for sprite in sprites:
+            key = self._get_chunk_key(sprite)
+            self._sprite_chunk[sprite] = key
+            groups.setdefault(key, []).append(sprite)
+
+        for key, group in groups.items():
+            self._get_chunk(key).extend(group)
+            for sprite in group:
+                self._grow_padding(key, sprite)
+
+    def _remove_from_chunk(self, sprite: SpriteType) -> None:
+        key = self._sprite_chunk.pop(sprite, None)
+        if key is None:
+            return
+        chunk = self._chunks[key]
+        if sprite in chunk:
+            chunk.remove(sprite)
+        if len(chunk) == 0:
+            del self._chunks[key]
+            del self._chunk_padding[key]
+
+    def _update_chunks(self) -> None:
+        """
+        Move the sprites changed since the last call to the chunks containing
+        their centers and grow the chunk paddings.
+
+        This isn't done right away since moving a sprite between chunks
+        changes its sprite lists while they are being iterated.
+        """
+        if not self._moved:
+            return
+
+        moved_sprites: list[SpriteType] = []
+        for sprite in self._moved:
+            key = self._sprite_chunk.get(sprite)
+            if key is None:
+                continue
+            if self._get_chunk_key(sprite) != key:
+                self._remove_from_chunk(sprite)
+                moved_sprites.append(sprite)
+            else:
+                self._grow_padding(key, sprite)
+        self._moved.clear()
+        self._add_to_chunks(moved_sprites)
+
+    # --- Keep the chunks in sync with the list ---
+
+    def append(self, sprite: SpriteType) -> None:
+        super().append(sprite)
+        self._add_to_chunks((sprite,))
+
+    def extend(self, sprites: Iterable[SpriteType] | SpriteList[SpriteType]) -> None:
+        if isinstance(sprites, SpriteList):
+            new_sprites = list(sprites.sprite_list)
+        else:
+            new_sprites = list(sprites)
+        super().extend(new_sprites)
+        self._add_to_chunks(new_sprites)
+
+    def insert(self, index: int, sprite: SpriteType) -> None:
+        super().insert(index, sprite)
+        self._add_to_chunks((sprite,))
+
+    def __setitem__(self, index: int, sprite: SpriteType) -> None:
+        old_sprite = self.sprite_list[index]
+        super().__setitem__(index, sprite)
+        if old_sprite is not sprite:
+            self._remove_from_chunk(old_sprite)
+            self._add_to_chunks((sprite,))
+
+    def remove(self, sprite: SpriteType) -> None:
+        super().remove(sprite)
+        self._moved.discard(sprite)
+        self._remove_from_chunk(sprite)
+
+    def clear(self, deep: bool = True) -> None:
+        for chunk in self._chunks.values():
+            chunk.clear(deep=deep)
+        self._chunks.clear()
+        self._chunk_padding.clear()
+        self._sprite_chunk.clear()
+        self._moved.clear()
+        super().clear(deep=deep)
+
+    def _update_position(self, sprite: SpriteType) -> None:
+        super()._update_position(sprite)
+        self._moved.add(sprite)
+
+    def _update_position_and_angle(self, sprite: SpriteType) -> None:
+        super()._update_position_and_angle(sprite)
+        self._moved.add(sprite)
+
+    def _update_size(self, sprite: SpriteType) -> None:
+        super()._update_size(sprite)
+        self._moved.add(sprite)
+
+    def _update_width(self, sprite: SpriteType) -> None:
+        super()._update_width(sprite)
+        self._moved.add(sprite)
+
+    def _update_height(self, sprite: SpriteType) -> None:
+        super()._update_height(sprite)
+        self._moved.add(sprite)
+
+    # --- Drawing ---
+
+    def initialize(self) -> None:
+        """Request immediate creation of OpenGL resources for all chunks."""
+        for chunk in self._chunks.values():
+            chunk.initialize()
+
+    def draw(
+        self,
+        *,
+        filter: PyGLenum | OpenGlFilter | None = None,
+        pixelated: bool | None = None,
+        blend_function: BlendFunction | None = None,
+    ) -> None:
+        """
+        Draw the chunks overlapping the view of the current camera.
+
+        The view is :py:meth:`Camera2D.aabb() <arcade.Camera2D.aabb>` for a
+        :py:class:`~arcade.Camera2D` or the unprojected viewport for other
+        projectors. :py:attr:`sprites_drawn` and :py:attr:`sprites_culled`
+        report the result.
+
+        Args:
+            filter:
+                Optional parameter to set OpenGL filter, such as
+                `gl.GL_NEAREST` to avoid smoothing.
+            pixelated:
+                ``True`` for pixelated and ``False`` for smooth interpolation.
+                Shortcut for setting filter to GL_NEAREST for a pixelated look.
+                The filter parameter have precedence over this.
+            blend_function:
+                Optional parameter to set the OpenGL blend function used for drawing
+                the sprite list, such as 'arcade.Window.ctx.BLEND_ADDITIVE' or
+                'arcade.Window.ctx.BLEND_DEFAULT'
+        """
+        if len(self) == 0 or not self._visible or self.alpha_normalized == 0.0:
+            return
+
+        # Apply pending removals and moves so the chunks match the list
+        self._normalize_index_buffer()
+        self._update_chunks()
+        view_left, view_bottom, view_right, view_top = _get_view_bounds(get_window().ctx)
+        size = self._chunk_size
+        drawn = 0
+        for (i, j), chunk in self._chunks.items():
+            padding = self._chunk_padding[(i, j)]
+            if (
+                (i + 1) * size + padding < view_left
+                or i * size - padding > view_right
+                or (j + 1) * size + padding < view_bottom
+                or j * size - padding > view_top
+            ):
+                continue
+            chunk._color = self._color
+            chunk._blend = self._blend
+            chunk.draw(filter=filter, pixelated=pixelated, blend_function=blend_function)
+            drawn += len(chunk)
+
+        self.sprites_drawn = drawn
+        self.sprites_culled = len(self) - drawn
+
+    def __repr__(self) -> str:
+        return f"<ChunkedSpriteList sprites={len(self)} chunks={len(self._chunks)}>"
@@ -16,11 +16,17 @@
 )
 from arcade.math import get_distance
 from arcade.sprite import BasicSprite, SpriteType
-from arcade.types import Point
-from arcade.types.rect import Rect
+from arcade.types import Point, Point2
+from arcade.types.rect import LRBT, Rect
 
 from .sprite_list import SpriteList
 
+# NumPy is an optional dependency only used by the vectorized broad phase
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore
+
 
 def get_distance_between_sprites(sprite1: SpriteType, sprite2: SpriteType) -> float:
     """
@@ -186,6 +192,46 @@ def _get_nearby_sprites(
     ]
 
 
+def _get_nearby_sprites_numpy(
+    sprite: BasicSprite, sprite_list: SpriteList[SpriteType]
+) -> List[SpriteType]:
+    """
+    Vectorized broad phase over the packed position and size data.
+
+    The arrays of the sprite list are viewed without copying them and the
+    same radius estimate as :py:func:`_check_for_collision` is applied to
+    all sprites at once.
+    """
+    if np is None:
+        raise ImportError("Collision method 4 requires NumPy to be installed")
+
+    sprite_count = len(sprite_list)
+    if sprite_count == 0:
+        return []
+
+    # Apply pending removals so the index buffer matches the sprite list
+    sprite_list._normalize_index_buffer()
+    # The index buffer maps sprite list indices to buffer slots
+    slots = np.frombuffer(
+        sprite_list._sprite_index_data, dtype=sprite_list._sprite_index_data.typecode
+    )[:sprite_count]
+    pos = np.frombuffer(sprite_list._sprite_pos_data, dtype=np.float32).reshape(-1, 3)
+    size = np.frombuffer(sprite_list._sprite_size_data, dtype=np.float32).reshape(-1, 2)
+
+    width, height = sprite._width, sprite._height
+    radius_sum = np.maximum(size[:, 0], size[:, 1])[slots]
+    radius_sum += width if width > height else height
+    # Multiply by half of the theoretical max diagonal length for an estimation of distance
+    radius_sum *= 0.71
+
+    diff_x = pos[:, 0][slots] - sprite._position[0]
+    diff_y = pos[:, 1][slots] - sprite._position[1]
+    candidates = np.flatnonzero(diff_x * diff_x + diff_y * diff_y <= radius_sum * radius_sum)
+
+    sprites = sprite_list.sprite_list
+    return [sprites[i] for i in candidates.tolist()]
+
+
 def check_for_collision_with_list(
     sprite: SpriteType,
     sprite_list: SpriteList,
@@ -206,9 +252,12 @@ def check_for_collision_with_list(
             - 1: Spatial Hashing if available,
             - 2: GPU based
             - 3: Simple check-everything.
+            - 4: NumPy vectorized broad phase. Requires NumPy.
 
             Note that while the GPU method is very fast when you cannot use spatial hashing,
             it's also very slow if you are calling this function many times per frame.
+            The NumPy method is a CPU alternative for large lists without spatial hashing
+            that doesn't need a working OpenGL context.
             What method is the most appropriate depends entirely on your use case.
 
     Returns:
@@ -229,6 +278,15 @@ def check_for_collision_with_list(
         sprites_to_check = sprite_list.spatial_hash.get_sprites_near_sprite(sprite)
     elif method == 3 or (method == 0 and len(sprite_list) <= 1500):
         sprites_to_check = sprite_list
+    elif method == 4:
+        # The broad phase already did the radius check
+        points = sprite.hit_box.get_adjusted_points()
+        return [
+            sprite2
+            for sprite2 in _get_nearby_sprites_numpy(sprite, sprite_list)
+            if sprite is not sprite2
+            and are_polygons_intersecting(points, sprite2.hit_box.get_adjusted_points())
+        ]
     else:
         # GPU transform
         sprites_to_check = _get_nearby_sprites(sprite, sprite_list)
@@ -261,7 +319,8 @@ def check_for_collision_with_lists(
             SpriteLists to check against
         method:
             Collision check method. 1 is Spatial Hashing if available,
-            2 is GPU based, 3 is slow CPU-bound check-everything. Defaults to 1.
+            2 is GPU based, 3 is slow CPU-bound check-everything,
+            4 is a NumPy vectorized broad phase. Defaults to 1.
 
     Returns:
         List of sprites colliding, or an empty list.
@@ -281,6 +340,8 @@ def check_for_collision_with_lists(
             sprites_to_check = sprite_list.spatial_hash.get_sprites_near_sprite(sprite)
         elif method == 3:
             sprites_to_check = sprite_list
+        elif method == 4:
+            sprites_to_check = _get_nearby_sprites_numpy(sprite, sprite_list)
         else:
             # GPU transform
             sprites_to_check = _get_nearby_sprites(sprite, sprite_list)
@@ -292,6 +353,199 @@ def check_for_collision_with_lists(
     return sprites
 
 
+def is_sprite_outside_rect(
+    sprite: BasicSprite, left: float, right: float, bottom: float, top: float
+) -> bool:
+    """
+    Cheap rejection check to run before testing hit boxes.
+
+    Uses the same radius estimate as :py:func:`check_for_collision`, so a
+    sprite is only rejected if no rotation of it can reach the rectangle.
+
+    Args:
+        sprite: The sprite to check
+        left: Left edge of the rectangle
+        right: Right edge of the rectangle
+        bottom: Bottom edge of the rectangle
+        top: Top edge of the rectangle
+    """
+    x, y = sprite._position
+    # Half of the theoretical max diagonal length
+    radius = (sprite._width if sprite._width > sprite._height else sprite._height) * 0.71
+    return x + radius < left or x - radius > right or y + radius < bottom or y - radius > top
+
+
+def check_for_collision_with_lists_at(
+    sprite: BasicSprite,
+    offset: Point2,
+    sprite_lists: Iterable[SpriteList[SpriteType]],
+) -> List[SpriteType]:
+    """
+    Check for collisions as if a sprite was moved by an offset.
+
+    The sprite itself is not moved, so probing positions this way doesn't
+    update any sprite lists or spatial hashes the sprite is in.
+
+    .. code-block:: python
+
+        # Is there ground right below the player?
+        on_ground = len(check_for_collision_with_lists_at(player, (0, -2), walls)) > 0
+
+    Args:
+        sprite:
+            Sprite to check
+        offset:
+            The ``(x, y)`` offset to check the sprite at
+        sprite_lists:
+            SpriteLists to check against. Spatial hashing is used if
+            available, otherwise every sprite is checked on the CPU.
+
+    Returns:
+        List of sprites colliding, or an empty list.
+    """
+    if __debug__:
+        if not isinstance(sprite, BasicSprite):
+            raise TypeError(
+                f"Parameter 1 is not an instance of the BasicSprite class, "
+                f"it is an instance of {type(sprite)}."
+            )
+
+    offset_x, offset_y = offset
+    points = [(x + offset_x, y + offset_y) for x, y in sprite.hit_box.get_adjusted_points()]
+    if not points:
+        return []
+
+    left = min(x for x, _ in points)
+    right = max(x for x, _ in points)
+    bottom = min(y for _, y in points)
+    top = max(y for _, y in points)
+    rect = LRBT(left, right, bottom, top)
+
+    sprites: List[SpriteType] = []
+    sprites_to_check: Iterable[SpriteType]
+
+    for sprite_list in sprite_lists:
+        if sprite_list.spatial_hash is not None:
+            sprites_to_check = sprite_list.spatial_hash.get_sprites_near_rect(rect)
+        else:
+            sprites_to_check = sprite_list
+
+        for sprite2 in sprites_to_check:
+            if sprite2 is sprite:
+                continue
+            if is_sprite_outside_rect(sprite2, left, right, bottom, top):
+                continue
+            if are_polygons_intersecting(points, sprite2.hit_box.get_adjusted_points()):
+                sprites.append(sprite2)
+
+    return sprites
+
+
+def _get_sweep_entries(
+    sprite_list: SpriteList[SpriteType], group: int
+) -> List[Tuple[float, float, float, float, float, int, SpriteType]]:
+    """
+    Build sweep and prune entries from the packed position and size data.
+
+    Each entry is ``(min_x, max_x, x, y, radius, group, sprite)`` using the
+    same radius estimate as :py:func:`_check_for_collision`.
+    """
+    pos_data = sprite_list._sprite_pos_data
+    size_data = sprite_list._sprite_size_data
+    entries = []
+    for sprite, slot in sprite_list.sprite_slot.items():
+        x = pos_data[slot * 3]
+        width = size_data[slot * 2]
+        height = size_data[slot * 2 + 1]
+        # Half of the theoretical max diagonal length
+        radius = (width if width > height else height) * 0.71
+        y = pos_data[slot * 3 + 1]
+        entries.append((x - radius, x + radius, x, y, radius, group, sprite))
+    return entries
+
+
+def check_for_collisions_between_lists(
+    sprite_list_1: SpriteList[SpriteType],
+    sprite_list_2: SpriteList[SpriteType],
+) -> List[Tuple[SpriteType, SpriteType]]:
+    """
+    Find all colliding pairs of sprites between two sprite lists.
+
+    This is much faster than calling :py:func:`check_for_collision_with_list`
+    for each sprite in the first list. A single sweep and prune broad phase
+    over the position and size data of both lists finds the candidate pairs
+    and only those are checked against each other's hit boxes.
+
+    If the same list is passed twice, each colliding pair within the list
+    is only returned once.
+
+    Args:
+        sprite_list_1:
+            First SpriteList. The first sprite in each pair is from this list.
+        sprite_list_2:
+            Second SpriteList. The second sprite in each pair is from this list.
+
+    Returns:
+        List of ``(sprite_1, sprite_2)`` tuples, or an empty list.
+    """
+    if __debug__:
+        if not isinstance(sprite_list_1, SpriteList):
+            raise TypeError(
+                f"Parameter 1 is a {type(sprite_list_1)} instead of expected SpriteList."
+            )
+        if not isinstance(sprite_list_2, SpriteList):
+            raise TypeError(
+                f"Parameter 2 is a {type(sprite_list_2)} instead of expected SpriteList."
+            )
+
+    same_list = sprite_list_1 is sprite_list_2
+    entries = _get_sweep_entries(sprite_list_1, 0)
+    if not same_list:
+        if not entries:
+            return []
+        entries.extend(_get_sweep_entries(sprite_list_2, 1))
+    entries.sort(key=lambda entry: entry[0])
+
+    pairs: List[Tuple[SpriteType, SpriteType]] = []
+    # Entries still overlapping the sweep line along the x axis per list
+    active: Tuple[list, list] = ([], [])
+
+    for entry in entries:
+        min_x, _, x, y, radius, group, sprite = entry
+        # When checking a list against itself all entries are in group 0
+        others = active[0] if same_list else active[1 - group]
+        # Drop entries the sweep line has passed
+        others[:] = [e for e in others if e[1] >= min_x]
+
+        for _, _, other_x, other_y, other_radius, _, other_sprite in others:
+            radius_sum_sq = radius + other_radius
+            radius_sum_sq *= radius_sum_sq
+            diff_y = y - other_y
+            diff_y_sq = diff_y * diff_y
+            if diff_y_sq > radius_sum_sq:
+                continue
+            diff_x = x - other_x
+            if diff_x * diff_x + diff_y_sq > radius_sum_sq:
+                continue
+
+            if sprite is other_sprite:
+                continue
+            if not are_polygons_intersecting(
+                sprite.hit_box.get_adjusted_points(),
+                other_sprite.hit_box.get_adjusted_points(),
+            ):
+                continue
+
+            if group == 0 and not same_list:
+                pairs.append((sprite, other_sprite))
+            else:
+                pairs.append((other_sprite, sprite))
+
+        active[group].append(entry)
+
+    return pairs
+
+
 def get_sprites_at_point(point: Point, sprite_list: SpriteList[SpriteType]) -> List[SpriteType]:
     """
     Get a list of sprites at a particular point. This function sees if any sprite overlaps
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import sys
 from math import trunc
-from typing import Generic
+from typing import Generic, Iterable, NamedTuple
 
 from arcade.sprite import SpriteType
 from arcade.sprite.base import BasicSprite
@@ -9,6 +10,23 @@
 from arcade.types.rect import Rect
 
 
+class SpatialHashStats(NamedTuple):
+    """Statistics about the buckets in a :py:class:`SpatialHash`.
+
+    Returned by :py:meth:`SpatialHash.stats`. Useful for tuning the
+    ``cell_size`` of a spatial hash.
+    """
+
+    #: The number of sprites in the spatial hash
+    sprite_count: int
+    #: The number of non-empty buckets (cells)
+    bucket_count: int
+    #: Maps the number of sprites in a bucket to how many buckets have that many
+    occupancy: dict[int, int]
+    #: Rough estimate of the memory used by the internal containers in bytes
+    memory_estimate: int
+
+
 class SpatialHash(Generic[SpriteType]):
     """A data structure best for collision checks with non-moving sprites.
 
@@ -17,12 +35,23 @@ class SpatialHash(Generic[SpriteType]):
     same as removing and adding it. Although moving a few can be okay, it
     can quickly add up and slow down a game.
 
+    Moves that keep a sprite inside the same range of cells are cheap
+    since the last cell range of each sprite is cached. When
+    :py:attr:`deferred` is enabled, moves are only recorded and the
+    affected sprites are re-bucketed in a single :py:meth:`flush`
+    before the next query.
+
+    Queries never modify the spatial hash and buckets are discarded
+    as soon as they become empty.
+
     Args:
         cell_size:
             The width and height of each square in the grid.
+        deferred:
+            Batch moves and apply them before the next query.
     """
 
-    def __init__(self, cell_size: int) -> None:
+    def __init__(self, cell_size: int, deferred: bool = False) -> None:
         # Sanity check the cell size
         if not isinstance(cell_size, int):
             raise TypeError("cell_size must be an int (integer)")
@@ -39,9 +68,12 @@ def __init__(self, cell_size: int) -> None:
         """
         # Buckets of sprites per cell
         self.contents: dict[IPoint, set[SpriteType]] = {}
-        # All the buckets a sprite is in.
-        # This is used to remove a sprite from the spatial hash.
-        self.buckets_for_sprite: dict[SpriteType, list[set[SpriteType]]] = {}
+        # The (min_cell, max_cell) range each sprite was last bucketed with.
+        # Used to remove a sprite and to skip moves that don't change the covered cells.
+        self.cell_range_for_sprite: dict[SpriteType, tuple[IPoint, IPoint]] = {}
+        # Sprites moved while in deferred mode waiting for the next flush
+        self._dirty: set[SpriteType] = set()
+        self._deferred = deferred
 
     def hash(self, point: IPoint) -> IPoint:
         """Convert world coordinates to cell coordinates"""
@@ -50,10 +82,45 @@ def hash(self, point: IPoint) -> IPoint:
             point[1] // self.cell_size,
         )
 
+    def cell_range(self, sprite: BasicSprite) -> tuple[IPoint, IPoint]:
+        """
+        Get the minimum and maximum cell coordinates covered by a sprite.
+
+        Args:
+            sprite: The sprite to get the cell range for
+        """
+        # Fetch the cached bounds once instead of going
+        # through the four boundary properties of the sprite
+        left, right, bottom, top = sprite.hit_box.bounds
+        cell_size = self.cell_size
+        return (
+            (trunc(left) // cell_size, trunc(bottom) // cell_size),
+            (trunc(right) // cell_size, trunc(top) // cell_size),
+        )
+
+    @property
+    def deferred(self) -> bool:
+        """
+        Get or set if moves should be deferred.
+
+        In deferred mode :py:meth:`move` only marks the sprite as dirty.
+        All dirty sprites are re-bucketed once before the next query
+        or when :py:meth:`flush` is called. Disabling deferred mode
+        will flush any pending moves.
+        """
+        return self._deferred
+
+    @deferred.setter
+    def deferred(self, value: bool) -> None:
+        self._deferred = value
+        if not value:
+            self.flush()
+
     def reset(self):
         """Clear all the sprites from the spatial hash."""
         self.contents.clear()
-        self.buckets_for_sprite.clear()
+        self.cell_range_for_sprite.clear()
+        self._dirty.clear()
 
     def add(self, sprite: SpriteType) -> None:
         """
@@ -62,34 +129,77 @@ def add(self, sprite: SpriteType) -> None:
         Args:
             sprite: The sprite to add
         """
-        min_point = trunc(sprite.left), trunc(sprite.bottom)
-        max_point = trunc(sprite.right), trunc(sprite.top)
+        self._dirty.discard(sprite)
+        # Adding a sprite twice should not leave it behind in old buckets
+        if sprite in self.cell_range_for_sprite:
+            self._remove(sprite)
+        self._add(sprite, self.cell_range(sprite))
 
-        # hash the minimum and maximum points
-        min_point, max_point = self.hash(min_point), self.hash(max_point)
-        buckets: list[set[SpriteType]] = []
+    def add_many(self, sprites: Iterable[SpriteType]) -> None:
+        """
+        Add several sprites to the spatial hash.
+
+        Args:
+            sprites: The sprites to add
+        """
+        cell_range = self.cell_range
+        add = self._add
+        for sprite in sprites:
+            self._dirty.discard(sprite)
+            if sprite in self.cell_range_for_sprite:
+                self._remove(sprite)
+            add(sprite, cell_range(sprite))
+
+    def _add(self, sprite: SpriteType, cell_range: tuple[IPoint, IPoint]) -> None:
+        """Add a sprite to all the buckets in the given cell range."""
+        min_point, max_point = cell_range
+        contents = self.contents
 
         # Iterate over the rectangular region adding the sprite to each cell
         for i in range(min_point[0], max_point[0] + 1):
             for j in range(min_point[1], max_point[1] + 1):
-                # Add sprite to the bucket
-                bucket = self.contents.setdefault((i, j), set())
-                bucket.add(sprite)
-                # Collect all the buckets we added to
-                buckets.append(bucket)
+                contents.setdefault((i, j), set()).add(sprite)
 
-        # Keep track of which buckets the sprite is in
-        self.buckets_for_sprite[sprite] = buckets
+        # Keep track of which cells the sprite is in
+        self.cell_range_for_sprite[sprite] = cell_range
 
     def move(self, sprite: SpriteType) -> None:
         """
-        Shortcut to remove and re-add a sprite.
+        Update the buckets of a sprite after it moved or changed size.
+
+        Nothing is done if the sprite still covers the same cells.
+        In :py:attr:`deferred` mode the sprite is only marked as dirty.
 
         Args:
             sprite: The sprite to move
         """
-        self.remove(sprite)
-        self.add(sprite)
+        if self._deferred:
+            self._dirty.add(sprite)
+            return
+
+        self._move(sprite)
+
+    def _move(self, sprite: SpriteType) -> None:
+        """Re-bucket a sprite only if its cell range changed."""
+        cell_range = self.cell_range(sprite)
+        if self.cell_range_for_sprite.get(sprite) == cell_range:
+            return
+
+        self._remove(sprite)
+        self._add(sprite, cell_range)
+
+    def flush(self) -> None:
+        """
+        Apply all the moves recorded in :py:attr:`deferred` mode.
+
+        This is called automatically before every query.
+        """
+        if not self._dirty:
+            return
+
+        for sprite in self._dirty:
+            self._move(sprite)
+        self._dirty.clear()
 
     def remove(self, sprite: SpriteType) -> None:
         """
@@ -98,12 +208,22 @@ def remove(self, sprite: SpriteType) -> None:
         Args:
             sprite: The sprite to remove
         """
-        # Remove the sprite from all the buckets it is in
-        for bucket in self.buckets_for_sprite[sprite]:
-            bucket.remove(sprite)
+        self._dirty.discard(sprite)
+        self._remove(sprite)
+
+    def _remove(self, sprite: SpriteType) -> None:
+        """Remove a sprite from all the buckets it is in."""
+        min_point, max_point = self.cell_range_for_sprite.pop(sprite)
 
-        # Delete the sprite from the bucket tracker
-        del self.buckets_for_sprite[sprite]
+        # Remove the sprite from all the buckets it is in
+        # discarding the buckets that are now empty
+        contents = self.contents
+        for i in range(min_point[0], max_point[0] + 1):
+            for j in range(min_point[1], max_point[1] + 1):
+                bucket = contents[i, j]
+                bucket.remove(sprite)
+                if not bucket:
+                    del contents[i, j]
 
     def get_sprites_near_sprite(self, sprite: BasicSprite) -> set[SpriteType]:
         """
@@ -112,18 +232,17 @@ def get_sprites_near_sprite(self, sprite: BasicSprite) -> set[SpriteType]:
         Args:
             sprite: The sprite to check
         """
-        min_point = trunc(sprite.left), trunc(sprite.bottom)
-        max_point = trunc(sprite.right), trunc(sprite.top)
-
-        # hash the minimum and maximum points
-        min_point, max_point = self.hash(min_point), self.hash(max_point)
+        self.flush()
+        min_point, max_point = self.cell_range(sprite)
         close_by_sprites: set[SpriteType] = set()
+        contents = self.contents
 
         # Iterate over the all the covered cells and collect the sprites
         for i in range(min_point[0], max_point[0] + 1):
             for j in range(min_point[1], max_point[1] + 1):
-                bucket = self.contents.setdefault((i, j), set())
-                close_by_sprites.update(bucket)
+                bucket = contents.get((i, j))
+                if bucket:
+                    close_by_sprites.update(bucket)
 
         return close_by_sprites
 
@@ -134,9 +253,10 @@ def get_sprites_near_point(self, point: Point) -> set[SpriteType]:
         Args:
             point: The point to check
         """
+        self.flush()
         hash_point = self.hash((trunc(point[0]), trunc(point[1])))
         # Return a copy of the set.
-        return set(self.contents.setdefault(hash_point, set()))
+        return set(self.contents.get(hash_point, ()))
 
     def get_sprites_near_rect(self, rect: Rect) -> set[SpriteType]:
         """
@@ -145,6 +265,7 @@ def get_sprites_near_rect(self, rect: Rect) -> set[SpriteType]:
         Args:
             rect: The rectangle to check (left, right, bottom, top)
         """
+        self.flush()
         left, right, bottom, top = rect.lrbt
         min_point = trunc(left), trunc(bottom)
         max_point = trunc(right), trunc(top)
@@ -152,15 +273,47 @@ def get_sprites_near_rect(self, rect: Rect) -> set[SpriteType]:
         # hash the minimum and maximum points
         min_point, max_point = self.hash(min_point), self.hash(max_point)
         close_by_sprites: set[SpriteType] = set()
+        contents = self.contents
 
         # Iterate over the all the covered cells and collect the sprites
         for i in range(min_point[0], max_point[0] + 1):
             for j in range(min_point[1], max_point[1] + 1):
-                bucket = self.contents.setdefault((i, j), set())
-                close_by_sprites.update(bucket)
+                bucket = contents.get((i, j))
+                if bucket:
+                    close_by_sprites.update(bucket)
 
         return close_by_sprites
 
+    def stats(self) -> SpatialHashStats:
+        """
+        Get statistics about the buckets in the spatial hash.
+
+        The memory estimate only covers the containers of the spatial
+        hash itself and not the sprites. Example::
+
+            >> stats = sprite_list.spatial_hash.stats()
+            >> stats.bucket_count
+            42
+            >> stats.occupancy
+            {1: 30, 2: 10, 5: 2}
+        """
+        self.flush()
+        occupancy: dict[int, int] = {}
+        memory = sys.getsizeof(self.contents)
+        memory += sys.getsizeof(self.cell_range_for_sprite)
+
+        for bucket in self.contents.values():
+            size = len(bucket)
+            occupancy[size] = occupancy.get(size, 0) + 1
+            memory += sys.getsizeof(bucket)
+
+        return SpatialHashStats(
+            sprite_count=self.count,
+            bucket_count=len(self.contents),
+            occupancy=dict(sorted(occupancy.items())),
+            memory_estimate=memory,
+        )
+
     @property
     def count(self) -> int:
         """Return the number of sprites in the spatial hash"""
@@ -168,4 +321,4 @@ def count(self) -> int:
         # changing the truthiness of the class instance.
         # if spatial_hash will be False if it is empty.
         # For backwards compatibility, we'll keep it as a property.
-        return len(self.buckets_for_sprite)
+        return len(self.cell_range_for_sprite)
@@ -38,7 +38,7 @@
 from arcade.utils import copy_dunders_unimplemented
 
 if TYPE_CHECKING:
-    from arcade import DefaultTextureAtlas, Texture
+    from arcade import ArcadeContext, DefaultTextureAtlas, Texture
     from arcade.texture_atlas import TextureAtlasBase
 
 # LOG = logging.getLogger(__name__)
@@ -51,6 +51,40 @@
 # The default capacity from spritelists
 _DEFAULT_CAPACITY = 100
 
+# Start value of a dirty slot range meaning nothing is dirty
+_NO_DIRTY_SLOT = 2**31
+
+
+def _mark_dirty(dirty: list[int], start: int, end: int) -> None:
+    """Extend a ``[start, end)`` dirty slot range to include the given range."""
+    if start < dirty[0]:
+        dirty[0] = start
+    if end > dirty[1]:
+        dirty[1] = end
+
+
+def _get_view_bounds(ctx: ArcadeContext) -> tuple[float, float, float, float]:
+    """
+    Get the ``left, bottom, right, top`` area seen by the current camera.
+
+    This is :py:meth:`Camera2D.aabb() <arcade.Camera2D.aabb>` for a
+    :py:class:`~arcade.Camera2D` or the unprojected viewport for other projectors.
+    """
+    camera = ctx.current_camera
+    aabb = getattr(camera, "aabb", None)
+    if aabb is not None:
+        rect = aabb()
+        return rect.left, rect.bottom, rect.right, rect.top
+
+    x, y, width, height = ctx.viewport
+    corners = [
+        camera.unproject(point)
+        for point in ((x, y), (x + width, y), (x, y + height), (x + width, y + height))
+    ]
+    xs = [corner[0] for corner in corners]
+    ys = [corner[1] for corner in corners]
+    return min(xs), min(ys), max(xs), max(ys)
+
 
 @copy_dunders_unimplemented  # Temp fixes https://github.com/pythonarcade/arcade/issues/2074
 class SpriteList(Generic[SpriteType]):
@@ -113,6 +147,10 @@ class SpriteList(Generic[SpriteType]):
     #:     arcade.SpriteList.DEFAULT_TEXTURE_FILTER = gl.NEAREST, gl.NEAREST
     DEFAULT_TEXTURE_FILTER: ClassVar[tuple[int, int]] = gl.LINEAR, gl.LINEAR
 
+    #: The fraction of used slots that can be dirty before a buffer is
+    #: orphaned and written in full instead of only writing the changed range.
+    PARTIAL_UPLOAD_THRESHOLD: ClassVar[float] = 0.5
+
     def __init__(
         self,
         use_spatial_hash: bool = False,
@@ -141,11 +179,14 @@ def __init__(
         # List of free slots in the sprite buffers. These are filled when sprites are removed.
         self._sprite_buffer_free_slots: Deque[int] = deque()
 
-        # List of sprites in the sprite list
-        self.sprite_list: list[SpriteType] = []
+        # List of sprites in the sprite list.
+        # Can contain removed sprites until the index buffer is normalized.
+        self._sprite_list: list[SpriteType] = []
         # Buffer slots for the sprites (excluding index buffer)
         # This has nothing to do with the index in the spritelist itself
         self.sprite_slot: dict[SpriteType, int] = dict()
+        # Removed sprites and their slots waiting for the index buffer to be normalized
+        self._sprites_removed: dict[SpriteType, int] = dict()
 
         # Python representation of buffer data
         self._sprite_pos_data = array("f", [0] * self._buf_capacity * 3)
@@ -175,6 +216,33 @@ def __init__(
         self._sprite_color_changed: bool = False
         self._sprite_texture_changed: bool = False
         self._sprite_index_changed: bool = False
+        # Ranges of slots [start, end) changed since the last write.
+        # Only these are written to the OpenGL buffers unless the flags above are set.
+        self._sprite_pos_dirty = [_NO_DIRTY_SLOT, 0]
+        self._sprite_size_dirty = [_NO_DIRTY_SLOT, 0]
+        self._sprite_angle_dirty = [_NO_DIRTY_SLOT, 0]
+        self._sprite_color_dirty = [_NO_DIRTY_SLOT, 0]
+        self._sprite_texture_dirty = [_NO_DIRTY_SLOT, 0]
+        self._sprite_index_dirty = [_NO_DIRTY_SLOT, 0]
+
+        self.upload_bytes = 0
+        """Total number of bytes written to the OpenGL buffers of this list."""
+        self.full_uploads = 0
+        """Number of times a buffer was orphaned and written in full."""
+        self.partial_uploads = 0
+        """Number of times only a changed range of a buffer was written."""
+
+        # Culling is disabled when the chunk size is 0.
+        # The bounds of the chunks with moved, resized or reordered sprites
+        # are recalculated before drawing.
+        self._cull_chunk_size = 0
+        self._cull_bounds: array | None = None
+        # The chunk of each sprite buffer slot or -1
+        self._cull_slot_chunk = array("i")
+        self.sprites_drawn = 0
+        """Number of sprites submitted for rendering in the last draw."""
+        self.sprites_culled = 0
+        """Number of sprites skipped by culling in the last draw."""
 
         # Used in collision detection optimization
         from .spatial_hash import SpatialHash
@@ -246,7 +314,7 @@ def _init_deferred(self) -> None:
         self._initialized = True
 
         # Load all the textures and write texture coordinates into buffers.
-        for sprite in self.sprite_list:
+        for sprite in self.sprite_slot:
             # noinspection PyProtectedMember
             if sprite._texture is None:
                 raise ValueError("Attempting to use a sprite without a texture")
@@ -266,7 +334,7 @@ def _init_deferred(self) -> None:
 
     def __len__(self) -> int:
         """Return the length of the sprite list."""
-        return len(self.sprite_list)
+        return len(self.sprite_slot)
 
     def __contains__(self, sprite: Sprite) -> bool:
         """Return if the sprite list contains the given sprite"""
@@ -308,6 +376,27 @@ def __setitem__(self, index: int, sprite: SpriteType) -> None:
         # Update the internal sprite buffer data
         self._update_all(sprite)
 
+    @property
+    def sprite_list(self) -> list[SpriteType]:
+        """
+        The internal list of sprites in this sprite list.
+
+        Pending removals are applied before the list is returned.
+        This list should not be modified directly. Assigning a new
+        list replaces all the sprites like :py:meth:`clear` followed
+        by :py:meth:`extend`.
+        """
+        if self._sprites_removed:
+            self._normalize_index_buffer()
+        return self._sprite_list
+
+    @sprite_list.setter
+    def sprite_list(self, sprites: Iterable[SpriteType]) -> None:
+        # Assigning a new list replaces all the sprites
+        sprites = list(sprites)
+        self.clear()
+        self.extend(sprites)
+
     @property
     def visible(self) -> bool:
         """
@@ -589,15 +678,18 @@ def clear(self, deep: bool = True) -> None:
 
         # Manually remove the spritelist from all sprites
         if deep:
-            for sprite in self.sprite_list:
+            for sprite in self.sprite_slot:
                 sprite.sprite_lists.remove(self)
 
-        self.sprite_list = []
+        self._sprite_list = []
         self.sprite_slot = dict()
+        self._sprites_removed = dict()
 
         # Reset SpatialHash
         if self.spatial_hash is not None:
-            self.spatial_hash = SpatialHash(cell_size=self._spatial_hash_cell_size)
+            self.spatial_hash = SpatialHash(
+                cell_size=self._spatial_hash_cell_size, deferred=self.spatial_hash.deferred
+            )
 
         # Clear the slot_idx and slot info and other states
         self._buf_capacity = _DEFAULT_CAPACITY
@@ -615,6 +707,14 @@ def clear(self, deep: bool = True) -> None:
         self._sprite_texture_data = array("f", [0] * self._buf_capacity)
         # Index buffer
         self._sprite_index_data = array("I", [0] * self._idx_capacity)
+        # Dirty ranges
+        self._sprite_pos_dirty = [_NO_DIRTY_SLOT, 0]
+        self._sprite_size_dirty = [_NO_DIRTY_SLOT, 0]
+        self._sprite_angle_dirty = [_NO_DIRTY_SLOT, 0]
+        self._sprite_color_dirty = [_NO_DIRTY_SLOT, 0]
+        self._sprite_texture_dirty = [_NO_DIRTY_SLOT, 0]
+        self._sprite_index_dirty = [_NO_DIRTY_SLOT, 0]
+        self._cull_bounds = None
 
         if self._initialized:
             self._initialized = False
@@ -634,11 +734,27 @@ def pop(self, index: int = -1) -> SpriteType:
             index:
                 Index of sprite to remove (defaults to ``-1`` for the last item)
         """
-        if len(self.sprite_list) == 0:
+        if len(self.sprite_slot) == 0:
             raise IndexError("pop from empty list")
 
+        # Pending removals are only applied once here
         sprite = self.sprite_list[index]
-        self.remove(sprite)
+        if sprite is not self._sprite_list[-1]:
+            self.remove(sprite)
+            return sprite
+
+        # The last sprite can be dropped from the end of the
+        # index buffer without rebuilding it
+        slot = self.sprite_slot.pop(sprite)
+        self._sprite_list.pop()
+        idx_slot = self._sprite_index_slots = self._sprite_index_slots - 1
+        _mark_dirty(self._sprite_index_dirty, idx_slot, idx_slot + 1)
+        self._sprite_buffer_free_slots.append(slot)
+        sprite.sprite_lists.remove(self)
+
+        if self.spatial_hash is not None:
+            self.spatial_hash.remove(sprite)
+
         return sprite
 
     def append(self, sprite: SpriteType) -> None:
@@ -651,10 +767,13 @@ def append(self, sprite: SpriteType) -> None:
         # print(f"{id(self)} : {id(sprite)} append")
         if sprite in self.sprite_slot:
             raise ValueError("Sprite already in SpriteList")
+        # Re-adding a sprite removed since the last normalization
+        if sprite in self._sprites_removed:
+            self._normalize_index_buffer()
 
         slot = self._next_slot()
         self.sprite_slot[sprite] = slot
-        self.sprite_list.append(sprite)
+        self._sprite_list.append(sprite)
         sprite.register_sprite_list(self)
 
         self._update_all(sprite)
@@ -664,7 +783,7 @@ def append(self, sprite: SpriteType) -> None:
         self._sprite_index_slots += 1
         self._grow_index_buffer()
         self._sprite_index_data[idx_slot] = slot
-        self._sprite_index_changed = True
+        _mark_dirty(self._sprite_index_dirty, idx_slot, idx_slot + 1)
 
         if self.spatial_hash is not None:
             self.spatial_hash.add(sprite)
@@ -700,51 +819,159 @@ def swap(self, index_1: int, index_2: int) -> None:
         self._sprite_index_data[i1] = slot_2
         self._sprite_index_data[i2] = slot_1
 
-        self._sprite_index_changed = True
+        _mark_dirty(self._sprite_index_dirty, min(i1, i2), max(i1, i2) + 1)
 
     def remove(self, sprite: SpriteType) -> None:
         """
         Remove a specific sprite from the list.
 
+        This is an ``O(1)`` operation. The sprite is removed from the
+        internal list and index buffer in a single pass together with
+        other removals before the next draw or index access.
+
         Args:
             sprite: Item to remove from the list
         """
         # print(f"{id(self)} : {id(sprite)} remove")
         try:
-            slot = self.sprite_slot[sprite]
+            slot = self.sprite_slot.pop(sprite)
         except KeyError:
             raise ValueError("Sprite is not in the SpriteList")
 
-        self.sprite_list.remove(sprite)
         sprite.sprite_lists.remove(self)
-        del self.sprite_slot[sprite]
+        # The slot is freed when the index buffer is normalized
+        self._sprites_removed[sprite] = slot
 
-        self._sprite_buffer_free_slots.append(slot)
+        if self.spatial_hash is not None:
+            self.spatial_hash.remove(sprite)
+
+    def remove_many(self, sprites: Iterable[SpriteType]) -> None:
+        """
+        Remove several sprites from the list at once.
 
-        # NOTE: Optimize this by deferring removal?
-        #       Defer removal
-        # Set the sprite as invisible in the index buffer
-        # idx_slot = self._sprite_index_data.index(slot)
-        # self._sprite_index_data[idx_slot] = _SPRITE_SLOT_INVISIBLE
+        The internal list and index buffer are rebuilt once
+        regardless of the number of sprites removed.
 
-        # Brutal resize for now. Optimize later
-        self._sprite_index_data.remove(slot)
-        self._sprite_index_data.append(0)
-        self._sprite_index_slots -= 1
-        self._sprite_index_changed = True
+        Args:
+            sprites: Iterable of sprites to remove from the list
+        """
+        for sprite in sprites:
+            self.remove(sprite)
+        self._normalize_index_buffer()
 
-        if self.spatial_hash is not None:
-            self.spatial_hash.remove(sprite)
+    def kill_where(self, predicate: Callable[[SpriteType], bool]) -> list[SpriteType]:
+        """
+        Kill all the sprites in the list matching a predicate.
+
+        Matching sprites are removed from all the sprite lists they
+        belong to, like :py:meth:`~arcade.BasicSprite.remove_from_sprite_lists`.
+        This list is only rebuilt once. Example::
+
+            # Remove all bullets that left the screen
+            bullet_list.kill_where(lambda bullet: bullet.bottom > SCREEN_HEIGHT)
+
+        Args:
+            predicate: Function returning ``True`` for sprites to kill
+
+        Returns:
+            List of the killed sprites
+        """
+        killed = [sprite for sprite in self.sprite_list if predicate(sprite)]
+        for sprite in killed:
+            sprite.remove_from_sprite_lists()
+        self._normalize_index_buffer()
+        return killed
 
     def extend(self, sprites: Iterable[SpriteType] | SpriteList[SpriteType]) -> None:
         """
         Extends the current list with the given iterable
 
+        This is much faster than appending the sprites one by one.
+        The internal buffers are resized once and the sprite data is
+        written in slices.
+
         Args:
             sprites: Iterable of Sprites to add to the list
         """
-        for sprite in sprites:
-            self.append(sprite)
+        if isinstance(sprites, SpriteList):
+            new_sprites = list(sprites.sprite_list)
+        else:
+            new_sprites = list(sprites)
+        if not new_sprites:
+            return
+
+        sprite_slot = self.sprite_slot
+        for sprite in new_sprites:
+            if sprite in sprite_slot:
+                raise ValueError("Sprite already in SpriteList")
+        if len(set(new_sprites)) != len(new_sprites):
+            raise ValueError("Sprite already in SpriteList")
+        # Re-adding sprites removed since the last normalization
+        if not self._sprites_removed.keys().isdisjoint(new_sprites):
+            self._normalize_index_buffer()
+
+        # Reuse free slots first and write the remaining sprites
+        # into a contiguous range at the end of the buffers
+        free_slots = self._sprite_buffer_free_slots
+        reused = min(len(free_slots), len(new_sprites))
+        slots = [free_slots.popleft() for _ in range(reused)]
+        start = self._sprite_buffer_slots
+        end = start + len(new_sprites) - reused
+        slots.extend(range(start, end))
+        self._sprite_buffer_slots = end
+        self._grow_sprite_buffers()
+
+        sprite_slot.update(zip(new_sprites, slots))
+        self._sprite_list.extend(new_sprites)
+        for sprite in new_sprites:
+            sprite.register_sprite_list(self)
+
+        for sprite in new_sprites[:reused]:
+            self._update_all(sprite)
+
+        sprites_end = new_sprites[reused:]
+        if sprites_end:
+            self._sprite_pos_data[start * 3 : end * 3] = array(
+                "f", [v for s in sprites_end for v in (s._position[0], s._position[1], s._depth)]
+            )
+            self._sprite_size_data[start * 2 : end * 2] = array(
+                "f", [v for s in sprites_end for v in (s._width, s._height)]
+            )
+            self._sprite_angle_data[start:end] = array("f", [s._angle for s in sprites_end])
+            self._sprite_color_data[start * 4 : end * 4] = array(
+                "B", [v for s in sprites_end for v in s._color]
+            )
+            _mark_dirty(self._sprite_pos_dirty, start, end)
+            _mark_dirty(self._sprite_size_dirty, start, end)
+            _mark_dirty(self._sprite_angle_dirty, start, end)
+            _mark_dirty(self._sprite_color_dirty, start, end)
+
+            # Textures are written when the spritelist is initialized
+            if self._initialized:
+                atlas = self._atlas
+                tex_slots: dict[Texture, int] = {}
+                for sprite in sprites_end:
+                    texture = sprite._texture
+                    if texture is None:
+                        raise ValueError("Sprite must have a texture when added to a SpriteList")
+                    if texture not in tex_slots:
+                        tex_slots[texture] = atlas.add(texture)[0]  # type: ignore
+                self._sprite_texture_data[start:end] = array(
+                    "f", [tex_slots[s._texture] for s in sprites_end]
+                )
+                _mark_dirty(self._sprite_texture_dirty, start, end)
+
+        # Add the sprites to the end of the index buffer
+        idx_start = self._sprite_index_slots
+        self._sprite_index_slots += len(new_sprites)
+        self._grow_index_buffer()
+        self._sprite_index_data[idx_start : self._sprite_index_slots] = array(
+            self._sprite_index_data.typecode, slots
+        )
+        _mark_dirty(self._sprite_index_dirty, idx_start, self._sprite_index_slots)
+
+        if self.spatial_hash is not None:
+            self.spatial_hash.add_many(new_sprites)
 
     def insert(self, index: int, sprite: SpriteType) -> None:
         """
@@ -754,12 +981,14 @@ def insert(self, index: int, sprite: SpriteType) -> None:
             index: The index at which to insert
             sprite: The sprite to insert
         """
-        if sprite in self.sprite_list:
+        if sprite in self.sprite_slot:
             raise ValueError("Sprite is already in list")
 
-        index = max(min(len(self.sprite_list), index), 0)
+        # Ensure the index buffer is normalized
+        self._normalize_index_buffer()
+        index = max(min(len(self._sprite_list), index), 0)
 
-        self.sprite_list.insert(index, sprite)
+        self._sprite_list.insert(index, sprite)
         sprite.register_sprite_list(self)
 
         # Allocate a new slot and write the data
@@ -768,12 +997,13 @@ def insert(self, index: int, sprite: SpriteType) -> None:
         self._update_all(sprite)
 
         # Allocate room in the index buffer
-        self._normalize_index_buffer()
         # idx_slot = self._sprite_index_slots
         self._sprite_index_slots += 1
         self._grow_index_buffer()
         self._sprite_index_data.insert(index, slot)
         self._sprite_index_data.pop()
+        # Every slot after the insertion point moved
+        _mark_dirty(self._sprite_index_dirty, index, self._sprite_index_slots)
 
         if self.spatial_hash is not None:
             self.spatial_hash.add(sprite)
@@ -784,11 +1014,11 @@ def reverse(self) -> None:
         self._normalize_index_buffer()
 
         # Reverse the sprites and index buffer
-        self.sprite_list.reverse()
+        self._sprite_list.reverse()
         # This seems to be the reasonable way to reverse a subset of an array
-        reverse_data = self._sprite_index_data[0 : len(self.sprite_list)]
+        reverse_data = self._sprite_index_data[0 : len(self._sprite_list)]
         reverse_data.reverse()
-        self._sprite_index_data[0 : len(self.sprite_list)] = reverse_data
+        self._sprite_index_data[0 : len(self._sprite_list)] = reverse_data
 
         self._sprite_index_changed = True
 
@@ -802,12 +1032,12 @@ def shuffle(self) -> None:
         self._normalize_index_buffer()
 
         # zip index and sprite into pairs and shuffle
-        pairs = list(zip(self.sprite_list, self._sprite_index_data))
+        pairs = list(zip(self._sprite_list, self._sprite_index_data))
         random.shuffle(pairs)
 
         # Reconstruct the lists again from pairs
         sprites, indices = cast(tuple[list[SpriteType], list[int]], zip(*pairs))
-        self.sprite_list = list(sprites)
+        self._sprite_list = list(sprites)
         self._sprite_index_data = array("I", indices)
 
         # Resize the index buffer to the original capacity
@@ -847,9 +1077,9 @@ def create_y_pos_comparison(sprite):
         self._normalize_index_buffer()
 
         # In-place sort the spritelist
-        self.sprite_list.sort(key=key, reverse=reverse)
+        self._sprite_list.sort(key=key, reverse=reverse)
         # Loop over the sorted sprites and assign new values in index buffer
-        for i, sprite in enumerate(self.sprite_list):
+        for i, sprite in enumerate(self._sprite_list):
             self._sprite_index_data[i] = self.sprite_slot[sprite]
 
         self._sprite_index_changed = True
@@ -869,11 +1099,173 @@ def enable_spatial_hashing(self, spatial_hash_cell_size: int = 128) -> None:
             # LOG.debug("Enabled spatial hashing with cell size %s", spatial_hash_cell_size)
             from .spatial_hash import SpatialHash
 
-            self.spatial_hash = SpatialHash(cell_size=spatial_hash_cell_size)
+            deferred = self.spatial_hash is not None and self.spatial_hash.deferred
+            self.spatial_hash = SpatialHash(cell_size=spatial_hash_cell_size, deferred=deferred)
             self._recalculate_spatial_hashes()
         # else:
         #     LOG.debug("Spatial hashing is already enabled with size %s", spatial_hash_cell_size)
 
+    @property
+    def culling(self) -> bool:
+        """``True`` if culling is enabled. See :py:meth:`enable_culling`."""
+        return self._cull_chunk_size > 0
+
+    def enable_culling(self, chunk_size: int = 256) -> None:
+        """
+        Only draw the sprites near the area visible to the current camera.
+
+        The sprites are grouped in chunks of ``chunk_size`` sprites in draw
+        order and the bounds of each chunk are tracked. When drawing, only
+        the chunks overlapping the view of the current camera are rendered.
+        The view is :py:meth:`Camera2D.aabb() <arcade.Camera2D.aabb>` for a
+        :py:class:`~arcade.Camera2D` or the unprojected viewport for other
+        projectors. :py:attr:`sprites_drawn` and :py:attr:`sprites_culled`
+        report the result of the last draw.
+
+        This is meant for large lists of sprites that rarely move, such as
+        tile map layers where neighbouring sprites are added in sequence.
+        Moving, resizing or reordering sprites recalculates the bounds of
+        their chunks on the next draw. Sprites far apart in the list that
+        change in the same frame recalculate every chunk between them.
+        Drawing with a projection not set by the current camera will cull
+        the wrong sprites.
+
+        Args:
+            chunk_size: The number of sprites in each chunk.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer")
+        self._cull_chunk_size = chunk_size
+        self._cull_bounds = None
+
+    def disable_culling(self) -> None:
+        """Draw all sprites again. See :py:meth:`enable_culling`."""
+        self._cull_chunk_size = 0
+        self._cull_bounds = None
+
+    def _get_chunk_bounds(self, chunk: int) -> tuple[float, float, float, float]:
+        """
+        Calculate the ``left, bottom, right, top`` bounds of a chunk.
+
+        Each sprite is padded by half its width and height in every
+        direction, so the bounds still hold for rotated sprites.
+        """
+        chunk_size = self._cull_chunk_size
+        pos_data = self._sprite_pos_data
+        size_data = self._sprite_size_data
+        start = chunk * chunk_size
+        end = min(start + chunk_size, self._sprite_index_slots)
+
+        left = bottom = float("inf")
+        right = top = float("-inf")
+        for slot in self._sprite_index_data[start:end]:
+            x = pos_data[slot * 3]
+            y = pos_data[slot * 3 + 1]
+            # Half of the width plus the height covers the half diagonal
+            extent = (abs(size_data[slot * 2]) + abs(size_data[slot * 2 + 1])) / 2
+            if x - extent < left:
+                left = x - extent
+            if x + extent > right:
+                right = x + extent
+            if y - extent < bottom:
+                bottom = y - extent
+            if y + extent > top:
+                top = y + extent
+        return left, bottom, right, top
+
+    def _build_cull_bounds(self) -> array:
+        """
+        Calculate the ``left, bottom, right, top`` bounds of each chunk.
+
+        This also maps each sprite buffer slot to its chunk so
+        :py:meth:`_update_cull_bounds` can find the changed chunks.
+        """
+        chunk_size = self._cull_chunk_size
+        slots = self._sprite_index_slots
+        slot_chunk = array("i", [-1]) * self._buf_capacity
+        for i, slot in enumerate(self._sprite_index_data[:slots]):
+            slot_chunk[slot] = i // chunk_size
+        self._cull_slot_chunk = slot_chunk
+
+        bounds = array("f")
+        for chunk in range(-(-slots // chunk_size)):
+            bounds.extend(self._get_chunk_bounds(chunk))
+        return bounds
+
+    def _update_cull_bounds(self) -> None:
+        """
+        Recalculate the bounds of the chunks with changed sprites.
+
+        The chunks are found from the dirty slot ranges of the position,
+        size and index buffers. If a whole buffer changed, all the bounds
+        are rebuilt on the next draw instead.
+        """
+        bounds = self._cull_bounds
+        if bounds is None:
+            return
+        if self._sprite_pos_changed or self._sprite_size_changed or self._sprite_index_changed:
+            self._cull_bounds = None
+            return
+
+        chunk_size = self._cull_chunk_size
+        slot_chunk = self._cull_slot_chunk
+        chunks: set[int] = set()
+        for start, end in (self._sprite_pos_dirty, self._sprite_size_dirty):
+            chunks.update(slot_chunk[start:end])
+
+        start, end = self._sprite_index_dirty
+        if start < end:
+            # Sprites in the changed part of the draw order can be in new chunks
+            index_data = self._sprite_index_data
+            for i in range(start, min(end, self._sprite_index_slots)):
+                slot_chunk[index_data[i]] = i // chunk_size
+            chunks.update(range(start // chunk_size, (end - 1) // chunk_size + 1))
+
+        # Adding and removing sprites changes the number of chunks
+        chunk_count = -(-self._sprite_index_slots // chunk_size)
+        if len(bounds) > chunk_count * 4:
+            del bounds[chunk_count * 4 :]
+        elif len(bounds) < chunk_count * 4:
+            chunks.update(range(len(bounds) // 4, chunk_count))
+            bounds.extend([0.0] * (chunk_count * 4 - len(bounds)))
+
+        for chunk in chunks:
+            if 0 <= chunk < chunk_count:
+                bounds[chunk * 4 : chunk * 4 + 4] = array("f", self._get_chunk_bounds(chunk))
+
+    def _get_visible_ranges(self) -> list[tuple[int, int]]:
+        """
+        Get the ``(first, count)`` ranges of the index buffer to render.
+
+        Adjacent visible chunks are merged into one range.
+        """
+        if self._cull_bounds is None:
+            self._cull_bounds = self._build_cull_bounds()
+
+        bounds = self._cull_bounds
+        chunk_size = self._cull_chunk_size
+        slots = self._sprite_index_slots
+        view_left, view_bottom, view_right, view_top = _get_view_bounds(self.ctx)
+
+        ranges: list[tuple[int, int]] = []
+        for chunk in range(len(bounds) // 4):
+            i = chunk * 4
+            if (
+                bounds[i + 2] < view_left
+                or bounds[i] > view_right
+                or bounds[i + 3] < view_bottom
+                or bounds[i + 1] > view_top
+            ):
+                continue
+            first = chunk * chunk_size
+            count = min(chunk_size, slots - first)
+            if ranges and sum(ranges[-1]) == first:
+                ranges[-1] = ranges[-1][0], ranges[-1][1] + count
+            else:
+                ranges.append((first, count))
+
+        return ranges
+
     def _recalculate_spatial_hashes(self) -> None:
         if self.spatial_hash is None:
             from .spatial_hash import SpatialHash
@@ -968,6 +1360,12 @@ def write_sprite_buffers_to_gpu(self) -> None:
         self._write_sprite_buffers_to_gpu()
 
     def _write_sprite_buffers_to_gpu(self) -> None:
+        # Apply pending removals before the index buffer is written
+        self._normalize_index_buffer()
+
+        # Culling bounds depend on positions, sizes and the draw order
+        self._update_cull_bounds()
+
         # LOG.debug(
         #     (
         #         "[%s] SpriteList._write_sprite_buffers_to_gpu: "
@@ -982,36 +1380,113 @@ def _write_sprite_buffers_to_gpu(self) -> None:
         #     self._sprite_index_changed,
         # )
 
-        if self._sprite_pos_changed and self._sprite_pos_buf:
-            self._sprite_pos_buf.orphan()
-            self._sprite_pos_buf.write(self._sprite_pos_data)
+        if self._sprite_pos_buf:
+            self._write_buffer(
+                self._sprite_pos_buf,
+                self._sprite_pos_data,
+                self._sprite_pos_changed,
+                self._sprite_pos_dirty,
+                3,
+            )
             self._sprite_pos_changed = False
 
-        if self._sprite_size_changed and self._sprite_size_buf:
-            self._sprite_size_buf.orphan()
-            self._sprite_size_buf.write(self._sprite_size_data)
+        if self._sprite_size_buf:
+            self._write_buffer(
+                self._sprite_size_buf,
+                self._sprite_size_data,
+                self._sprite_size_changed,
+                self._sprite_size_dirty,
+                2,
+            )
             self._sprite_size_changed = False
 
-        if self._sprite_angle_changed and self._sprite_angle_buf:
-            self._sprite_angle_buf.orphan()
-            self._sprite_angle_buf.write(self._sprite_angle_data)
+        if self._sprite_angle_buf:
+            self._write_buffer(
+                self._sprite_angle_buf,
+                self._sprite_angle_data,
+                self._sprite_angle_changed,
+                self._sprite_angle_dirty,
+                1,
+            )
             self._sprite_angle_changed = False
 
-        if self._sprite_color_changed and self._sprite_color_buf:
-            self._sprite_color_buf.orphan()
-            self._sprite_color_buf.write(self._sprite_color_data)
+        if self._sprite_color_buf:
+            self._write_buffer(
+                self._sprite_color_buf,
+                self._sprite_color_data,
+                self._sprite_color_changed,
+                self._sprite_color_dirty,
+                4,
+            )
             self._sprite_color_changed = False
 
-        if self._sprite_texture_changed and self._sprite_texture_buf:
-            self._sprite_texture_buf.orphan()
-            self._sprite_texture_buf.write(self._sprite_texture_data)
+        if self._sprite_texture_buf:
+            self._write_buffer(
+                self._sprite_texture_buf,
+                self._sprite_texture_data,
+                self._sprite_texture_changed,
+                self._sprite_texture_dirty,
+                1,
+            )
             self._sprite_texture_changed = False
 
-        if self._sprite_index_changed and self._sprite_index_buf:
-            self._sprite_index_buf.orphan()
-            self._sprite_index_buf.write(self._sprite_index_data)
+        if self._sprite_index_buf:
+            self._write_buffer(
+                self._sprite_index_buf,
+                self._sprite_index_data,
+                self._sprite_index_changed,
+                self._sprite_index_dirty,
+                1,
+                used_slots=self._sprite_index_slots,
+            )
             self._sprite_index_changed = False
 
+    def _write_buffer(
+        self,
+        buffer: Buffer,
+        data: array,
+        changed: bool,
+        dirty: list[int],
+        components: int,
+        used_slots: int | None = None,
+    ) -> None:
+        """
+        Write the changed part of a sprite buffer to its OpenGL buffer.
+
+        Only the dirty range is written unless the whole buffer changed or
+        the range covers more than :py:attr:`PARTIAL_UPLOAD_THRESHOLD`
+        of the used slots. In that case the buffer is orphaned and
+        written in full.
+
+        Args:
+            buffer: The OpenGL buffer
+            data: The python side buffer data
+            changed: If the whole buffer needs to be written
+            dirty: The dirty ``[start, end)`` slot range
+            components: Number of values per slot
+            used_slots: Number of used slots (defaults to the sprite buffer slots)
+        """
+        start, end = dirty
+        if not changed and start >= end:
+            return
+
+        dirty[0] = _NO_DIRTY_SLOT
+        dirty[1] = 0
+
+        if used_slots is None:
+            used_slots = self._sprite_buffer_slots
+
+        if not changed and end - start <= used_slots * self.PARTIAL_UPLOAD_THRESHOLD:
+            view = memoryview(data)[start * components : end * components]
+            buffer.write(view, offset=start * components * data.itemsize)
+            self.upload_bytes += view.nbytes
+            self.partial_uploads += 1
+        else:
+            buffer.orphan()
+            buffer.write(data)
+            self.upload_bytes += min(buffer.size, len(data) * data.itemsize)
+            self.full_uploads += 1
+
     def initialize(self) -> None:
         """
         Request immediate creation of OpenGL resources for this list.
@@ -1108,11 +1583,25 @@ def draw(
         atlas.use_uv_texture(1)
         if not self._geometry:
             raise ValueError("Attempting to render without '_geometry' field being set.")
-        self._geometry.render(
-            self.program,
-            mode=self.ctx.POINTS,
-            vertices=self._sprite_index_slots,
-        )
+        if self._cull_chunk_size:
+            drawn = 0
+            for first, count in self._get_visible_ranges():
+                self._geometry.render(
+                    self.program,
+                    mode=self.ctx.POINTS,
+                    first=first,
+                    vertices=count,
+                )
+                drawn += count
+        else:
+            drawn = self._sprite_index_slots
+            self._geometry.render(
+                self.program,
+                mode=self.ctx.POINTS,
+                vertices=drawn,
+            )
+        self.sprites_drawn = drawn
+        self.sprites_culled = self._sprite_index_slots - drawn
 
         # Leave global states to default
         if self._blend:
@@ -1140,18 +1629,32 @@ def _normalize_index_buffer(self) -> None:
         The other buffers don't need this because they re-use slots.
         New sprites on the other hand always needs to be added
         to the end of the index buffer to preserve order
+
+        Removals are deferred until this is called. The sprite list
+        and index buffer are then rebuilt in a single pass and the
+        slots of the removed sprites can be reused.
         """
-        # NOTE: Currently we keep the index buffer normalized
-        #       but we can increase the performance in the future
-        #       delaying normalization.
-        # Need counter for how many slots are used in index buffer.
-        # 1) Sort the deleted indices (descending) and pop() them in a loop
-        # 2) Create a new array.array and manually copy every
-        #    item in the list except the deleted index slots
-        # 3) Use a transform (gpu) to trim the index buffer and
-        #    read this buffer back into a new array using array.from_bytes
-        # NOTE: Right now the index buffer is always normalized
-        pass
+        removed = self._sprites_removed
+        if not removed:
+            return
+
+        removed_slots = set(removed.values())
+        self._sprite_list = [sprite for sprite in self._sprite_list if sprite not in removed]
+        index_data = array(
+            self._sprite_index_data.typecode,
+            [
+                slot
+                for slot in self._sprite_index_data[: self._sprite_index_slots]
+                if slot not in removed_slots
+            ],
+        )
+        self._sprite_index_slots = len(index_data)
+        index_data.extend([0] * (self._idx_capacity - self._sprite_index_slots))
+        self._sprite_index_data = index_data
+
+        self._sprite_buffer_free_slots.extend(removed.values())
+        removed.clear()
+        self._sprite_index_changed = True
 
     def _grow_sprite_buffers(self) -> None:
         """Double the internal buffer sizes"""
@@ -1159,9 +1662,12 @@ def _grow_sprite_buffers(self) -> None:
         if self._sprite_buffer_slots <= self._buf_capacity:
             return
 
-        # Double the capacity
-        extend_by = self._buf_capacity
-        self._buf_capacity = self._buf_capacity * 2
+        # Double the capacity until all the slots fit
+        capacity = self._buf_capacity
+        while capacity < self._sprite_buffer_slots:
+            capacity *= 2
+        extend_by = capacity - self._buf_capacity
+        self._buf_capacity = capacity
 
         # LOG.debug(
         #     "(%s) Increasing buffer capacity from %s to %s",
@@ -1179,11 +1685,11 @@ def _grow_sprite_buffers(self) -> None:
 
         if self._initialized:
             # Proper initialization implies these buffers are allocated
-            self._sprite_pos_buf.orphan(double=True)  # type: ignore
-            self._sprite_size_buf.orphan(double=True)  # type: ignore
-            self._sprite_angle_buf.orphan(double=True)  # type: ignore
-            self._sprite_color_buf.orphan(double=True)  # type: ignore
-            self._sprite_texture_buf.orphan(double=True)  # type: ignore
+            self._sprite_pos_buf.orphan(size=capacity * 12)  # type: ignore
+            self._sprite_size_buf.orphan(size=capacity * 8)  # type: ignore
+            self._sprite_angle_buf.orphan(size=capacity * 4)  # type: ignore
+            self._sprite_color_buf.orphan(size=capacity * 4)  # type: ignore
+            self._sprite_texture_buf.orphan(size=capacity * 4)  # type: ignore
 
         self._sprite_pos_changed = True
         self._sprite_size_changed = True
@@ -1196,8 +1702,12 @@ def _grow_index_buffer(self) -> None:
         if self._sprite_index_slots <= self._idx_capacity:
             return
 
-        extend_by = self._idx_capacity
-        self._idx_capacity = self._idx_capacity * 2
+        # Double the capacity until all the slots fit
+        capacity = self._idx_capacity
+        while capacity < self._sprite_index_slots:
+            capacity *= 2
+        extend_by = capacity - self._idx_capacity
+        self._idx_capacity = capacity
 
         # LOG.debug(
         #     "Buffers: index_slots=%s sprite_slots=%s over-allocation-ratio=%s",
@@ -1232,20 +1742,20 @@ def _update_all(self, sprite: SpriteType) -> None:
         self._sprite_pos_data[slot * 3] = sprite._position[0]
         self._sprite_pos_data[slot * 3 + 1] = sprite._position[1]
         self._sprite_pos_data[slot * 3 + 2] = sprite._depth
-        self._sprite_pos_changed = True
+        _mark_dirty(self._sprite_pos_dirty, slot, slot + 1)
         # size
         self._sprite_size_data[slot * 2] = sprite._width
         self._sprite_size_data[slot * 2 + 1] = sprite._height
-        self._sprite_size_changed = True
+        _mark_dirty(self._sprite_size_dirty, slot, slot + 1)
         # angle
         self._sprite_angle_data[slot] = sprite._angle
-        self._sprite_angle_changed = True
+        _mark_dirty(self._sprite_angle_dirty, slot, slot + 1)
         # color
         self._sprite_color_data[slot * 4] = sprite._color[0]
         self._sprite_color_data[slot * 4 + 1] = sprite._color[1]
         self._sprite_color_data[slot * 4 + 2] = sprite._color[2]
         self._sprite_color_data[slot * 4 + 3] = sprite._color[3]
-        self._sprite_color_changed = True
+        _mark_dirty(self._sprite_color_dirty, slot, slot + 1)
 
         # Don't deal with textures if spritelist is not initialized.
         # This can often mean we don't have a context/window yet.
@@ -1260,7 +1770,7 @@ def _update_all(self, sprite: SpriteType) -> None:
         slot = self.sprite_slot[sprite]
 
         self._sprite_texture_data[slot] = tex_slot
-        self._sprite_texture_changed = True
+        _mark_dirty(self._sprite_texture_dirty, slot, slot + 1)
 
     def _update_texture(self, sprite: SpriteType) -> None:
         """
@@ -1282,13 +1792,13 @@ def _update_texture(self, sprite: SpriteType) -> None:
         slot = self.sprite_slot[sprite]
 
         self._sprite_texture_data[slot] = tex_slot
-        self._sprite_texture_changed = True
+        _mark_dirty(self._sprite_texture_dirty, slot, slot + 1)
 
         # Update size in cas the sprite was initialized without size
         # NOTE: There should be a better way to do this
         self._sprite_size_data[slot * 2] = sprite._width
         self._sprite_size_data[slot * 2 + 1] = sprite._height
-        self._sprite_size_changed = True
+        _mark_dirty(self._sprite_size_dirty, slot, slot + 1)
 
     def _update_position(self, sprite: SpriteType) -> None:
         """
@@ -1304,7 +1814,7 @@ def _update_position(self, sprite: SpriteType) -> None:
         slot = self.sprite_slot[sprite]
         self._sprite_pos_data[slot * 3] = sprite._position[0]
         self._sprite_pos_data[slot * 3 + 1] = sprite._position[1]
-        self._sprite_pos_changed = True
+        _mark_dirty(self._sprite_pos_dirty, slot, slot + 1)
 
     def _update_position_x(self, sprite: SpriteType) -> None:
         """
@@ -1319,7 +1829,7 @@ def _update_position_x(self, sprite: SpriteType) -> None:
         """
         slot = self.sprite_slot[sprite]
         self._sprite_pos_data[slot * 3] = sprite._position[0]
-        self._sprite_pos_changed = True
+        _mark_dirty(self._sprite_pos_dirty, slot, slot + 1)
 
     def _update_position_y(self, sprite: SpriteType) -> None:
         """
@@ -1334,7 +1844,7 @@ def _update_position_y(self, sprite: SpriteType) -> None:
         """
         slot = self.sprite_slot[sprite]
         self._sprite_pos_data[slot * 3 + 1] = sprite._position[1]
-        self._sprite_pos_changed = True
+        _mark_dirty(self._sprite_pos_dirty, slot, slot + 1)
 
     def _update_depth(self, sprite: SpriteType) -> None:
         """
@@ -1346,7 +1856,7 @@ def _update_depth(self, sprite: SpriteType) -> None:
         """
         slot = self.sprite_slot[sprite]
         self._sprite_pos_data[slot * 3 + 2] = sprite._depth
-        self._sprite_pos_changed = True
+        _mark_dirty(self._sprite_pos_dirty, slot, slot + 1)
 
     def _update_color(self, sprite: SpriteType) -> None:
         """
@@ -1362,7 +1872,7 @@ def _update_color(self, sprite: SpriteType) -> None:
         self._sprite_color_data[slot * 4 + 1] = int(sprite._color[1])
         self._sprite_color_data[slot * 4 + 2] = int(sprite._color[2])
         self._sprite_color_data[slot * 4 + 3] = int(sprite._color[3] * sprite._visible)
-        self._sprite_color_changed = True
+        _mark_dirty(self._sprite_color_dirty, slot, slot + 1)
 
     def _update_size(self, sprite: SpriteType) -> None:
         """
@@ -1375,7 +1885,7 @@ def _update_size(self, sprite: SpriteType) -> None:
         slot = self.sprite_slot[sprite]
         self._sprite_size_data[slot * 2] = sprite._width
         self._sprite_size_data[slot * 2 + 1] = sprite._height
-        self._sprite_size_changed = True
+        _mark_dirty(self._sprite_size_dirty, slot, slot + 1)
 
     def _update_width(self, sprite: SpriteType) -> None:
         """
@@ -1387,7 +1897,7 @@ def _update_width(self, sprite: SpriteType) -> None:
         """
         slot = self.sprite_slot[sprite]
         self._sprite_size_data[slot * 2] = sprite._width
-        self._sprite_size_changed = True
+        _mark_dirty(self._sprite_size_dirty, slot, slot + 1)
 
     def _update_height(self, sprite: SpriteType) -> None:
         """
@@ -1399,7 +1909,7 @@ def _update_height(self, sprite: SpriteType) -> None:
         """
         slot = self.sprite_slot[sprite]
         self._sprite_size_data[slot * 2 + 1] = sprite._height
-        self._sprite_size_changed = True
+        _mark_dirty(self._sprite_size_dirty, slot, slot + 1)
 
     def _update_angle(self, sprite: SpriteType) -> None:
         """
@@ -1411,4 +1921,20 @@ def _update_angle(self, sprite: SpriteType) -> None:
         """
         slot = self.sprite_slot[sprite]
         self._sprite_angle_data[slot] = sprite._angle
-        self._sprite_angle_changed = True
+        _mark_dirty(self._sprite_angle_dirty, slot, slot + 1)
+
+    def _update_position_and_angle(self, sprite: SpriteType) -> None:
+        """
+        Update both the position and angle of a sprite in one call.
+
+        Called by :py:meth:`Sprite.set_position_and_angle() <arcade.Sprite.set_position_and_angle>`.
+
+        Args:
+            sprite: Sprite to update.
+        """
+        slot = self.sprite_slot[sprite]
+        self._sprite_pos_data[slot * 3] = sprite._position[0]
+        self._sprite_pos_data[slot * 3 + 1] = sprite._position[1]
+        _mark_dirty(self._sprite_pos_dirty, slot, slot + 1)
+        self._sprite_angle_data[slot] = sprite._angle
+        _mark_dirty(self._sprite_angle_dirty, slot, slot + 1)
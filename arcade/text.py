@@ -15,7 +15,7 @@
 from arcade.texture_atlas import TextureAtlasBase
 from arcade.types import Color, Point, RGBOrA255
 
-__all__ = ["load_font", "Text", "create_text_sprite", "draw_text"]
+__all__ = ["load_font", "Text", "TextBatch", "GlyphText", "create_text_sprite", "draw_text"]
 
 
 def load_font(path: str | Path) -> None:
@@ -91,6 +91,29 @@ def _attempt_font_name_resolution(font_name: FontNameOrNames) -> str:
     raise ValueError(f"Couldn't find a font for {font_name!r}")
 
 
+def _get_style_key(
+    font_size: float,
+    font_name: FontNameOrNames,
+    bold: bool | str,
+    italic: bool,
+    anchor_x: str,
+    anchor_y: str,
+    align: str,
+    width: int | None,
+    multiline: bool,
+) -> str:
+    """
+    Get a key for the label settings that are expensive to change.
+
+    Labels with the same key only differ in text, position, color
+    and rotation, so they can be reused for each other.
+    """
+    return (
+        f"{font_size}|{font_name}|{bold}|{italic}|{anchor_x}|{anchor_y}"
+        f"|{align}|{width}|{multiline}"
+    )
+
+
 def _draw_pyglet_label(label: pyglet.text.Label) -> None:
     """
     Helper for drawing pyglet labels with rotation within arcade.
@@ -138,6 +161,8 @@ class Text:
 
        The text instances an also be modified while in the batch
        such as changing the text value, position, or color.
+       For large amounts of text changing every frame, see
+       :py:class:`~arcade.TextBatch`.
 
     The constructor arguments work identically to those of
     :py:func:`~arcade.draw_text`. See its documentation for in-depth
@@ -549,6 +574,20 @@ def multiline(self) -> bool:
     def multiline(self, multiline: bool):
         self._label.multiline = multiline
 
+    @property
+    def visible(self) -> bool:
+        """
+        Get or set if the text is visible.
+
+        Hidden text keeps its layout but is skipped when its batch is drawn.
+        """
+        return self._label.visible
+
+    @visible.setter
+    def visible(self, visible: bool):
+        if self._label.visible != visible:
+            self._label.visible = visible
+
     def draw(self) -> None:
         """
         Draw the label to the screen at its current ``x`` and ``y`` position.
@@ -562,6 +601,14 @@ def draw(self) -> None:
         """
         _draw_pyglet_label(self._label)
 
+    def delete(self) -> None:
+        """
+        Delete the underlying pyglet label and free its vertex data.
+
+        The text can't be drawn after this.
+        """
+        self._label.delete()
+
     def draw_debug(
         self,
         anchor_color: RGBOrA255 = arcade.color.RED,
@@ -614,6 +661,472 @@ def position(self, point: Point):
             self._label.position = x, y, self._label.z
 
 
+class TextBatch:
+    """
+    Draws large amounts of changing text with a single pyglet batch.
+
+    Text is added every frame with :py:meth:`draw_text`, which takes the
+    same arguments as :py:func:`~arcade.draw_text`, and everything added
+    since the last :py:meth:`draw` is drawn at once. The labels are kept
+    between frames. A label showing the same text with the same style in
+    the next frame is reused as is, so only its position and color are
+    updated. Otherwise a label with the same style is given the new text
+    before a new label is created. Labels that are not used in a frame
+    are hidden and kept around for later frames.
+
+    Example::
+
+        text_batch = arcade.TextBatch()
+
+        def on_draw():
+            for unit in units:
+                text_batch.draw_text(unit.name, unit.center_x, unit.top, font_size=10)
+            text_batch.draw()
+
+    :py:class:`~arcade.Text` instances can be added to :py:attr:`batch`
+    to be drawn together with the labels of this batch.
+
+    Args:
+        max_unused:
+            The maximum number of hidden labels to keep
+            for later frames. The rest are deleted.
+    """
+
+    def __init__(self, max_unused: int = 1024):
+        self._batch = pyglet.graphics.Batch()
+        self._max_unused = max_unused
+        # Labels added since the last draw as (style, text, label)
+        self._used: list[tuple[str, str, Text]] = []
+        # style -> text -> labels drawn in the previous frame or hidden
+        self._free: dict[str, dict[str, list[Text]]] = {}
+        self._free_count = 0
+        self.created = 0
+        """Number of labels created"""
+        self.reused = 0
+        """Number of labels reused with the same text"""
+        self.changed = 0
+        """Number of labels reused with new text"""
+
+    @property
+    def batch(self) -> pyglet.graphics.Batch:
+        """The pyglet batch the labels are in (read only)."""
+        return self._batch
+
+    @property
+    def max_unused(self) -> int:
+        """Get or set the maximum number of hidden labels to keep."""
+        return self._max_unused
+
+    @max_unused.setter
+    def max_unused(self, value: int) -> None:
+        self._max_unused = value
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Counters and current number of labels."""
+        return {
+            "labels": len(self._used) + self._free_count,
+            "created": self.created,
+            "reused": self.reused,
+            "changed": self.changed,
+        }
+
+    def __len__(self) -> int:
+        """The number of labels added since the last draw."""
+        return len(self._used)
+
+    def draw_text(
+        self,
+        text: Any,
+        x: float,
+        y: float,
+        color: RGBOrA255 = arcade.color.WHITE,
+        font_size: float = 12,
+        width: int | None = None,
+        align: str = "left",
+        font_name: FontNameOrNames = ("calibri", "arial"),
+        bold: bool | str = False,
+        italic: bool = False,
+        anchor_x: str = "left",
+        anchor_y: str = "baseline",
+        multiline: bool = False,
+        rotation: float = 0,
+        z: float = 0,
+    ) -> Text:
+        """
+        Add text to be drawn by the next :py:meth:`draw`.
+
+        See :py:func:`~arcade.draw_text` for the arguments.
+
+        Returns:
+            The label showing the text. It belongs to the batch and
+            can be changed or reused by later calls.
+        """
+        text = str(text)
+        color = Color.from_iterable(color)
+        key = _get_style_key(
+            font_size, font_name, bold, italic, anchor_x, anchor_y, align, width, multiline
+        )
+
+        label = None
+        variants = self._free.get(key)
+        if variants:
+            free_text = text if text in variants else next(iter(variants))
+            labels = variants[free_text]
+            label = labels.pop()
+            if free_text == text:
+                self.reused += 1
+            else:
+                # Give a label of the same style the new text
+                label.text = text
+                self.changed += 1
+            if not labels:
+                del variants[free_text]
+                if not variants:
+                    del self._free[key]
+            self._free_count -= 1
+
+        if label is None:
+            label = Text(
+                text,
+                x,
+                y,
+                color=color,
+                font_size=font_size,
+                width=width,
+                align=align,
+                font_name=font_name,
+                bold=bold,
+                italic=italic,
+                anchor_x=anchor_x,
+                anchor_y=anchor_y,
+                multiline=multiline,
+                rotation=rotation,
+                batch=self._batch,
+                z=z,
+            )
+            self.created += 1
+        else:
+            if label.x != x or label.y != y or label.z != z:
+                label.position = x, y, z
+            if label.color != color:
+                label.color = color
+            if label.rotation != rotation:
+                label.rotation = rotation
+            label.visible = True
+
+        self._used.append((key, text, label))
+        return label
+
+    def draw(self) -> None:
+        """
+        Draw the text added since the last draw.
+
+        Labels from earlier frames that were not added again are hidden.
+        """
+        free = self._free
+        for variants in free.values():
+            for labels in variants.values():
+                for label in labels:
+                    label.visible = False
+
+        self._batch.draw()
+
+        # Labels drawn in this frame are the first candidates for the next.
+        # Hidden labels are kept after them until there are too many.
+        self._free = {}
+        self._free_count = 0
+        for key, text, label in self._used:
+            self._add_free(key, text, label)
+        self._used.clear()
+
+        unused = 0
+        for key, variants in free.items():
+            for text, labels in variants.items():
+                for label in labels:
+                    if unused < self._max_unused:
+                        self._add_free(key, text, label)
+                        unused += 1
+                    else:
+                        label._label.delete()
+
+    def clear(self) -> None:
+        """Delete all labels."""
+        for _, _, label in self._used:
+            label._label.delete()
+        for variants in self._free.values():
+            for labels in variants.values():
+                for label in labels:
+                    label._label.delete()
+        self._used.clear()
+        self._free.clear()
+        self._free_count = 0
+
+    def _add_free(self, key: str, text: str, label: Text) -> None:
+        self._free.setdefault(key, {}).setdefault(text, []).append(label)
+        self._free_count += 1
+
+    def __repr__(self) -> str:
+        return f"<TextBatch labels={len(self._used) + self._free_count}>"
+
+
+class GlyphText:
+    """
+    Text drawn as a run of glyph sprites in a :py:class:`~arcade.SpriteList`.
+
+    Each glyph is rendered once for every font, size and style into the
+    texture atlas of the sprite list (see :py:class:`~arcade.cache.GlyphCache`).
+    Changing the text only changes the textures and positions of the glyph
+    sprites, so text changing every frame such as scores and timers doesn't
+    allocate any atlas space. Sprites left over when the text gets shorter
+    are hidden and reused later.
+
+    Several instances can share a sprite list to draw them all at once::
+
+        sprite_list = arcade.SpriteList()
+        score = arcade.GlyphText("Score: 0", 10, 10, sprite_list=sprite_list)
+        timer = arcade.GlyphText("00:00", 10, 40, sprite_list=sprite_list)
+        ...
+        score.text = f"Score: {points}"
+        sprite_list.draw()
+
+    Glyphs are placed next to each other without kerning, and ``"\\n"``
+    starts a new line. Use :py:class:`~arcade.Text` for anything more
+    advanced such as word wrapping or rotation.
+
+    Args:
+        text: Initial text to display. Can be an empty string
+        x: x position to align the text's anchor point with
+        y: y position to align the text's anchor point with
+        color (optional): Color of the text as an RGBA tuple or a
+            :py:class:`~arcade.types.Color` instance.
+        font_size (optional): Size of the text in points
+        font_name (optional): A font name, path to a font file, or list of names
+        bold (optional): Whether to draw the text as bold, and if a string,
+              how bold.
+        italic (optional): Whether to draw the text as italic
+        anchor_x (optional): How to calculate the anchor point's x coordinate.
+                  Options: "left", "center", or "right"
+        anchor_y (optional): How to calculate the anchor point's y coordinate.
+                  Options: "top", "bottom", "center", or "baseline".
+        sprite_list (optional): The sprite list to add the glyph sprites to.
+            A new sprite list is created if this is None.
+    """
+
+    def __init__(
+        self,
+        text: Any,
+        x: float,
+        y: float,
+        color: RGBOrA255 = arcade.color.WHITE,
+        font_size: float = 12,
+        font_name: FontNameOrNames = ("calibri", "arial"),
+        bold: bool | str = False,
+        italic: bool = False,
+        anchor_x: str = "left",
+        anchor_y: str = "baseline",
+        sprite_list: arcade.SpriteList | None = None,
+    ):
+        if anchor_x not in ("left", "center", "right"):
+            raise ValueError("The 'anchor_x' parameter must be 'left', 'center' or 'right'.")
+        if anchor_y not in ("top", "bottom", "center", "baseline"):
+            raise ValueError(
+                "The 'anchor_y' parameter must be 'top', 'bottom', 'center' or 'baseline'."
+            )
+
+        self._ctx = arcade.get_window().ctx
+        self._text = str(text)
+        self._x = x
+        self._y = y
+        self._color = Color.from_iterable(color)
+        self._font_size = font_size
+        self._font_name = font_name
+        self._bold = bold
+        self._italic = italic
+        self._anchor_x = anchor_x
+        self._anchor_y = anchor_y
+        self._sprite_list = arcade.SpriteList() if sprite_list is None else sprite_list
+        self._atlas = self._sprite_list.atlas or self._ctx.default_atlas
+        # Glyph sprites in the order of the text, followed by hidden ones
+        self._sprites: list[arcade.Sprite] = []
+        self._visible_count = 0
+        self._content_width = 0.0
+        self._content_height = 0.0
+        self._layout()
+
+    @property
+    def text(self) -> str:
+        """
+        Get or set the text to display.
+
+        The value assigned will be converted to a string.
+        """
+        return self._text
+
+    @text.setter
+    def text(self, value: Any):
+        value = str(value)
+        if value == self._text:
+            return
+        self._text = value
+        self._layout()
+
+    @property
+    def x(self) -> float:
+        """Get or set the x coordinate of the anchor point."""
+        return self._x
+
+    @x.setter
+    def x(self, x: float):
+        self.position = x, self._y
+
+    @property
+    def y(self) -> float:
+        """Get or set the y coordinate of the anchor point."""
+        return self._y
+
+    @y.setter
+    def y(self, y: float):
+        self.position = self._x, y
+
+    @property
+    def position(self) -> Point:
+        """Get or set the anchor point as a tuple."""
+        return self._x, self._y
+
+    @position.setter
+    def position(self, point: Point):
+        x, y = point[0], point[1]
+        dx, dy = x - self._x, y - self._y
+        if dx == 0 and dy == 0:
+            return
+        self._x, self._y = x, y
+        for sprite in self._sprites[: self._visible_count]:
+            cx, cy = sprite.position
+            sprite.position = cx + dx, cy + dy
+
+    @property
+    def color(self) -> Color:
+        """Get or set the color of the text."""
+        return self._color
+
+    @color.setter
+    def color(self, color: RGBOrA255):
+        self._color = Color.from_iterable(color)
+        for sprite in self._sprites:
+            sprite.color = self._color
+
+    @property
+    def content_width(self) -> float:
+        """The width of the widest line of text (read only)."""
+        return self._content_width
+
+    @property
+    def content_height(self) -> float:
+        """The height of all the lines of text (read only)."""
+        return self._content_height
+
+    @property
+    def sprite_list(self) -> arcade.SpriteList:
+        """The sprite list containing the glyph sprites (read only)."""
+        return self._sprite_list
+
+    @property
+    def sprites(self) -> list[arcade.Sprite]:
+        """The visible glyph sprites in the order of the text (read only)."""
+        return self._sprites[: self._visible_count]
+
+    def draw(self) -> None:
+        """
+        Draw the sprite list containing the text.
+
+        This draws the other text sharing the sprite list as well.
+        """
+        self._sprite_list.draw()
+
+    def delete(self) -> None:
+        """Remove the glyph sprites from the sprite list."""
+        for sprite in self._sprites:
+            self._sprite_list.remove(sprite)
+        self._sprites.clear()
+        self._visible_count = 0
+
+    def _layout(self) -> None:
+        """Place a glyph sprite for each visible character."""
+        cache = self._ctx.glyph_cache
+        lines = []
+        for line in self._text.split("\n"):
+            glyphs = [
+                cache.get(
+                    char,
+                    self._atlas,
+                    font_size=self._font_size,
+                    font_name=self._font_name,
+                    bold=self._bold,
+                    italic=self._italic,
+                )
+                for char in line
+            ]
+            lines.append((glyphs, sum(glyph.advance for glyph in glyphs)))
+
+        # Every glyph of the font has the same line height and baseline
+        metrics = cache.get(
+            " ",
+            self._atlas,
+            font_size=self._font_size,
+            font_name=self._font_name,
+            bold=self._bold,
+            italic=self._italic,
+        )
+        line_height, baseline = metrics.height, metrics.baseline
+        self._content_width = max(width for _, width in lines)
+        self._content_height = line_height * len(lines)
+
+        # y of the baseline of the first line
+        if self._anchor_y == "baseline":
+            line_y = self._y
+        elif self._anchor_y == "top":
+            line_y = self._y - line_height + baseline
+        elif self._anchor_y == "bottom":
+            line_y = self._y + self._content_height - line_height + baseline
+        else:
+            line_y = self._y + self._content_height / 2 - line_height + baseline
+
+        index = 0
+        sprites = self._sprites
+        for glyphs, width in lines:
+            if self._anchor_x == "left":
+                pen_x = self._x
+            elif self._anchor_x == "center":
+                pen_x = self._x - width / 2
+            else:
+                pen_x = self._x - width
+
+            for glyph in glyphs:
+                texture = glyph.texture
+                if texture is not None:
+                    if index < len(sprites):
+                        sprite = sprites[index]
+                        sprite.texture = texture
+                        sprite.visible = True
+                    else:
+                        sprite = arcade.Sprite(texture)
+                        sprite.color = self._color
+                        sprites.append(sprite)
+                        self._sprite_list.append(sprite)
+                    sprite.position = (
+                        pen_x + texture.width / 2,
+                        line_y - glyph.baseline + texture.height / 2,
+                    )
+                    index += 1
+                pen_x += glyph.advance
+            line_y -= line_height
+
+        for sprite in sprites[index:self._visible_count]:
+            sprite.visible = False
+        self._visible_count = index
+
+
 def create_text_sprite(
     text: str,
     color: RGBOrA255 = arcade.color.WHITE,
@@ -888,10 +1401,14 @@ def draw_text(
     # See : https://github.com/pyglet/pyglet/blob/ff30eadc2942553c9de96d6ce564ad1bc3128fb4/pyglet/text/__init__.py#L401
 
     color = Color.from_iterable(color)
-    # Cache the states that are expensive to change
-    key = f"{font_size}{font_name}{bold}{italic}{anchor_x}{anchor_y}{align}{width}{rotation}"
+    text = str(text)
+    # Cache the states that are expensive to change.
+    # Labels with different text are cached separately for each style.
+    key = _get_style_key(
+        font_size, font_name, bold, italic, anchor_x, anchor_y, align, width, multiline
+    )
     ctx = arcade.get_window().ctx
-    label = ctx.label_cache.get(key)
+    label = ctx.label_cache.get(key, text)
 
     if align not in ("left", "center", "right"):
         raise ValueError("The 'align' parameter must be equal to 'left', 'right', or 'center'.")
@@ -902,11 +1419,14 @@ def draw_text(
             f"but got {width!r}."
         )
 
-    if not label:
+    if label is None:
+        label = ctx.label_cache.take_reusable(key)
+
+    if label is None:
         adjusted_font = _attempt_font_name_resolution(font_name)
 
         label = arcade.Text(
-            text=str(text),
+            text=text,
             x=x,
             y=y,
             z=z,
@@ -922,11 +1442,12 @@ def draw_text(
             multiline=multiline,
             rotation=rotation,
         )
-        ctx.label_cache[key] = label
+        ctx.label_cache.put(key, text, label)
+    elif label.text != text:
+        # These updates are quite expensive
+        label.text = text
+        ctx.label_cache.put(key, text, label)
 
-    # These updates are quite expensive
-    if label.text != text:
-        label.text = str(text)
     if label.x != x or label.y != y or label.z != z:
         label.position = x, y, z  # type: ignore
     if label.color != color:
@@ -56,7 +56,7 @@ def load_texture(
     if im.mode != "RGBA":
         im = im.convert("RGBA")
 
-    im_data = ImageData(im, hash=hash)
+    im_data = ImageData(im, hash=hash, file_path=file_path)
     tex = Texture(im_data, hit_box_algorithm=hit_box_algorithm)
     tex.file_path = file_path
     return tex
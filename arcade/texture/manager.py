@@ -18,11 +18,31 @@
 from .texture import Texture
 
 
+def _texture_in_atlas(texture: Texture) -> bool:
+    """Check if a texture is in any live texture atlas."""
+    from arcade.texture_atlas.base import TextureAtlasBase
+
+    return any(atlas.has_texture(texture) for atlas in TextureAtlasBase.get_instances())
+
+
+def _image_in_atlas(image_data: ImageData) -> bool:
+    """Check if an image is in any live texture atlas."""
+    from arcade.texture_atlas.base import TextureAtlasBase
+
+    return any(atlas.has_image(image_data) for atlas in TextureAtlasBase.get_instances())
+
+
 class TextureCacheManager:
     """
     A simple manager wrapping texture, image data and hit box caches
     with convenient methods for loading textures and sprite sheets.
 
+    The caches are unbounded by default. Size budgets can be set on each
+    cache with ``max_entries`` and ``max_bytes``, evicting the least recently
+    used entries. Textures and images still in a texture atlas are never
+    evicted unless the cache was given its own ``in_use`` function.
+    See :py:attr:`stats` for hit, miss and eviction counters.
+
     Args:
         hit_box_cache:
             Optional hit box cache to use. If not specified, a new cache will be created.
@@ -30,6 +50,10 @@ class TextureCacheManager:
             Optional image data cache to use. If not specified, a new cache will be created.
         texture_cache:
             Optional texture cache to use. If not specified, a new cache will be created
+        hit_box_cache_dir:
+            Optional directory to persist hit boxes in when a new hit box
+            cache is created. Hit boxes calculated in earlier runs are then
+            loaded from it instead of being calculated again.
     """
 
     def __init__(
@@ -37,11 +61,16 @@ def __init__(
         hit_box_cache: HitBoxCache | None = None,
         image_data_cache: ImageDataCache | None = None,
         texture_cache: TextureCache | None = None,
+        hit_box_cache_dir: str | Path | None = None,
     ):
         self._sprite_sheets: dict[str, SpriteSheet] = {}
-        self._hit_box_cache = hit_box_cache or HitBoxCache()
+        self._hit_box_cache = hit_box_cache or HitBoxCache(hit_box_cache_dir)
         self._image_data_cache = image_data_cache or ImageDataCache()
         self._texture_cache = texture_cache or TextureCache()
+        if self._image_data_cache.in_use is None:
+            self._image_data_cache.in_use = _image_in_atlas
+        if self._texture_cache.in_use is None:
+            self._texture_cache.in_use = _texture_in_atlas
 
     @property
     def hit_box_cache(self) -> HitBoxCache:
@@ -62,6 +91,22 @@ def texture_cache(self) -> TextureCache:
         """Cache for textures."""
         return self._texture_cache
 
+    @property
+    def stats(self) -> dict[str, dict[str, int]]:
+        """
+        Entry count, hits, misses and evictions for each cache.
+
+        Example::
+
+            >> manager.stats["textures"]
+            {"entries": 10, "bytes": 40960, "hits": 5, "misses": 10, "evictions": 0}
+        """
+        return {
+            "textures": self._texture_cache.stats,
+            "image_data": self._image_data_cache.stats,
+            "hit_boxes": self._hit_box_cache.stats,
+        }
+
     def flush(
         self,
         sprite_sheets: bool = True,
@@ -91,6 +136,58 @@ def flush(
         if hit_boxes:
             self._hit_box_cache.flush()
 
+    def _create_texture(
+        self,
+        image_data: ImageData,
+        hit_box_algorithm: hitbox.HitBoxAlgorithm,
+    ) -> Texture:
+        """
+        Create a texture, reusing cached hit box points if possible.
+
+        Args:
+            image_data: The image data for the texture
+            hit_box_algorithm: The hit box algorithm for the texture
+        """
+        if not hit_box_algorithm.cache:
+            return Texture(image_data, hit_box_algorithm=hit_box_algorithm)
+
+        name = Texture.create_cache_name(hash=image_data.hash, hit_box_algorithm=hit_box_algorithm)
+        points = self._hit_box_cache.get(name)
+        texture = Texture(image_data, hit_box_algorithm=hit_box_algorithm, hit_box_points=points)
+        # Degenerate hit boxes with fewer than 3 points are not cached
+        if not points and len(texture.hit_box_points) >= 3:
+            self._hit_box_cache.put(name, texture.hit_box_points)
+        return texture
+
+    def _crop_texture(
+        self,
+        texture: Texture,
+        file_path: Path,
+        crop: tuple[int, int, int, int],
+        hit_box_algorithm: hitbox.HitBoxAlgorithm,
+    ) -> Texture:
+        """
+        Same as :py:meth:`Texture.crop`, but reusing cached hit box points.
+
+        Args:
+            texture: The texture loaded from the whole file to crop
+            file_path: The file the texture was loaded from
+            crop: The x, y, width and height to crop
+            hit_box_algorithm: The hit box algorithm for the new texture
+        """
+        x, y, width, height = crop
+        image = texture.image
+        if (width == 0 and height == 0) or (x == 0 and y == 0 and (width, height) == image.size):
+            return texture
+
+        Texture.validate_crop(image, x, y, width, height)
+        image_data = ImageData(
+            image.crop((x, y, x + width, y + height)), file_path=file_path, crop=crop
+        )
+        cropped = self._create_texture(image_data, hit_box_algorithm)
+        cropped.crop_values = crop
+        return cropped
+
     def _get_real_path(self, path: str | Path) -> Path:
         """
         Resolve the path to the file.
@@ -163,7 +260,10 @@ def load_or_get_spritesheet_texture(
         sprite_sheet = self.load_or_get_spritesheet(real_path)
 
         # slice out the texture and cache + return
-        texture = sprite_sheet.get_texture(x, y, width, height, hit_box_algorithm=hit_box_algorithm)
+        image = sprite_sheet.get_image(x, y, width, height)
+        texture = self._create_texture(ImageData(image), hit_box_algorithm or hitbox.algo_default)
+        texture.file_path = sprite_sheet.path
+        texture.crop_values = x, y, width, height
         self._texture_cache.put(texture)
         if texture.image_cache_name:
             self._image_data_cache.put(texture.image_cache_name, texture.image_data)
@@ -202,7 +302,7 @@ def load_or_get_image(
         if im_data:
             return im_data
         image = PIL.Image.open(real_path).convert(mode)
-        im_data = ImageData(image, hash=hash)
+        im_data = ImageData(image, hash=hash, file_path=real_path)
         self._image_data_cache.put(name, im_data)
         return im_data
 
@@ -266,7 +366,7 @@ def _load_or_get_texture(
             texture = self._texture_cache.get_with_config(image_data.hash, hit_box_algorithm)
         # If we still don't have a texture, create it
         if texture is None:
-            texture = Texture(image_data, hit_box_algorithm=hit_box_algorithm)
+            texture = self._create_texture(image_data, hit_box_algorithm)
             texture.file_path = file_path
             texture.crop_values = crop
             self._texture_cache.put(texture)
@@ -278,7 +378,7 @@ def _load_or_get_texture(
             )
             # If we don't have and cached image data we can crop from the base texture
             if image_data is None:
-                texture = texture.crop(*crop)
+                texture = self._crop_texture(texture, file_path, crop, hit_box_algorithm)
                 self._texture_cache.put(texture)
                 self._image_data_cache.put(
                     Texture.create_image_cache_name(file_path, crop), texture.image_data
@@ -287,7 +387,7 @@ def _load_or_get_texture(
                 # We might have a texture for this image data
                 texture = self._texture_cache.get_with_config(image_data.hash, hit_box_algorithm)
                 if texture is None:
-                    texture = Texture(image_data, hit_box_algorithm=hit_box_algorithm)
+                    texture = self._create_texture(image_data, hit_box_algorithm)
                     texture.file_path = file_path
                     texture.crop_values = crop
                     self._texture_cache.put(texture)
@@ -323,7 +423,7 @@ def _load_or_get_image(
         if not image_data:
             cached = False
             im = PIL.Image.open(file_path).convert(mode)
-            image_data = ImageData(im, hash)
+            image_data = ImageData(im, hash, file_path=file_path)
             self._image_data_cache.put(
                 Texture.create_image_cache_name(file_path_str),
                 image_data,
@@ -2,7 +2,7 @@
 
 import hashlib
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterator
 
 import PIL.Image
 import PIL.ImageDraw
@@ -26,9 +26,39 @@
 
 # from arcade.types.rect import Rect
 
+# xxhash is an optional dependency for faster image hashing
+try:
+    import xxhash
+except ImportError:
+    xxhash = None  # type: ignore
+
 __all__ = ["ImageData", "Texture"]
 
 
+def _iter_image_bytes(image: PIL.Image.Image) -> Iterator[bytes]:
+    """
+    Yield the raw pixel data of an image in bands of rows.
+
+    Joined together this is the same data as ``image.tobytes()``, but
+    only one band of about 1 MiB is copied at a time.
+
+    Args:
+        image: The Pillow image to read
+    """
+    width, height = image.size
+    if width == 0 or height == 0:
+        return
+
+    # Assume up to 4 bytes per pixel
+    rows = max(1, 2**20 // (width * 4))
+    if rows >= height:
+        yield image.tobytes()
+        return
+
+    for y in range(0, height, rows):
+        yield image.crop((0, y, width, min(height, y + rows))).tobytes()
+
+
 class ImageData:
     """
     A class holding the image for a texture with other metadata such as the hash.
@@ -36,6 +66,7 @@ class ImageData:
 
     If a hash is not provided, it will be calculated.
     By default, the hash is calculated using the sha256 algorithm.
+    See :py:attr:`hash_func` for other options.
 
     The ability to provide a hash directly is mainly there
     for ensuring we can load and save texture atlases to disk
@@ -47,14 +78,40 @@ class ImageData:
             The image for this texture
         hash:
             The hash of the image
+        file_path:
+            The file the image was loaded from, if any. Only used
+            when :py:attr:`hash_from_path` is enabled.
+        crop:
+            The ``(x, y, width, height)`` area of the file the image
+            was cropped from. Only used with ``file_path``.
     """
 
     __slots__ = ("image", "hash", "__weakref__")
-    hash_func = "sha256"
 
-    def __init__(self, image: PIL.Image.Image, hash: str | None = None, **kwargs):
+    #: The hash function used by :py:meth:`calculate_hash`. This can be
+    #: the name of a :py:mod:`hashlib` algorithm, ``"xxh64"``, ``"xxh3_64"``
+    #: or ``"xxh3_128"`` if the optional ``xxhash`` package is installed,
+    #: or a callable taking a Pillow image and returning a string.
+    hash_func: str | Callable[[PIL.Image.Image], str] = "sha256"
+
+    #: If ``True``, images loaded from a file are identified by the path,
+    #: modification time and size of the file and the crop area instead
+    #: of hashing their pixels. Files modified in memory after loading
+    #: must then be given a hash manually.
+    hash_from_path: bool = False
+
+    def __init__(
+        self,
+        image: PIL.Image.Image,
+        hash: str | None = None,
+        file_path: str | Path | None = None,
+        crop: tuple[int, int, int, int] = (0, 0, 0, 0),
+        **kwargs,
+    ):
         self.image = image
         """The pillow image"""
+        if hash is None and file_path is not None and self.hash_from_path:
+            hash = self.calculate_file_hash(file_path, crop, mode=image.mode)
         self.hash = hash or self.calculate_hash(image)
         """The hash of the image"""
 
@@ -64,14 +121,51 @@ def calculate_hash(cls, image: PIL.Image.Image) -> str:
         Calculates the hash of an image.
 
         The algorithm used is defined by the ``hash_func`` class variable.
+        The pixel data is hashed in chunks instead of being copied
+        into a single bytes object first.
 
         Args:
             image: The Pillow image to calculate the hash for
         """
-        hash = hashlib.new(cls.hash_func)
-        hash.update(image.tobytes())
+        hash_func = cls.hash_func
+        if callable(hash_func):
+            return hash_func(image)
+
+        if hash_func.startswith("xxh"):
+            if xxhash is None:
+                raise ImportError(f"The {hash_func} hash function requires xxhash to be installed")
+            hash = getattr(xxhash, hash_func)()
+        else:
+            hash = hashlib.new(hash_func)
+
+        for chunk in _iter_image_bytes(image):
+            hash.update(chunk)
         return hash.hexdigest()
 
+    @classmethod
+    def calculate_file_hash(
+        cls,
+        file_path: str | Path,
+        crop: tuple[int, int, int, int] = (0, 0, 0, 0),
+        mode: str = "RGBA",
+    ) -> str:
+        """
+        Calculates a hash identifying an image loaded from a file.
+
+        The pixels are not read. Instead the hash is based on the resolved
+        path, modification time and size of the file along with the crop
+        area and image mode.
+
+        Args:
+            file_path: The path to the image file
+            crop: The ``(x, y, width, height)`` area cropped from the file
+            mode: The mode the image was converted to
+        """
+        path = Path(file_path).resolve()
+        stat = path.stat()
+        key = f"{path}|{stat.st_mtime_ns}|{stat.st_size}|{tuple(crop)}|{mode}"
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
     @property
     def width(self) -> int:
         """Width of the image in pixels."""
@@ -22,7 +22,6 @@
 
 from arcade.camera.static import static_from_raw_orthographic
 from arcade.texture.transforms import Transform
-from arcade.window_commands import get_window
 
 from .base import TextureAtlasBase
 from .ref_counters import (
@@ -108,7 +107,7 @@ def __init__(
         ctx: ArcadeContext | None = None,
         capacity: int = 2,
     ):
-        self._ctx = ctx or get_window().ctx
+        super().__init__(ctx)
         self._max_size = self._ctx.info.MAX_VIEWPORT_DIMS
         self._size: tuple[int, int] = size
         self._allocator = Allocator(*self._size)
@@ -29,6 +29,7 @@
 import contextlib
 from pathlib import Path
 from typing import TYPE_CHECKING
+from weakref import WeakSet
 
 import PIL.Image
 
@@ -59,11 +60,24 @@ class TextureAtlasBase(abc.ABC):
 
     _fbo: Framebuffer
     _texture: Texture2D
+    # All atlases that are still alive
+    _instances: WeakSet[TextureAtlasBase] = WeakSet()
 
     def __init__(self, ctx: ArcadeContext | None):
         self._ctx = ctx or arcade.get_window().ctx
         self._size: tuple[int, int] = 0, 0
         self._layers: int = 1
+        TextureAtlasBase._instances.add(self)
+
+    @staticmethod
+    def get_instances() -> list[TextureAtlasBase]:
+        """
+        Get all texture atlases that are still alive.
+
+        This is used by the texture caches to avoid evicting
+        textures and images still used by an atlas.
+        """
+        return list(TextureAtlasBase._instances)
 
     @property
     def ctx(self) -> ArcadeContext:
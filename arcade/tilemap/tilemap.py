@@ -22,6 +22,7 @@
 
 import arcade
 from arcade import (
+    ChunkedSpriteList,
     Sprite,
     SpriteList,
     TextureAnimation,
@@ -164,6 +165,11 @@ class TileMap:
     - ``custom_class_args`` - Custom arguments, passed into the constructor of the custom_class
     - ``texture_atlas`` - A texture atlas to use for the SpriteList from this layer, if none is \
         supplied then the one defined at the map level will be used.
+    - ``cull`` - A boolean to only draw the sprites of this layer visible to the current camera. \
+        See :py:meth:`SpriteList.enable_culling() <arcade.SpriteList.enable_culling>`.
+    - ``chunk_size`` - Split a tile layer into chunks of this many pixels using a \
+        :py:class:`~arcade.ChunkedSpriteList` so only the chunks in view are drawn \
+        and editing a tile only updates its chunk.
 
         Example configuring layer options for a layer named "Platforms"::
 
@@ -288,6 +294,8 @@ def __init__(
             "custom_class": None,
             "custom_class_args": {},
             "texture_atlas": texture_atlas,
+            "cull": False,
+            "chunk_size": None,
         }
 
         for layer in self.tiled_map.layers:
@@ -665,12 +673,16 @@ def _process_image_layer(
         offset: Vec2 = Vec2(0, 0),
         custom_class: type | None = None,
         custom_class_args: dict[str, Any] = {},
+        cull: bool = False,
+        chunk_size: float | None = None,
     ) -> SpriteList:
         sprite_list: SpriteList = SpriteList(
             use_spatial_hash=use_spatial_hash,
             atlas=texture_atlas,
             lazy=self._lazy,
         )
+        if cull:
+            sprite_list.enable_culling()
 
         map_source = self.tiled_map.map_file
         map_directory = os.path.dirname(map_source)
@@ -750,17 +762,33 @@ def _process_tile_layer(
         offset: Vec2 = Vec2(0, 0),
         custom_class: type | None = None,
         custom_class_args: dict[str, Any] = {},
+        cull: bool = False,
+        chunk_size: float | None = None,
     ) -> SpriteList:
-        sprite_list: SpriteList = SpriteList(
-            use_spatial_hash=use_spatial_hash,
-            atlas=texture_atlas,
-            lazy=self._lazy,
-        )
+        sprite_list: SpriteList
+        if chunk_size:
+            sprite_list = ChunkedSpriteList(
+                chunk_size=chunk_size,
+                use_spatial_hash=use_spatial_hash,
+                atlas=texture_atlas,
+                lazy=self._lazy,
+            )
+        else:
+            sprite_list = SpriteList(
+                use_spatial_hash=use_spatial_hash,
+                atlas=texture_atlas,
+                lazy=self._lazy,
+            )
+        if cull:
+            sprite_list.enable_culling()
         map_array = layer.data
         if TYPE_CHECKING:
             # Can never be None because we already detect and reject infinite maps
             assert map_array
 
+        # Collect the sprites and add them to the list in one batch
+        sprites = []
+
         # Loop through the layer and add in the list
         for row_index, row in enumerate(map_array):
             for column_index, item in enumerate(row):
@@ -811,11 +839,12 @@ def _process_tile_layer(
                         my_sprite.alpha = int(opacity * 255)
 
                     sprite_list.visible = layer.visible
-                    sprite_list.append(my_sprite)
+                    sprites.append(my_sprite)
 
                 if layer.properties:
                     sprite_list.properties = layer.properties
 
+        sprite_list.extend(sprites)
         return sprite_list
 
     def _process_object_layer(
@@ -828,6 +857,8 @@ def _process_object_layer(
         offset: Vec2 = Vec2(0, 0),
         custom_class: type | None = None,
         custom_class_args: dict[str, Any] = {},
+        cull: bool = False,
+        chunk_size: float | None = None,
     ) -> tuple[SpriteList | None, list[TiledObject] | None]:
         if not scaling:
             scaling = self.scaling
@@ -846,6 +877,8 @@ def _process_object_layer(
                         atlas=texture_atlas,
                         lazy=self._lazy,
                     )
+                    if cull:
+                        sprite_list.enable_culling()
 
                 tile = self._get_tile_by_gid(cur_object.gid)
                 if tile is None:
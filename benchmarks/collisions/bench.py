@@ -1,4 +1,6 @@
 import math
+import sys
+import time
 import arcade
 import pyglet
 import random
@@ -17,6 +19,10 @@
 SIMULATE_MINUTES = 1
 SIMULATE_FPS = 60
 
+# Pass "batched" to check all bullets against the walls in a single call
+# with check_for_collisions_between_lists instead of once per bullet.
+BATCHED = "batched" in sys.argv[1:]
+
 # Predictable randomization so that each benchmark is identical
 rng = random.Random(0)
 
@@ -47,7 +53,9 @@
         new_bullet.angle = 45
     bullets.append(new_bullet)
 
-for i in range(0, int(SIMULATE_MINUTES * 60 * SIMULATE_FPS)):
+collision_time = 0.0
+frames = int(SIMULATE_MINUTES * 60 * SIMULATE_FPS)
+for i in range(0, frames):
     pyglet.clock.tick()
 
     window.switch_to()
@@ -58,11 +66,17 @@
         bullet.position = (bullet.position[0] + bullet.velocity[0], bullet.position[1] + bullet.velocity[1])
 
     # Check for collisions
-    bullets_w_collision = []
-    for bullet in bullets:
-        walls_hit = arcade.check_for_collision_with_list(bullet, walls)
-        if walls_hit:
-            bullets_w_collision.append(bullet)
+    start = time.perf_counter()
+    if BATCHED:
+        pairs = arcade.check_for_collisions_between_lists(bullets, walls)
+        bullets_w_collision = list({bullet: None for bullet, _ in pairs})
+    else:
+        bullets_w_collision = []
+        for bullet in bullets:
+            walls_hit = arcade.check_for_collision_with_list(bullet, walls)
+            if walls_hit:
+                bullets_w_collision.append(bullet)
+    collision_time += time.perf_counter() - start
     for bullet in bullets_w_collision:
         # bullets.remove(bullet)
         bullet.position = (rng.randint(0, SCREEN_WIDTH), rng.randint(0, SCREEN_HEIGHT))
@@ -73,3 +87,5 @@
     walls.draw()
     bullets.draw()
     window.flip()
+
+print("batched" if BATCHED else "per bullet", "collision time per frame", collision_time / frames)
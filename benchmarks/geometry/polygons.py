@@ -0,0 +1,61 @@
+"""
+Time spent in the polygon narrow phase.
+
+Compares testing one hit box against many with are_polygons_intersecting
+and with are_polygons_intersecting_many, for unrotated tile hit boxes
+and for rotated ones, and the same for points in a polygon. Batched
+calls are timed both with lists of points and with arrays that were
+already stacked, as converting the lists is most of the batched cost.
+"""
+
+import math
+import random
+import time
+
+import numpy as np
+
+from arcade.geometry import (
+    are_points_in_polygon,
+    are_polygons_intersecting,
+    are_polygons_intersecting_many,
+    is_point_in_polygon,
+)
+
+COUNT = 2000
+REPEAT = 20
+
+rng = random.Random(0)
+
+
+def rectangle(x, y, size, angle=0.0):
+    cos, sin = math.cos(angle), math.sin(angle)
+    corners = ((-size, -size), (size, -size), (size, size), (-size, size))
+    return [(x + cx * cos - cy * sin, y + cx * sin + cy * cos) for cx, cy in corners]
+
+
+def run(name, function):
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        function()
+    elapsed = (time.perf_counter() - start) / REPEAT
+    print(f"{name:36} {elapsed * 1000:8.2f} ms")
+
+
+for rotated in (False, True):
+    angle = 0.3 if rotated else 0.0
+    player = rectangle(0, 0, 20, angle)
+    tiles = [
+        rectangle(rng.randint(-200, 200), rng.randint(-200, 200), 32, angle) for _ in range(COUNT)
+    ]
+    kind = "rotated" if rotated else "tiles"
+    run(f"{kind} loop", lambda: [are_polygons_intersecting(player, tile) for tile in tiles])
+    run(f"{kind} batched", lambda: are_polygons_intersecting_many(player, tiles))
+    stacked = np.array(tiles)
+    run(f"{kind} batched, stacked", lambda: are_polygons_intersecting_many(player, stacked))
+
+polygon = rectangle(0, 0, 100, 0.3)
+points = [(rng.uniform(-150, 150), rng.uniform(-150, 150)) for _ in range(COUNT)]
+run("points loop", lambda: [is_point_in_polygon(x, y, polygon) for x, y in points])
+run("points batched", lambda: are_points_in_polygon(points, polygon))
+stacked = np.array(points)
+run("points batched, stacked", lambda: are_points_in_polygon(stacked, polygon))
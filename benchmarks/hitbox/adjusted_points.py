@@ -0,0 +1,42 @@
+"""
+Time spent updating hit boxes of moving sprites.
+
+Each frame every hit box is moved, and for the rotating ones also
+rotated, then its bounds and adjusted points are read the way the
+spatial hash and the collision functions do. Run on different versions
+of arcade to compare.
+"""
+
+import time
+
+from arcade.hitbox import RotatableHitBox
+
+COUNT = 5000
+FRAMES = 20
+
+SQUARE = ((-32.0, -32.0), (32.0, -32.0), (32.0, 32.0), (-32.0, 32.0))
+OCTAGON = (
+    (-20.0, -32.0), (20.0, -32.0), (32.0, -20.0), (32.0, 20.0),
+    (20.0, 32.0), (-20.0, 32.0), (-32.0, 20.0), (-32.0, -20.0),
+)
+
+
+def run(name, points, rotate, read_points):
+    hit_boxes = [RotatableHitBox(points, position=(i, i)) for i in range(COUNT)]
+    start = time.perf_counter()
+    for frame in range(FRAMES):
+        for i, hit_box in enumerate(hit_boxes):
+            hit_box.position = (i + frame, i)
+            if rotate:
+                hit_box.angle = frame * 3.0
+            hit_box.left, hit_box.right, hit_box.bottom, hit_box.top
+            if read_points:
+                hit_box.get_adjusted_points()
+    elapsed = (time.perf_counter() - start) / FRAMES
+    print(f"{name:32} {elapsed * 1000:8.2f} ms/frame")
+
+
+for shape, points in (("square", SQUARE), ("octagon", OCTAGON)):
+    run(f"{shape} moving, bounds", points, False, False)
+    run(f"{shape} moving, points", points, False, True)
+    run(f"{shape} rotating, points", points, True, True)
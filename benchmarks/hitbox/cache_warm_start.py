@@ -0,0 +1,51 @@
+"""
+Time spent loading textures with and without a persisted hit box cache.
+
+Slices 64 sprites out of a generated sprite sheet with the detailed hit
+box algorithm. The first run calculates all hit boxes and stores them in
+a temporary directory, the second run loads them from there.
+"""
+
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from PIL import Image, ImageDraw
+
+from arcade.hitbox import algo_detailed
+from arcade.texture import TextureCacheManager
+
+SIZE = 128
+COLUMNS = 8
+
+
+def create_sprite_sheet(path):
+    rng = random.Random(0)
+    image = Image.new("RGBA", (SIZE * COLUMNS, SIZE * COLUMNS), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(image)
+    for row in range(COLUMNS):
+        for column in range(COLUMNS):
+            x, y = column * SIZE, row * SIZE
+            width, height = rng.randint(SIZE // 4, SIZE - 1), rng.randint(SIZE // 4, SIZE - 1)
+            draw.ellipse((x, y, x + width, y + height), fill="red")
+    image.save(path)
+
+
+def run(name, sprite_sheet, directory):
+    manager = TextureCacheManager(hit_box_cache_dir=directory)
+    start = time.perf_counter()
+    for row in range(COLUMNS):
+        for column in range(COLUMNS):
+            manager.load_or_get_spritesheet_texture(
+                sprite_sheet, column * SIZE, row * SIZE, SIZE, SIZE, hit_box_algorithm=algo_detailed
+            )
+    elapsed = time.perf_counter() - start
+    print(f"{name:6} {COLUMNS * COLUMNS} textures {elapsed * 1000:8.1f} ms")
+
+
+with tempfile.TemporaryDirectory() as directory:
+    sprite_sheet = Path(directory) / "sheet.png"
+    create_sprite_sheet(sprite_sheet)
+    run("cold", sprite_sheet, directory)
+    run("warm", sprite_sheet, directory)
@@ -0,0 +1,45 @@
+"""
+Time spent tracing images with the detailed hit box algorithm.
+
+Traces a batch of sprite-sized images one at a time and with
+calculate_many using a process pool. Run on different versions of
+arcade to compare the single image times.
+"""
+
+import random
+import time
+
+from PIL import Image, ImageDraw
+
+from arcade.hitbox import algo_detailed
+
+COUNT = 64
+SIZE = 128
+
+
+def create_images():
+    rng = random.Random(0)
+    images = []
+    for _ in range(COUNT):
+        image = Image.new("RGBA", (SIZE, SIZE), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(image)
+        for _ in range(3):
+            x, y = rng.randint(0, SIZE // 2), rng.randint(0, SIZE // 2)
+            width, height = rng.randint(8, SIZE // 2), rng.randint(8, SIZE // 2)
+            draw.ellipse((x, y, x + width, y + height), fill="red")
+        images.append(image)
+    return images
+
+
+def run(name, function):
+    start = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - start
+    print(f"{name:24} {elapsed * 1000 / COUNT:8.2f} ms/image")
+
+
+if __name__ == "__main__":
+    images = create_images()
+    run("calculate", lambda: [algo_detailed.calculate(image) for image in images])
+    if hasattr(algo_detailed, "calculate_many"):
+        run("calculate_many", lambda: algo_detailed.calculate_many(images))
@@ -0,0 +1,58 @@
+"""
+Time spent copying pymunk body positions back to sprites.
+
+Compares the per-sprite property setter loop resync used to run with
+PymunkPhysicsEngine.resync_sprites for a few thousand moving bodies.
+"""
+
+import math
+import time
+
+import arcade
+
+BODIES = 5000
+STEPS = 100
+
+
+def legacy_resync(engine):
+    for sprite in engine.non_static_sprite_list.copy():
+        physics_object = engine.sprites[sprite]
+        if physics_object.body is None or physics_object.body.is_sleeping:
+            continue
+        new_position = physics_object.body.position
+        new_angle = -math.degrees(physics_object.body.angle)
+        dx = new_position[0] - sprite.center_x
+        dy = new_position[1] - sprite.center_y
+        d_angle = new_angle - sprite.angle
+        sprite.position = new_position
+        sprite.angle = new_angle
+        sprite.pymunk_moved(engine, dx, dy, d_angle)
+
+
+def create(use_spatial_hash):
+    engine = arcade.PymunkPhysicsEngine(gravity=(0, -100))
+    sprites = arcade.SpriteList(use_spatial_hash=use_spatial_hash)
+    for i in range(BODIES):
+        sprite = arcade.SpriteSolidColor(8, 8, center_x=(i % 100) * 10, center_y=(i // 100) * 10)
+        sprites.append(sprite)
+        engine.add_sprite(sprite)
+    for sprite in sprites:
+        engine.apply_impulse(sprite, (sprite.center_y / 10, 0))
+    return engine
+
+
+def run(name, resync, use_spatial_hash):
+    engine = create(use_spatial_hash)
+    elapsed = 0.0
+    for _ in range(STEPS):
+        engine.space.step(1 / 60)
+        start = time.perf_counter()
+        resync(engine)
+        elapsed += time.perf_counter() - start
+    hashed = "spatial hash" if use_spatial_hash else "no hash"
+    print(f"{name:8} {hashed:12} {elapsed / STEPS * 1000:7.2f} ms/resync")
+
+
+for use_spatial_hash in (False, True):
+    run("legacy", legacy_resync, use_spatial_hash)
+    run("batched", arcade.PymunkPhysicsEngine.resync_sprites, use_spatial_hash)
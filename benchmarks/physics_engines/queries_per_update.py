@@ -0,0 +1,72 @@
+"""
+Spatial hash queries and time per physics engine update.
+
+A player jumps into a low ceiling a few times, then walks into a wall
+and keeps pushing against it. Run on different versions of arcade to
+compare.
+"""
+
+import time
+
+import arcade
+from arcade.sprite_list.spatial_hash import SpatialHash
+
+TILE_SIZE = 64
+UPDATES = 600
+
+queries = 0
+
+
+def _counted(method):
+    def wrapper(*args, **kwargs):
+        global queries
+        queries += 1
+        return method(*args, **kwargs)
+
+    return wrapper
+
+
+SpatialHash.get_sprites_near_sprite = _counted(SpatialHash.get_sprites_near_sprite)
+SpatialHash.get_sprites_near_rect = _counted(SpatialHash.get_sprites_near_rect)
+
+
+def create_level():
+    walls = arcade.SpriteList(use_spatial_hash=True)
+    for x in range(0, TILE_SIZE * 50, TILE_SIZE):
+        walls.append(arcade.SpriteSolidColor(TILE_SIZE, TILE_SIZE, center_x=x, center_y=0))
+    for x in range(0, TILE_SIZE * 15, TILE_SIZE):
+        walls.append(arcade.SpriteSolidColor(TILE_SIZE, TILE_SIZE, center_x=x, center_y=TILE_SIZE * 4))
+    for y in range(TILE_SIZE, TILE_SIZE * 6, TILE_SIZE):
+        walls.append(arcade.SpriteSolidColor(TILE_SIZE, TILE_SIZE, center_x=TILE_SIZE * 20, center_y=y))
+    return walls
+
+
+def run(engine_type):
+    global queries
+    walls = create_level()
+    player = arcade.SpriteSolidColor(40, 60, center_x=TILE_SIZE * 10, center_y=TILE_SIZE * 2)
+    if engine_type is arcade.PhysicsEngineSimple:
+        engine = arcade.PhysicsEngineSimple(player, walls)
+    else:
+        engine = arcade.PhysicsEnginePlatformer(player, walls=walls, gravity_constant=2)
+
+    queries = 0
+    start = time.perf_counter()
+    for i in range(UPDATES):
+        if i < UPDATES // 4:
+            # Alternate between jumping into the ceiling and falling to the floor
+            player.change_y = 40 if i % 20 == 0 else player.change_y
+            if engine_type is arcade.PhysicsEngineSimple and i % 20 == 10:
+                player.change_y = -40
+        else:
+            player.change_x = 7
+        engine.update()
+    elapsed = time.perf_counter() - start
+    print(
+        f"{engine_type.__name__:24} {queries / UPDATES:6.2f} queries/update "
+        f"{elapsed / UPDATES * 1_000_000:8.1f} us/update"
+    )
+
+
+run(arcade.PhysicsEngineSimple)
+run(arcade.PhysicsEnginePlatformer)
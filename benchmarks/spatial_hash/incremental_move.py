@@ -0,0 +1,57 @@
+"""
+Moving sprites that stay inside the same cells:
+remove/add vs incremental move vs deferred move
+"""
+
+import timeit
+import arcade
+
+CELL_SIZE = 32
+
+sprites = []
+for y in range(100):
+    for x in range(100):
+        sprite = arcade.SpriteSolidColor(64, 64, center_x=x * 100 + 40, center_y=y * 100 + 40)
+        sprites.append(sprite)
+
+
+def create(deferred=False):
+    sh = arcade.SpatialHash(CELL_SIZE, deferred=deferred)
+    for sprite in sprites:
+        sh.add(sprite)
+    return sh
+
+
+def drift(sh, update):
+    # Slowly drifting sprites covering 9 cells each.
+    # Most moves stay inside the same cells.
+    for step in range(10):
+        for sprite in sprites:
+            sprite.center_x += 1
+            update(sh, sprite)
+    for sprite in sprites:
+        sprite.center_x -= 10
+    sh.get_sprites_near_point((0, 0))
+
+
+def remove_add(sh, sprite):
+    sh.remove(sprite)
+    sh.add(sprite)
+
+
+def move(sh, sprite):
+    sh.move(sprite)
+
+
+sh_1 = create()
+sh_2 = create()
+sh_3 = create(deferred=True)
+
+res_1 = timeit.timeit(lambda: drift(sh_1, remove_add), number=10)
+print("remove/add", res_1)
+res_2 = timeit.timeit(lambda: drift(sh_2, move), number=10)
+print("move", res_2)
+res_3 = timeit.timeit(lambda: drift(sh_3, move), number=10)
+print("deferred move", res_3)
+print("ratio remove/add vs move", res_1 / res_2 * 100)
+print("ratio remove/add vs deferred move", res_1 / res_3 * 100)
@@ -0,0 +1,118 @@
+"""
+Time spent laying out and drawing thousands of labels changing every frame.
+
+Draws LABEL_COUNT nameplates showing a changing value with draw_text, with
+a Text object for each label drawn one by one, with Text objects sharing a
+pyglet batch and with a TextBatch. Each mode runs for FRAMES frames and
+reports the average time per frame spent updating the labels (layout) and
+drawing them.
+"""
+
+import random
+import time
+
+import arcade
+from pyglet.graphics import Batch
+
+WINDOW_WIDTH = 1280
+WINDOW_HEIGHT = 800
+WINDOW_TITLE = "Dynamic Labels Benchmark"
+LABEL_COUNT = 3000
+FRAMES = 120
+# Share of the labels getting a new value each frame
+CHANGE_RATE = 0.2
+FONT_SIZE = 8
+
+
+class BenchmarkWindow(arcade.Window):
+    def __init__(self):
+        super().__init__(WINDOW_WIDTH, WINDOW_HEIGHT, WINDOW_TITLE, vsync=False)
+        self.background_color = arcade.color.BLACK
+        rng = random.Random(0)
+        self.rng = rng
+        self.positions = [
+            (rng.uniform(0, WINDOW_WIDTH), rng.uniform(0, WINDOW_HEIGHT))
+            for _ in range(LABEL_COUNT)
+        ]
+        self.values = [rng.randint(0, 100) for _ in range(LABEL_COUNT)]
+        self.modes = ["draw_text", "Text.draw", "Text batch", "TextBatch"]
+        self.mode_index = 0
+        self.frame = 0
+        self.layout_time = 0.0
+        self.draw_time = 0.0
+        self.setup_mode()
+
+    def setup_mode(self):
+        self.texts = []
+        self.batch = Batch()
+        self.text_batch = arcade.TextBatch()
+        mode = self.modes[self.mode_index]
+        if mode in ("Text.draw", "Text batch"):
+            batch = self.batch if mode == "Text batch" else None
+            self.texts = [
+                arcade.Text(f"HP {value}", x, y, font_size=FONT_SIZE, batch=batch)
+                for (x, y), value in zip(self.positions, self.values)
+            ]
+
+    def update_values(self):
+        for _ in range(int(LABEL_COUNT * CHANGE_RATE)):
+            index = self.rng.randrange(LABEL_COUNT)
+            self.values[index] = self.rng.randint(0, 100)
+
+    def on_draw(self):
+        self.clear()
+        self.update_values()
+        mode = self.modes[self.mode_index]
+
+        start = time.perf_counter()
+        if mode == "draw_text":
+            # Layout and drawing can't be separated here
+            for (x, y), value in zip(self.positions, self.values):
+                arcade.draw_text(f"HP {value}", x, y, font_size=FONT_SIZE)
+        elif mode == "TextBatch":
+            for (x, y), value in zip(self.positions, self.values):
+                self.text_batch.draw_text(f"HP {value}", x, y, font_size=FONT_SIZE)
+        else:
+            for text, value in zip(self.texts, self.values):
+                text.text = f"HP {value}"
+        layout_end = time.perf_counter()
+
+        if mode == "Text.draw":
+            for text in self.texts:
+                text.draw()
+        elif mode == "Text batch":
+            self.batch.draw()
+        elif mode == "TextBatch":
+            self.text_batch.draw()
+        self.ctx.finish()
+        end = time.perf_counter()
+
+        self.layout_time += layout_end - start
+        self.draw_time += end - layout_end
+        self.frame += 1
+        if self.frame == FRAMES:
+            self.report(mode)
+            self.next_mode()
+
+    def report(self, mode):
+        layout = self.layout_time / FRAMES * 1000
+        draw = self.draw_time / FRAMES * 1000
+        total = layout + draw
+        print(f"{mode:12} layout {layout:8.2f} ms  draw {draw:8.2f} ms  total {total:8.2f} ms")
+        if mode == "TextBatch":
+            print(f"{'':12} {self.text_batch.stats}")
+
+    def next_mode(self):
+        self.mode_index += 1
+        self.frame = 0
+        self.layout_time = 0.0
+        self.draw_time = 0.0
+        if self.mode_index == len(self.modes):
+            self.close()
+            return
+        self.setup_mode()
+
+
+print(f"{LABEL_COUNT} labels, {CHANGE_RATE:.0%} changing per frame, {FRAMES} frames")
+BenchmarkWindow()
+arcade.run()
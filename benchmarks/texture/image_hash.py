@@ -0,0 +1,48 @@
+"""
+Time spent hashing images for ImageData.
+
+Compares hashing a copy of all the pixels the way ImageData used to with
+the chunked ImageData.calculate_hash for a few hash functions, and with
+the path based key used when ImageData.hash_from_path is enabled.
+"""
+
+import hashlib
+import tempfile
+import time
+from pathlib import Path
+
+from PIL import Image
+
+from arcade.texture import ImageData
+
+REPEAT = 10
+
+
+def run(name, function):
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        function()
+    elapsed = (time.perf_counter() - start) / REPEAT
+    print(f"{name:28} {elapsed * 1000:8.2f} ms")
+
+
+def hash_with(hash_func, image):
+    ImageData.hash_func = hash_func
+    return ImageData.calculate_hash(image)
+
+
+for size in (64, 2048):
+    image = Image.effect_noise((size, size), 50).convert("RGBA")
+    print(f"{size}x{size}")
+    run("sha256 of tobytes()", lambda: hashlib.sha256(image.tobytes()).hexdigest())
+    for hash_func in ("sha256", "sha1", "md5", "blake2b", "xxh3_64"):
+        try:
+            hash_with(hash_func, image)
+        except ImportError:
+            continue
+        run(f"calculate_hash {hash_func}", lambda: hash_with(hash_func, image))
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "image.png"
+        image.save(path)
+        run("calculate_file_hash", lambda: ImageData.calculate_file_hash(path))
@@ -0,0 +1,31 @@
+import arcade
+from arcade.cache import GlyphCache
+
+
+def test_get(ctx):
+    cache = GlyphCache()
+    atlas = arcade.DefaultTextureAtlas((256, 256))
+    glyph = cache.get("a", atlas, font_size=20)
+    assert glyph.texture is not None
+    assert glyph.texture in atlas.textures
+    assert glyph.advance > 0
+    assert 0 < glyph.baseline < glyph.height
+    assert cache.stats == {"entries": 1, "hits": 0, "misses": 1}
+
+    assert cache.get("a", atlas, font_size=20) is glyph
+    assert cache.stats["hits"] == 1
+    # Other sizes and atlases get their own glyphs
+    assert cache.get("a", atlas, font_size=10) is not glyph
+    other_atlas = arcade.DefaultTextureAtlas((256, 256))
+    assert cache.get("a", other_atlas, font_size=20).texture in other_atlas.textures
+    assert len(cache) == 3
+
+    space = cache.get(" ", atlas, font_size=20)
+    assert space.texture is None
+    assert space.advance > 0
+    assert space.height == glyph.height
+
+    cache.flush(other_atlas)
+    assert len(cache) == 3
+    cache.flush()
+    assert len(cache) == 0
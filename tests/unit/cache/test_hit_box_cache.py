@@ -76,3 +76,58 @@ def test_save_load(tmp_path, cache, file_type):
     assert cache.get("a|simple") == (1, 2, 3, 4)
     assert cache.get("b|simple") == (5, 6, 7, 8)
     assert cache.get("b|detailed") == (9, 10, 11, 12)
+
+
+def test_persist(tmp_path):
+    cache = HitBoxCache(tmp_path)
+    assert cache.directory == tmp_path
+    cache.put("a|simple", ((0.0, 0.0), (1.0, 0.0), (1.0, 1.0)))
+    cache.put("b|simple", ())
+    # Already persisted
+    cache.put("a|simple", ((0.0, 0.0), (1.0, 0.0), (1.0, 1.0)))
+
+    # A new cache only reads the file when needed
+    cache = HitBoxCache(tmp_path)
+    assert len(cache) == 0
+    assert cache.get("a|simple") == ((0.0, 0.0), (1.0, 0.0), (1.0, 1.0))
+    assert cache.get("b|simple") == ()
+    assert cache.get("c|simple") is None
+    assert len(cache) == 2
+
+    # Flushing keeps the persisted entries
+    cache.flush()
+    assert cache.get("a|simple") == ((0.0, 0.0), (1.0, 0.0), (1.0, 1.0))
+
+    # An interrupted write is dropped
+    path = tmp_path / HitBoxCache.FILE_NAME
+    size = path.stat().st_size
+    with open(path, "ab") as fd:
+        fd.write(b"\x05\x00")
+    cache = HitBoxCache(tmp_path)
+    cache.put("c|simple", ((2.5, 0.0), (1.0, 0.0), (1.0, 1.0)))
+    assert path.stat().st_size > size
+    cache = HitBoxCache(tmp_path)
+    assert cache.get("c|simple") == ((2.5, 0.0), (1.0, 0.0), (1.0, 1.0))
+    assert cache.get("a|simple") == ((0.0, 0.0), (1.0, 0.0), (1.0, 1.0))
+
+    # Unknown files are replaced
+    path.write_bytes(b"garbage")
+    cache = HitBoxCache(tmp_path)
+    assert cache.get("a|simple") is None
+    cache.put("a|simple", ((0.0, 0.0), (1.0, 0.0), (1.0, 1.0)))
+    assert HitBoxCache(tmp_path).get("a|simple") == ((0.0, 0.0), (1.0, 0.0), (1.0, 1.0))
+
+
+def test_max_entries(tmp_path):
+    cache = HitBoxCache(tmp_path, max_entries=2)
+    cache.put("a|simple", ((0, 0), (1, 0), (1, 1)))
+    cache.put("b|simple", ((0, 0), (2, 0), (2, 2)))
+    assert cache.get("a|simple") == ((0, 0), (1, 0), (1, 1))
+    cache.put("c|simple", ((0, 0), (3, 0), (3, 3)))
+    assert list(cache) == ["a|simple", "c|simple"]
+    assert cache.evictions == 1
+    # Evicted entries are still loaded from the persisted file
+    assert cache.get("b|simple") is not None
+    assert list(cache) == ["c|simple", "b|simple"]
+    assert cache.get("d|simple") is None
+    assert cache.stats == {"entries": 2, "hits": 2, "misses": 1, "evictions": 2}
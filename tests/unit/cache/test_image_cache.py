@@ -34,3 +34,41 @@ def test_delete(cache):
     assert len(cache) == 1
     cache.delete("test_2")
     assert len(cache) == 0
+
+
+def test_max_entries():
+    cache = ImageDataCache(max_entries=2)
+    cache.put("a", image_1)
+    cache.put("b", image_1)
+    # Touch "a" so "b" is the least recently used
+    assert cache.get("a") == image_1
+    cache.put("c", image_1)
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.stats == {"entries": 2, "bytes": 800, "hits": 1, "misses": 1, "evictions": 1}
+
+
+def test_max_bytes():
+    # Each image is 10 * 10 * 4 bytes
+    cache = ImageDataCache()
+    for name in "abcd":
+        cache.put(name, image_1)
+    assert cache.total_bytes == 1600
+    cache.max_bytes = 1000
+    assert len(cache) == 2
+    assert cache.total_bytes == 800
+    cache.delete("c")
+    assert cache.total_bytes == 400
+    cache.flush()
+    assert cache.total_bytes == 0
+
+
+def test_in_use():
+    cache = ImageDataCache(max_entries=1, in_use=lambda image: image is image_1)
+    cache.put("a", image_1)
+    cache.put("b", image_2)
+    cache.put("c", image_2)
+    # image_1 is kept even if it's the least recently used
+    assert cache.get("a") == image_1
+    assert cache.get("b") is None
+    assert len(cache) == 1
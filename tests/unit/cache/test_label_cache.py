@@ -0,0 +1,106 @@
+import pytest
+from arcade.cache import LabelCache
+
+
+class FakeLabel:
+    def __init__(self, text=""):
+        self.text = text
+        self.deleted = False
+
+    def delete(self):
+        self.deleted = True
+
+
+def test_create():
+    cache = LabelCache(capacity=4, max_variants=2)
+    assert len(cache) == 0
+    assert cache.capacity == 4
+    assert cache.max_variants == 2
+    assert repr(cache) == "LabelCache(entries=0, capacity=4)"
+    with pytest.raises(ValueError):
+        LabelCache(capacity=0)
+
+
+def test_variants():
+    cache = LabelCache(capacity=10, max_variants=2)
+    label_a, label_b = FakeLabel(), FakeLabel()
+    assert cache.get("style", "a") is None
+    cache.put("style", "a", label_a)
+    cache.put("style", "b", label_b)
+    assert cache.get("style", "a") is label_a
+    assert cache.get("style", "b") is label_b
+    assert cache.get("other", "a") is None
+
+    # The style is full. The least recently used label is reused.
+    assert cache.take_reusable("other") is None
+    assert cache.take_reusable("style") is label_a
+    assert len(cache) == 1
+    cache.put("style", "c", label_a)
+    assert cache.get("style", "c") is label_a
+    assert cache.get("style", "a") is None
+    assert cache.stats == {"entries": 2, "styles": 1, "hits": 3, "misses": 3, "evictions": 0}
+
+
+def test_capacity():
+    cache = LabelCache(capacity=3)
+    cache.put("style_1", "a", FakeLabel())
+    cache.put("style_2", "a", FakeLabel())
+    cache.put("style_2", "b", FakeLabel())
+    # Touch style 1 so style 2 is the least recently used
+    assert cache.get("style_1", "a") is not None
+    cache.put("style_3", "a", FakeLabel())
+    assert len(cache) == 3
+    assert cache.get("style_2", "a") is None
+    assert cache.evictions == 1
+
+    cache.capacity = 1
+    assert len(cache) == 1
+    assert cache.get("style_3", "a") is not None
+    cache.flush()
+    assert len(cache) == 0
+
+
+def test_dropped_labels_deleted():
+    cache = LabelCache(capacity=2, max_variants=2)
+    label_a, label_b, label_c = FakeLabel(), FakeLabel(), FakeLabel()
+    cache.put("style", "a", label_a)
+    cache.put("style", "b", label_b)
+    # The style is full so the least recently used label is dropped
+    cache.put("style", "c", label_c)
+    assert label_a.deleted
+    assert not label_b.deleted
+
+    # Replacing a label deletes the old one
+    label_d = FakeLabel()
+    cache.put("style", "b", label_d)
+    assert label_b.deleted
+
+    # Dropped to stay within the capacity
+    cache.put("other", "a", FakeLabel())
+    assert label_c.deleted
+
+    # Labels taken for reuse belong to the caller
+    cache.put("other", "b", FakeLabel())
+    label = cache.take_reusable("other")
+    assert label is not None and not label.deleted
+
+    cache.flush()
+    assert label_d.deleted
+    assert not label.deleted
+
+
+def test_dict_access():
+    cache = LabelCache()
+    label_a, label_b = FakeLabel("a"), FakeLabel("b")
+    assert "style" not in cache
+    with pytest.raises(KeyError):
+        cache["style"]
+    cache["style"] = label_a
+    cache["style"] = label_b
+    assert "style" in cache
+    assert cache["style"] is label_b
+    assert cache.get("style", "a") is label_a
+
+    cache.clear()
+    assert len(cache) == 0
+    assert label_a.deleted and label_b.deleted
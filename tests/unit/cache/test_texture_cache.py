@@ -80,3 +80,41 @@ def test_get_set(cache, texture):
     assert cache[texture.cache_name] == texture
     del cache[texture.cache_name]
     # assert cache[texture.cache_name] is None
+
+
+def test_max_entries():
+    textures = [
+        arcade.Texture(Image.new("RGBA", (10, 10), (i, 0, 0, 255))) for i in range(3)
+    ]
+    cache = TextureCache(max_entries=2)
+    cache.put(textures[0])
+    cache.put(textures[1])
+    # Touch the first texture so the second is the least recently used
+    assert cache.get(textures[0].cache_name) == textures[0]
+    cache.put(textures[2])
+    assert cache.get_all_textures() == {textures[0], textures[2]}
+    assert cache.get(textures[1].cache_name) is None
+    assert cache.stats == {"entries": 2, "bytes": 800, "hits": 1, "misses": 1, "evictions": 1}
+
+
+def test_max_bytes_file(file_texture):
+    cache = TextureCache()
+    cache.put(file_texture)
+    size = file_texture.image.width * file_texture.image.height * 4
+    assert cache.total_bytes == size
+    cache.max_bytes = size - 1
+    assert len(cache) == 0
+    assert len(cache._file_entries) == 0
+    assert cache.total_bytes == 0
+    assert cache.evictions == 1
+
+
+def test_in_use(texture):
+    other = arcade.Texture(Image.new("RGBA", (10, 10), (0, 255, 0, 255)))
+    cache = TextureCache(max_entries=1, in_use=lambda tex: tex is texture)
+    cache.put(texture)
+    cache.put(other)
+    # The texture in use is skipped even if it's the least recently used
+    assert cache.get_all_textures() == {texture}
+    assert cache.evictions == 1
+    assert cache.total_bytes == 400
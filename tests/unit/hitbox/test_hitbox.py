@@ -50,3 +50,30 @@ def test_create_rotatable():
     rot_p = rot.get_adjusted_points()
     for i, (a, b) in enumerate(zip(rot_90, rot_p)):
         assert a == pytest.approx(b, abs = 1e-6), f"[{i}] {a} != {b}"
+
+
+def test_adjusted_cache():
+    rot = hitbox.RotatableHitBox(points, position=(5.0, 5.0), scale=(2.0, 1.0))
+    assert rot.bounds == (5.0, 25.0, 5.0, 15.0)
+    assert list(rot.get_adjusted_flat_points()) == [5.0, 5.0, 5.0, 15.0, 25.0, 15.0, 25.0, 5.0]
+    adjusted = rot.get_adjusted_points()
+    assert adjusted == [(5.0, 5.0), (5.0, 15.0), (25.0, 15.0), (25.0, 5.0)]
+    # Nothing changed
+    assert rot.get_adjusted_points() is adjusted
+
+    # Moving keeps the rotation and scale
+    rot.angle = 90.0
+    matrix = rot._get_matrix()
+    rot.position = (0.0, 0.0)
+    assert rot._get_matrix() is matrix
+    expected = [(0.0, 0.0), (10.0, 0.0), (10.0, -20.0), (0.0, -20.0)]
+    for a, b in zip(rot.get_adjusted_points(), expected):
+        assert a == pytest.approx(b, abs=1e-6)
+    assert rot.bounds == pytest.approx((0.0, 10.0, -20.0, 0.0), abs=1e-6)
+    assert rot.left == rot.bounds[0]
+    assert rot.top == rot.bounds[3]
+
+    rot.scale = (1.0, 1.0)
+    assert rot._get_matrix() is not matrix
+    for a, b in zip(rot.get_adjusted_points(), rot_90):
+        assert a == pytest.approx(b, abs=1e-6)
@@ -0,0 +1,40 @@
+from PIL import Image, ImageDraw
+
+from arcade import hitbox
+
+
+def _make_images():
+    images = []
+    for size in (20, 33, 48):
+        image = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(image)
+        draw.ellipse((2, 3, size - 3, size - 5), fill=(255, 0, 0, 1))
+        images.append(image)
+    return images
+
+
+def test_alpha_mask():
+    image = Image.new("RGBA", (3, 2), (0, 0, 0, 0))
+    image.putpixel((1, 0), (0, 0, 0, 1))
+    image.putpixel((2, 1), (255, 255, 255, 255))
+    assert hitbox.PymunkHitBoxAlgorithm.get_alpha_mask(image) == bytes([0, 255, 0, 0, 0, 255])
+
+
+def test_calculate_detailed():
+    image = _make_images()[1]
+    points = hitbox.algo_detailed.calculate(image)
+    assert len(points) >= 4
+    # Points are centered on the image
+    assert min(x for x, _ in points) >= -16.5
+    assert max(x for x, _ in points) <= 16.5
+
+
+def test_calculate_many():
+    images = _make_images()
+    expected = [hitbox.algo_detailed.calculate(image, detail=2.0) for image in images]
+    assert hitbox.algo_detailed.calculate_many(images, processes=1, detail=2.0) == expected
+    assert hitbox.algo_detailed.calculate_many(images, processes=2, detail=2.0) == expected
+    assert hitbox.algo_simple.calculate_many(images[:1]) == [
+        hitbox.algo_simple.calculate(images[0])
+    ]
+    assert hitbox.algo_detailed.calculate_many([]) == []
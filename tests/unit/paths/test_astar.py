@@ -106,3 +106,129 @@ def test_astar(window):
                                        diagonal_movement=True)
 
     assert path == [(160, 160), (128, 160), (96, 192), (64, 160), (64, 128), (64, 96), (64, 64), (32, 32)]
+
+
+def test_astar_iteration_budget():
+    moving_sprite = arcade.SpriteSolidColor(16, 16, color=arcade.color.RED)
+    wall_list = arcade.SpriteList(use_spatial_hash=True)
+    # A long wall with a gap at the top forces a detour around it
+    for y in range(0, 60):
+        wall_list.append(
+            arcade.SpriteSolidColor(32, 32, center_x=32 * 20, center_y=32 * y, color=arcade.color.RED)
+        )
+    barrier_list = arcade.AStarBarrierList(moving_sprite, wall_list, 32, 0, 32 * 40, 0, 32 * 62)
+    assert barrier_list.width == 41
+    assert barrier_list.height == 63
+    assert sum(barrier_list.grid) == len(barrier_list.barrier_list)
+
+    start = (32 * 19, 0)
+    end = (32 * 21, 0)
+    path = arcade.astar_calculate_path(start, end, barrier_list)
+    assert path is not None
+    assert path[0] == start
+    assert path[-1] == end
+    assert not set(path) & {(x * 32, y * 32) for x, y in barrier_list.barrier_list}
+
+    assert arcade.astar_calculate_path(start, end, barrier_list, max_iterations=100) is None
+
+
+def _make_walls():
+    wall_list = arcade.SpriteList(use_spatial_hash=True)
+    for x, y, w, h in ((100, 100, 64, 20), (300, 50, 32, 200), (40, 300, 90, 90), (500, 500, 31, 33)):
+        wall_list.append(arcade.SpriteSolidColor(w, h, center_x=x, center_y=y, color=arcade.color.RED))
+    return wall_list
+
+
+def test_barrier_list_rasterize():
+    moving_sprite = arcade.SpriteSolidColor(20, 20, color=arcade.color.RED)
+    probed = arcade.AStarBarrierList(moving_sprite, _make_walls(), 16, -64, 640, -64, 640)
+    rasterized = arcade.AStarBarrierList(moving_sprite, _make_walls(), 16, -64, 640, -64, 640, rasterize=True)
+    assert probed.grid == rasterized.grid
+    assert probed.barrier_list == rasterized.barrier_list
+    assert len(probed.barrier_list) > 0
+
+
+def test_barrier_list_incremental():
+    moving_sprite = arcade.SpriteSolidColor(20, 20, color=arcade.color.RED)
+    walls = _make_walls()
+    barrier_list = arcade.AStarBarrierList(moving_sprite, walls, 16, -64, 640, -64, 640)
+    original = bytes(barrier_list.grid)
+
+    crate = arcade.SpriteSolidColor(40, 40, center_x=200, center_y=200, color=arcade.color.RED)
+    barrier_list.add_blocking_sprite(crate)
+    assert crate in walls
+    assert barrier_list.is_blocked(200 // 16, 200 // 16)
+    added = bytes(barrier_list.grid)
+    barrier_list.recalculate()
+    assert bytes(barrier_list.grid) == added
+
+    # Move the crate and update the old and new area
+    old_rect = crate.rect
+    crate.position = 400, 300
+    barrier_list.update_region(old_rect)
+    barrier_list.update_region(crate.rect)
+    assert not barrier_list.is_blocked(200 // 16, 200 // 16)
+    moved = bytes(barrier_list.grid)
+    barrier_list.recalculate()
+    assert bytes(barrier_list.grid) == moved
+
+    barrier_list.remove_blocking_sprite(crate)
+    assert crate not in walls
+    assert bytes(barrier_list.grid) == original
+
+
+def test_astar_path_cache():
+    moving_sprite = arcade.SpriteSolidColor(20, 20, color=arcade.color.RED)
+    walls = _make_walls()
+    barrier_list = arcade.AStarBarrierList(moving_sprite, walls, 16, -64, 640, -64, 640)
+    cache = arcade.AStarPathCache(capacity=2)
+
+    path = arcade.astar_calculate_path((0, 0), (600, 600), barrier_list, cache=cache)
+    assert cache.misses == 1
+    assert arcade.astar_calculate_path((0, 0), (600, 600), barrier_list, cache=cache) == path
+    assert cache.hits == 1
+
+    # Least recently used paths are dropped
+    arcade.astar_calculate_path((0, 0), (500, 600), barrier_list, cache=cache)
+    arcade.astar_calculate_path((0, 0), (400, 600), barrier_list, cache=cache)
+    assert len(cache) == 2
+    arcade.astar_calculate_path((0, 0), (600, 600), barrier_list, cache=cache)
+    assert cache.misses == 4
+
+    # Changing the barriers clears the cache
+    version = barrier_list.version
+    barrier_list.add_blocking_sprite(
+        arcade.SpriteSolidColor(40, 40, center_x=200, center_y=200, color=arcade.color.RED)
+    )
+    assert barrier_list.version > version
+    arcade.astar_calculate_path((0, 0), (600, 600), barrier_list, cache=cache)
+    assert cache.misses == 5
+    assert len(cache) == 1
+
+
+def test_flow_field():
+    moving_sprite = arcade.SpriteSolidColor(20, 20, color=arcade.color.RED)
+    walls = _make_walls()
+    barrier_list = arcade.AStarBarrierList(moving_sprite, walls, 16, -64, 640, -64, 640)
+    goal = (320, 320)
+    field = arcade.FlowField(barrier_list, goal)
+
+    assert field.get_distance(goal) == 0
+    assert field.get_next_point(goal) == goal
+    for start in ((0, 0), (592, 16), (16, 592)):
+        path = field.get_path(start)
+        astar_path = arcade.astar_calculate_path(start, goal, barrier_list)
+        assert path[0] == start
+        assert path[-1] == goal
+        assert field.get_next_point(start) == path[1]
+        assert len(path) == len(astar_path)
+
+    # Outside the grid
+    assert field.get_next_point((10000, 0)) is None
+
+    # Wall off the goal
+    for x, y in ((304, 304), (320, 304), (336, 304), (304, 320), (336, 320), (304, 336), (320, 336), (336, 336)):
+        barrier_list.add_blocking_sprite(
+            arcade.SpriteSolidColor(16, 16, center_x=x, center_y=y, color=arcade.color.RED)
+        )
+    assert field.get_path((0, 0)) is None
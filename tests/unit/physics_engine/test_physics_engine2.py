@@ -1,11 +1,14 @@
 """ Physics engine tests. """
 import copy
+import math
 
 import pytest
 
 import arcade
 
 OUT_OF_THE_WAY = (250, 250)
+# Where a 10x10 sprite moving right touches a 10x10 wall at (15, -5) rotated 45 degrees
+CONTACT_X = 15 - 5 * math.sqrt(2) - 5
 
 
 def check_spritelists_prop_clears_instead_of_overwrites(engine, prop_name: str):
@@ -237,10 +240,12 @@ def simple_engine_tests(moving_sprite, wall_list, physics_engine):
         moving_sprite.change_y = 0
         moving_sprite.change_angle = 0
         collisions = physics_engine.update()
-        assert moving_sprite.position == (2, 0)
         if speed == 2:
+            assert moving_sprite.position == (2, 0)
             assert len(collisions) == 0
         else:
+            # Stops where the corner of the rotated wall touches the sprite
+            assert moving_sprite.position == pytest.approx((CONTACT_X, 0))
             assert len(collisions) == 1
 
     wall_sprite_1.position = (-15, -5)
@@ -252,10 +257,11 @@ def simple_engine_tests(moving_sprite, wall_list, physics_engine):
         moving_sprite.change_y = 0
         moving_sprite.change_angle = 0
         collisions = physics_engine.update()
-        assert moving_sprite.position == (-2, 0)
         if speed == 2:
+            assert moving_sprite.position == (-2, 0)
             assert len(collisions) == 0
         else:
+            assert moving_sprite.position == pytest.approx((-CONTACT_X, 0))
             assert len(collisions) == 1
 
     check_spritelists_prop_clears_instead_of_overwrites(physics_engine, 'walls')
@@ -363,3 +369,94 @@ def test_main(window: arcade.Window):
     basic_tests(moving_sprite, wall_list, physics_engine)
     platformer_tests(moving_sprite, wall_list, physics_engine)
     nocopy_tests(physics_engine)
+
+
+@pytest.mark.parametrize("engine_type", [arcade.PhysicsEngineSimple, arcade.PhysicsEnginePlatformer])
+def test_fast_movement_stops_at_contact(engine_type):
+    """Fast movement should stop flush against walls without passing through"""
+    wall_list = arcade.SpriteList(use_spatial_hash=True)
+    floor = arcade.SpriteSolidColor(200, 10, center_x=0, center_y=-100, color=arcade.color.BLUE)
+    wall = arcade.SpriteSolidColor(10, 200, center_x=100, center_y=0, color=arcade.color.BLUE)
+    wall_list.extend((floor, wall))
+    moving_sprite = arcade.SpriteSolidColor(width=10, height=10, color=arcade.color.RED)
+    if engine_type is arcade.PhysicsEnginePlatformer:
+        physics_engine = engine_type(moving_sprite, walls=wall_list, gravity_constant=0.0)
+    else:
+        physics_engine = engine_type(moving_sprite, wall_list)
+
+    moving_sprite.change_y = -500
+    assert physics_engine.update() == [floor]
+    assert moving_sprite.position == (0, -90)
+
+    moving_sprite.change_x = 100
+    assert physics_engine.update() == [wall]
+    assert moving_sprite.position == (90, -90)
+
+
+def test_group_engine():
+    """The group engine should move sprites like one engine per sprite"""
+    def make_level():
+        wall_list = arcade.SpriteList(use_spatial_hash=True)
+        for x in range(-200, 200, 10):
+            wall_list.append(arcade.SpriteSolidColor(10, 10, center_x=x, center_y=-50, color=arcade.color.BLUE))
+        wall_list.append(arcade.SpriteSolidColor(10, 100, center_x=0, center_y=0, color=arcade.color.BLUE))
+        sprites = arcade.SpriteList()
+        for i in range(10):
+            sprite = arcade.SpriteSolidColor(8, 8, center_x=i * 30 - 135, center_y=100 + i, color=arcade.color.RED)
+            sprite.change_x = (i - 5) / 5
+            sprites.append(sprite)
+        return wall_list, sprites
+
+    wall_list, sprites = make_level()
+    engine = arcade.PhysicsEngineGroup(sprites, wall_list, gravity_constant=0.5)
+    for _ in range(60):
+        hits = engine.update()
+
+    wall_list_2, sprites_2 = make_level()
+    engines = [arcade.PhysicsEngineSimple(sprite, wall_list_2) for sprite in sprites_2]
+    for _ in range(60):
+        hits_2 = {}
+        for sprite, single_engine in zip(sprites_2, engines):
+            sprite.change_y -= 0.5
+            hit_list = single_engine.update()
+            if hit_list:
+                hits_2[sprites[sprites_2.index(sprite)]] = {
+                    wall_list[wall_list_2.index(hit)] for hit in hit_list
+                }
+
+    assert [s.position for s in sprites] == [s.position for s in sprites_2]
+    assert {sprite: set(hit_list) for sprite, hit_list in hits.items()} == hits_2
+    # All sprites end up standing on the floor
+    assert set(hits) == set(sprites)
+
+    # Platforms move once per update
+    platform = arcade.SpriteSolidColor(30, 10, center_x=500, center_y=0, color=arcade.color.BLUE)
+    platform.change_x = 1
+    platform_list = arcade.SpriteList(use_spatial_hash=True)
+    platform_list.append(platform)
+    engine.platforms = platform_list
+    engine.update()
+    assert platform.center_x == 501
+
+
+def test_group_engine_wiggle():
+    """Walls out of reach before a wiggle still block the sprite after it"""
+    def make_level():
+        wall_list = arcade.SpriteList(use_spatial_hash=True)
+        inside = arcade.SpriteSolidColor(10, 10, center_x=0, center_y=0, color=arcade.color.BLUE)
+        above = arcade.SpriteSolidColor(10, 10, center_x=0, center_y=30, color=arcade.color.BLUE)
+        wall_list.extend((inside, above))
+        sprite = arcade.SpriteSolidColor(10, 10, color=arcade.color.RED)
+        sprite.change_y = 10
+        return wall_list, sprite, above
+
+    wall_list, sprite, above = make_level()
+    sprites = arcade.SpriteList()
+    sprites.append(sprite)
+    engine = arcade.PhysicsEngineGroup(sprites, wall_list)
+    hits = engine.update()
+    assert hits == {sprite: [above]}
+
+    wall_list_2, sprite_2, _ = make_level()
+    arcade.PhysicsEngineSimple(sprite_2, wall_list_2).update()
+    assert sprite.position == sprite_2.position == (0, 20)
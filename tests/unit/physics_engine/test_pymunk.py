@@ -55,3 +55,74 @@ def test_pymunk_add_sprite_moment_backwards_compatibility(moment_of_inertia_arg_
     set_moment = physics_engine.get_physics_object(sprite).body.moment
 
     assert set_moment == arcade.PymunkPhysicsEngine.MOMENT_INF
+
+
+def test_pymunk_resync_sprites():
+    """Resync writes straight into the sprite lists and skips sleeping bodies"""
+
+    class MovedSprite(arcade.SpriteSolidColor):
+        def __init__(self):
+            super().__init__(32, 32, color=arcade.color.RED)
+            self.moves = []
+
+        def pymunk_moved(self, physics_engine, dx, dy, d_angle):
+            self.moves.append((dx, dy, d_angle))
+
+    physics_engine = arcade.PymunkPhysicsEngine(damping=1.0, gravity=(0, 0))
+    sprite_list = arcade.SpriteList(use_spatial_hash=True)
+    moved = MovedSprite()
+    plain = arcade.SpriteSolidColor(32, 32, center_x=200, color=arcade.color.RED)
+    sprite_list.extend((moved, plain))
+    physics_engine.add_sprite(moved)
+    physics_engine.add_sprite(plain)
+
+    physics_engine.set_position(moved, (10, 20))
+    physics_engine.get_physics_object(moved).body.angle = 0.5
+    physics_engine.set_position(plain, (300, 40))
+    physics_engine.resync_sprites()
+
+    assert moved.position == (10, 20)
+    assert moved.angle == pytest.approx(-28.6478897)
+    assert moved.moves == [(10, 20, pytest.approx(-28.6478897))]
+    assert plain.position == (300, 40)
+
+    slot = sprite_list.sprite_slot[plain]
+    assert sprite_list._sprite_pos_data[slot * 3: slot * 3 + 2].tolist() == [300, 40]
+    assert sprite_list._sprite_angle_data[sprite_list.sprite_slot[moved]] == pytest.approx(moved.angle)
+    assert plain in sprite_list.spatial_hash.get_sprites_near_point((300, 40))
+    assert plain.hit_box.position == (300, 40)
+
+    # Unmoved sprites are still notified
+    physics_engine.resync_sprites()
+    assert moved.moves[-1] == (0, 0, 0)
+
+    # Sleeping bodies are skipped
+    physics_engine.space.sleep_time_threshold = 1.0
+    physics_engine.set_position(moved, (50, 50))
+    physics_engine.get_physics_object(moved).body.sleep()
+    moved.moves.clear()
+    physics_engine.resync_sprites()
+    assert moved.position == (10, 20)
+    assert moved.moves == []
+
+
+def test_pymunk_resync_set_position_and_angle():
+    """Resync moves sprites through set_position_and_angle so subclasses can hook it"""
+
+    class TrackedSprite(arcade.SpriteSolidColor):
+        def __init__(self):
+            super().__init__(32, 32, color=arcade.color.RED)
+            self.updates = []
+
+        def set_position_and_angle(self, position, angle):
+            self.updates.append(position)
+            super().set_position_and_angle(position, angle)
+
+    physics_engine = arcade.PymunkPhysicsEngine(damping=1.0, gravity=(0, 0))
+    sprite = TrackedSprite()
+    physics_engine.add_sprite(sprite)
+    physics_engine.set_position(sprite, (10, 20))
+    physics_engine.resync_sprites()
+
+    assert sprite.updates == [(10, 20)]
+    assert sprite.position == (10, 20)
@@ -239,6 +239,71 @@ def test_check_for_collision_with_lists(window):
     assert len(arcade.check_for_collision_with_lists(a, sls)) == 4
 
 
+def test_check_for_collision_with_list_numpy():
+    pytest.importorskip("numpy")
+    import random
+    rng = random.Random(1)
+
+    a = arcade.SpriteSolidColor(50, 50, color=arcade.csscolor.RED)
+    sl = arcade.SpriteList()
+    for i in range(500):
+        sprite = arcade.SpriteSolidColor(20, 10, color=arcade.csscolor.RED)
+        sprite.position = rng.randint(0, 500), rng.randint(0, 500)
+        sprite.angle = rng.randint(0, 360)
+        sl.append(sprite)
+    # Freed slots should not be reported
+    for sprite in sl[::3]:
+        sl.remove(sprite)
+    sl.append(a)
+
+    for position in ((0, 0), (100, 100), (250, 250), (1000, 1000)):
+        a.position = position
+        expected = arcade.check_for_collision_with_list(a, sl, method=3)
+        assert arcade.check_for_collision_with_list(a, sl, method=4) == expected
+        assert arcade.check_for_collision_with_lists(a, [sl], method=4) == expected
+
+
+def test_check_for_collisions_between_lists():
+    import random
+    rng = random.Random(0)
+
+    bullets = arcade.SpriteList()
+    enemies = arcade.SpriteList()
+    for i in range(200):
+        bullet = arcade.SpriteSolidColor(5, 10, color=arcade.csscolor.RED)
+        bullet.position = rng.randint(0, 500), rng.randint(0, 500)
+        bullet.angle = rng.randint(0, 360)
+        bullets.append(bullet)
+    for i in range(50):
+        enemy = arcade.SpriteSolidColor(30, 30, color=arcade.csscolor.RED)
+        enemy.position = rng.randint(0, 500), rng.randint(0, 500)
+        enemies.append(enemy)
+
+    expected = {
+        (bullet, enemy)
+        for bullet in bullets
+        for enemy in arcade.check_for_collision_with_list(bullet, enemies, method=3)
+    }
+    pairs = arcade.check_for_collisions_between_lists(bullets, enemies)
+    assert len(expected) > 0
+    assert len(pairs) == len(expected)
+    assert set(pairs) == expected
+
+    # Against itself each pair is only reported once
+    expected = {
+        frozenset((enemy, other))
+        for enemy in enemies
+        for other in arcade.check_for_collision_with_list(enemy, enemies, method=3)
+    }
+    pairs = arcade.check_for_collisions_between_lists(enemies, enemies)
+    assert len(pairs) == len(expected)
+    assert {frozenset(pair) for pair in pairs} == expected
+
+    assert arcade.check_for_collisions_between_lists(bullets, arcade.SpriteList()) == []
+    with pytest.raises(TypeError):
+        arcade.check_for_collisions_between_lists(bullets, "moo")
+
+
 def test_get_sprites_at_point(window):
     a = arcade.SpriteSolidColor(50, 50, color=arcade.csscolor.RED)
     b = arcade.SpriteSolidColor(50, 50, color=arcade.csscolor.RED)
@@ -309,3 +374,27 @@ def test_get_sprites_in_rect(use_spatial_hash):
     assert set(arcade.get_sprites_in_rect(arcade.LRBT(100, 200, 100, 200), sp)) == set()
     assert set(arcade.get_sprites_in_rect(arcade.LRBT(-100, 0, -100, 0), sp)) == {b, d}
     assert set(arcade.get_sprites_in_rect(arcade.LRBT(100, 0, 100, 0), sp)) == {a, c}
+
+
+@pytest.mark.parametrize("use_spatial_hash", [True, False])
+def test_check_for_collision_with_lists_at(use_spatial_hash):
+    player = arcade.SpriteSolidColor(10, 10, color=arcade.csscolor.RED)
+    player_list = arcade.SpriteList(use_spatial_hash=True)
+    player_list.append(player)
+    floor = arcade.SpriteSolidColor(100, 10, color=arcade.csscolor.RED, center_y=-10)
+    wall = arcade.SpriteSolidColor(10, 100, color=arcade.csscolor.RED, center_x=20)
+    walls = arcade.SpriteList(use_spatial_hash=use_spatial_hash)
+    walls.extend((floor, wall))
+
+    with pytest.raises(TypeError):
+        arcade.check_for_collision_with_lists_at("moo", (0, 0), [walls])
+
+    # Touching isn't colliding
+    assert arcade.check_for_collision_with_lists_at(player, (0, 0), [walls]) == []
+    assert arcade.check_for_collision_with_lists_at(player, (0, -1), [walls]) == [floor]
+    assert arcade.check_for_collision_with_lists_at(player, (11, 0), [walls]) == [wall]
+    assert set(arcade.check_for_collision_with_lists_at(player, (11, -1), [walls])) == {floor, wall}
+
+    # The probed sprite isn't moved
+    assert player.position == (0, 0)
+    assert player_list.spatial_hash.get_sprites_near_point((0, 0)) == {player}
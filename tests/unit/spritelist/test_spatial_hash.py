@@ -7,7 +7,7 @@ def test_create():
     sh = SpatialHash(cell_size=10)
     assert sh.cell_size == 10
     assert sh.contents == {}
-    assert sh.buckets_for_sprite == {}
+    assert sh.cell_range_for_sprite == {}
     assert sh.count == 0
 
 def test_incorrect_str_input():
@@ -35,7 +35,7 @@ def test_add():
     sh.add(arcade.SpriteSolidColor(10, 10, color=arcade.color.RED))
     assert sh.count == 4
     assert len(sh.contents) == 4
-    assert len(sh.buckets_for_sprite) == 4
+    assert len(sh.cell_range_for_sprite) == 4
 
 
 def test_add_twice():
@@ -46,7 +46,7 @@ def test_add_twice():
         sh.add(sprite)
         assert sh.count == 1
         assert len(sh.contents) == 4
-        assert len(sh.buckets_for_sprite) == 1
+        assert len(sh.cell_range_for_sprite) == 1
 
 
 def test_add_remove():
@@ -58,13 +58,12 @@ def test_add_remove():
     assert len(sh.contents) == 4  # 4 buckets
     for cn in sh.contents.values():
         assert len(cn) == 1
-    assert len(sh.buckets_for_sprite) == 1
+    assert len(sh.cell_range_for_sprite) == 1
     sh.remove(sprite)
     assert sh.count == 0
-    assert len(sh.contents) == 4
-    for cn in sh.contents.values():
-        assert len(cn) == 0
-    assert len(sh.buckets_for_sprite) == 0
+    # Empty buckets are discarded
+    assert len(sh.contents) == 0
+    assert len(sh.cell_range_for_sprite) == 0
 
 
 def test_remove_twice():
@@ -118,6 +117,109 @@ def test_get_near_point():
     assert len(nearby_sprites) == 0
 
 
+def test_queries_do_not_create_buckets():
+    """Queries in empty cells should not add buckets"""
+    sh = SpatialHash(cell_size=10)
+    sprite = arcade.SpriteSolidColor(10, 10, center_x=0)
+    sh.add(sprite)
+    assert len(sh.contents) == 4
+
+    sh.get_sprites_near_point((1000, 1000))
+    sh.get_sprites_near_rect(arcade.LRBT(500, 1000, 500, 1000))
+    sh.get_sprites_near_sprite(arcade.SpriteSolidColor(10, 10, center_x=-500))
+    assert len(sh.contents) == 4
+
+
+def test_stats():
+    sh = SpatialHash(cell_size=10)
+    sprite_1 = arcade.SpriteSolidColor(10, 10, center_x=0)
+    sprite_2 = arcade.SpriteSolidColor(10, 10, center_x=5)
+    sh.add(sprite_1)
+    sh.add(sprite_2)
+
+    stats = sh.stats()
+    assert stats.sprite_count == 2
+    assert stats.bucket_count == 6
+    assert stats.occupancy == {1: 4, 2: 2}
+    assert stats.memory_estimate > 0
+
+    sh.remove(sprite_1)
+    sh.remove(sprite_2)
+    stats = sh.stats()
+    assert stats.sprite_count == 0
+    assert stats.bucket_count == 0
+    assert stats.occupancy == {}
+
+
+def test_move_same_cells():
+    """Moving within the same cells should not re-bucket the sprite"""
+    sh = SpatialHash(cell_size=100)
+    sprite = arcade.SpriteSolidColor(10, 10, center_x=50, center_y=50)
+    sh.add(sprite)
+    cell_range = sh.cell_range_for_sprite[sprite]
+    assert cell_range == ((0, 0), (0, 0))
+
+    sprite.position = 60, 60
+    sh.move(sprite)
+    assert sh.cell_range_for_sprite[sprite] is cell_range
+
+    sprite.position = 150, 50
+    sh.move(sprite)
+    assert sh.cell_range_for_sprite[sprite] == ((1, 0), (1, 0))
+    assert sh.get_sprites_near_point((150, 50)) == {sprite}
+    assert sh.get_sprites_near_point((50, 50)) == set()
+
+
+def test_move_deferred():
+    """Deferred moves are applied before the next query"""
+    sh = SpatialHash(cell_size=100, deferred=True)
+    sprite = arcade.SpriteSolidColor(10, 10, center_x=50, center_y=50)
+    sh.add(sprite)
+
+    sprite.position = 150, 50
+    sh.move(sprite)
+    assert sh.cell_range_for_sprite[sprite] == ((0, 0), (0, 0))
+
+    assert sh.get_sprites_near_point((150, 50)) == {sprite}
+    assert sh.cell_range_for_sprite[sprite] == ((1, 0), (1, 0))
+
+    # Removing a dirty sprite should drop the pending move
+    sprite.position = 250, 50
+    sh.move(sprite)
+    sh.remove(sprite)
+    sh.flush()
+    assert sh.count == 0
+
+
+def test_spritelist_deferred_spatial_hash():
+    """Sprites moved in a spritelist with a deferred spatial hash"""
+    sprite_list = arcade.SpriteList(use_spatial_hash=True, spatial_hash_cell_size=100)
+    sprite_list.spatial_hash.deferred = True
+    sprite = arcade.SpriteSolidColor(10, 10, center_x=50, center_y=50)
+    sprite_list.append(sprite)
+
+    sprite.center_x = 350
+    assert arcade.get_sprites_at_point((350, 50), sprite_list) == [sprite]
+    assert arcade.get_sprites_at_point((50, 50), sprite_list) == []
+
+    sprite.center_x = 550
+    sprite_list.spatial_hash.deferred = False
+    assert sprite_list.spatial_hash.cell_range_for_sprite[sprite] == ((5, 0), (5, 0))
+
+
+def test_spritelist_clear_keeps_deferred():
+    """Clearing a spritelist keeps the deferred mode of its spatial hash"""
+    sprite_list = arcade.SpriteList(use_spatial_hash=True, spatial_hash_cell_size=100)
+    sprite_list.spatial_hash.deferred = True
+    sprite_list.append(arcade.SpriteSolidColor(10, 10))
+    sprite_list.clear()
+    assert sprite_list.spatial_hash.deferred
+    assert sprite_list.spatial_hash.count == 0
+
+    sprite_list.enable_spatial_hashing(50)
+    assert sprite_list.spatial_hash.deferred
+
+
 # Around for running debugger on the module directly
 # if __name__ == "__main__":
 #     test_reset()
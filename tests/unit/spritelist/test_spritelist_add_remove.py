@@ -32,3 +32,240 @@ def test_add():
     assert sprite_1.sprite_lists == []
     assert sprite_2.sprite_lists == []
     assert sprite_3.sprite_lists == []
+
+
+def test_remove_deferred():
+    """Removals are applied to the index buffer in a single pass"""
+    sl = arcade.SpriteList()
+    sprites = [arcade.SpriteSolidColor(16, 16, color=arcade.color.RED) for _ in range(10)]
+    sl.extend(sprites)
+
+    for sprite in sprites[::2]:
+        sl.remove(sprite)
+
+    # Length and membership are up to date right away
+    assert len(sl) == 5
+    assert sprites[0] not in sl
+    assert sprites[1] in sl
+    assert sprites[0].sprite_lists == []
+
+    # Index access applies the pending removals
+    assert sl.sprite_list == sprites[1::2]
+    assert sl._sprite_index_slots == 5
+    assert list(sl._sprite_index_data[:5]) == [1, 3, 5, 7, 9]
+    assert sorted(sl._sprite_buffer_free_slots) == [0, 2, 4, 6, 8]
+
+    # Re-adding a removed sprite before normalization
+    sl.remove(sprites[1])
+    sl.append(sprites[1])
+    assert sl.sprite_list == sprites[3::2] + [sprites[1]]
+    assert list(sl._sprite_index_data[:5]) == [3, 5, 7, 9, sl.sprite_slot[sprites[1]]]
+
+
+def test_remove_many():
+    sl = arcade.SpriteList(use_spatial_hash=True)
+    sprites = [arcade.SpriteSolidColor(16, 16, color=arcade.color.RED) for _ in range(10)]
+    sl.extend(sprites)
+
+    sl.remove_many(sprites[:5])
+    assert len(sl) == 5
+    assert sl._sprite_index_slots == 5
+    assert sl.sprite_list == sprites[5:]
+    assert sl.spatial_hash.count == 5
+
+
+def test_pop_after_removals(monkeypatch):
+    """Popping only rebuilds the index buffer for pending removals"""
+    sl = arcade.SpriteList(use_spatial_hash=True)
+    sprites = [arcade.SpriteSolidColor(16, 16, color=arcade.color.RED) for _ in range(10)]
+    sl.extend(sprites)
+    sl.remove(sprites[0])
+
+    calls = []
+    normalize = sl._normalize_index_buffer
+
+    def count_normalize():
+        calls.append(len(sl._sprites_removed))
+        normalize()
+
+    monkeypatch.setattr(sl, "_normalize_index_buffer", count_normalize)
+    popped = [sl.pop() for _ in range(5)]
+    assert popped == sprites[:4:-1]
+    assert calls == [1]
+
+    assert sl.sprite_list == sprites[1:5]
+    assert sl._sprite_index_slots == 4
+    assert list(sl._sprite_index_data[:4]) == [1, 2, 3, 4]
+    assert sorted(sl._sprite_buffer_free_slots) == [0, 5, 6, 7, 8, 9]
+    assert sl.spatial_hash.count == 4
+    for sprite in popped:
+        assert sprite.sprite_lists == []
+
+    # Popping from the middle still defers the removal
+    assert sl.pop(0) is sprites[1]
+    assert sl.sprite_list == sprites[2:5]
+
+
+def test_assign_sprite_list():
+    """Assigning sprite_list replaces the sprites"""
+    sl = arcade.SpriteList()
+    sprites = [arcade.SpriteSolidColor(16, 16, color=arcade.color.RED) for _ in range(5)]
+    sl.extend(sprites)
+
+    sl.sprite_list = sl.sprite_list[::-1]
+    assert sl.sprite_list == sprites[::-1]
+    assert len(sl) == 5
+    for sprite in sprites:
+        assert sprite.sprite_lists == [sl]
+
+    sl.sprite_list = []
+    assert len(sl) == 0
+    assert sprites[0].sprite_lists == []
+
+
+def test_kill_where():
+    sl_1 = arcade.SpriteList()
+    sl_2 = arcade.SpriteList()
+    sprites = [
+        arcade.SpriteSolidColor(16, 16, center_x=i * 10, color=arcade.color.RED)
+        for i in range(10)
+    ]
+    sl_1.extend(sprites)
+    sl_2.extend(sprites)
+
+    killed = sl_1.kill_where(lambda sprite: sprite.center_x >= 50)
+    assert killed == sprites[5:]
+    assert sl_1.sprite_list == sprites[:5]
+    assert sl_2.sprite_list == sprites[:5]
+    for sprite in killed:
+        assert sprite.sprite_lists == []
+
+
+def test_extend_matches_append():
+    """Bulk extend should produce the same buffers as appending"""
+    def make_sprites():
+        sprites = []
+        for i in range(250):
+            sprite = arcade.SpriteSolidColor(
+                i + 1, i + 2, center_x=i, center_y=-i, angle=i, color=(i, 255 - i, i, 200)
+            )
+            sprite.depth = i / 10
+            sprites.append(sprite)
+        return sprites
+
+    sl_append = arcade.SpriteList(capacity=1, use_spatial_hash=True)
+    for sprite in make_sprites():
+        sl_append.append(sprite)
+
+    sl_extend = arcade.SpriteList(capacity=1, use_spatial_hash=True)
+    sl_extend.extend(make_sprites())
+
+    assert len(sl_extend) == 250
+    assert sl_extend._buf_capacity == sl_append._buf_capacity
+    assert sl_extend._idx_capacity == sl_append._idx_capacity
+    assert sl_extend._sprite_pos_data == sl_append._sprite_pos_data
+    assert sl_extend._sprite_size_data == sl_append._sprite_size_data
+    assert sl_extend._sprite_angle_data == sl_append._sprite_angle_data
+    assert sl_extend._sprite_color_data == sl_append._sprite_color_data
+    assert sl_extend._sprite_index_data == sl_append._sprite_index_data
+    assert sl_extend.spatial_hash.count == 250
+    for sprite in sl_extend:
+        assert sprite.sprite_lists == [sl_extend]
+
+    # Free slots are reused first
+    sl_extend.remove_many(sl_extend[:10])
+    new_sprites = make_sprites()[:20]
+    sl_extend.extend(new_sprites)
+    assert len(sl_extend) == 260
+    assert sl_extend._sprite_buffer_slots == 260
+    assert sl_extend.sprite_list[-20:] == new_sprites
+    assert sorted(sl_extend.sprite_slot[s] for s in new_sprites) == list(range(10)) + list(range(250, 260))
+
+
+def test_extend_duplicates():
+    import pytest
+    sl = arcade.SpriteList()
+    sprite = arcade.SpriteSolidColor(16, 16, color=arcade.color.RED)
+    with pytest.raises(ValueError):
+        sl.extend([sprite, sprite])
+    assert len(sl) == 0
+    sl.append(sprite)
+    with pytest.raises(ValueError):
+        sl.extend([sprite])
+    assert len(sl) == 1
+
+
+class FakeBuffer:
+    """Records the writes to a buffer"""
+    size = 0
+
+    def __init__(self):
+        self.writes = []
+
+    def orphan(self):
+        pass
+
+    def write(self, data, offset=0):
+        self.writes.append((offset, bytes(data)))
+
+
+def test_dirty_ranges(window):
+    """Only the changed slots should be written to the buffers"""
+    sl = arcade.SpriteList()
+    sprites = [arcade.SpriteSolidColor(16, 16, color=arcade.color.RED) for _ in range(10)]
+    sl.extend(sprites)
+    sl.initialize()
+    sl._sprite_pos_buf = FakeBuffer()
+    # Upload all buffers once so only the position buffer changes below
+    sl._write_sprite_buffers_to_gpu()
+    sl.full_uploads = 0
+    sl.partial_uploads = 0
+    sl._sprite_pos_buf.writes.clear()
+
+    sl._sprite_pos_changed = True
+    sl._write_sprite_buffers_to_gpu()
+    assert sl.full_uploads == 1
+    assert sl._sprite_pos_buf.writes[0][0] == 0
+
+    sprites[3].center_x = 100
+    sprites[4].center_y = 100
+    sl._write_sprite_buffers_to_gpu()
+    assert sl.partial_uploads == 1
+    offset, data = sl._sprite_pos_buf.writes[-1]
+    assert offset == 3 * 3 * 4
+    assert data == bytes(sl._sprite_pos_data[9:15])
+
+    # Nothing changed
+    sl._write_sprite_buffers_to_gpu()
+    assert len(sl._sprite_pos_buf.writes) == 2
+
+    # Large changes fall back to a full write
+    for sprite in sprites:
+        sprite.center_x += 1
+    sl._write_sprite_buffers_to_gpu()
+    assert sl.full_uploads == 2
+    assert sl._sprite_pos_buf.writes[-1][0] == 0
+
+
+def test_insert_dirty_range():
+    """Inserting shifts the rest of the index buffer"""
+    sl = arcade.SpriteList(lazy=True)
+    sprites = [arcade.SpriteSolidColor(16, 16, color=arcade.color.RED) for _ in range(20)]
+    sl.extend(sprites)
+    sl._sprite_index_buf = FakeBuffer()
+    sl._write_sprite_buffers_to_gpu()
+    sl._sprite_index_buf.writes.clear()
+    sl.partial_uploads = 0
+
+    sprite = arcade.SpriteSolidColor(16, 16, color=arcade.color.BLUE)
+    sl.insert(15, sprite)
+    # Appending afterwards must not hide the shifted range
+    sl.append(arcade.SpriteSolidColor(16, 16, color=arcade.color.GREEN))
+    sl._write_sprite_buffers_to_gpu()
+
+    assert sl.partial_uploads == 1
+    offset, data = sl._sprite_index_buf.writes[-1]
+    assert offset == 15 * 4
+    assert data == bytes(sl._sprite_index_data[15:22])
+    assert sl._sprite_index_data[15] == sl.sprite_slot[sprite]
+    assert list(sl._sprite_index_data[16:21]) == [sl.sprite_slot[s] for s in sprites[15:]]
@@ -0,0 +1,102 @@
+import arcade
+from arcade.gl import Geometry
+
+
+def make_sprites(count, spacing=100):
+    return [
+        arcade.SpriteSolidColor(10, 10, center_x=i * spacing, color=arcade.color.RED)
+        for i in range(count)
+    ]
+
+
+def test_chunks():
+    sprites = make_sprites(10)
+    sp = arcade.ChunkedSpriteList(chunk_size=250)
+    sp.extend(sprites[:5])
+    sp.append(sprites[5])
+    sp.insert(0, sprites[6])
+    assert len(sp) == 7
+    assert sorted(sp.chunks) == [(0, 0), (1, 0), (2, 0)]
+    assert list(sp.chunks[(0, 0)]) == sprites[:3]
+    assert sprites[6] in sp.chunks[(2, 0)]
+
+    # Removing a sprite removes it from its chunk
+    sprites[0].remove_from_sprite_lists()
+    assert sprites[0] not in sp
+    assert sprites[0] not in sp.chunks[(0, 0)]
+    assert sprites[0].sprite_lists == []
+    sp.pop()
+    sp.remove(sprites[4])
+    assert sorted(sp.chunks) == [(0, 0), (1, 0), (2, 0)]
+
+    # Moving a sprite moves it to another chunk
+    sprites[1].center_x = 600
+    assert sprites[1] in sp.chunks[(2, 0)]
+    assert sprites[1] not in sp.chunks[(0, 0)]
+
+    # Chunks are only changed when the chunks are used
+    sprites[2].center_x = 600
+    old_chunk = sp._chunks[(0, 0)]
+    assert old_chunk in sprites[2].sprite_lists
+    assert sprites[2] in sp.chunks[(2, 0)]
+    assert old_chunk not in sprites[2].sprite_lists
+
+    sp.clear()
+    assert len(sp) == 0
+    assert sp.chunks == {}
+    assert all(sprite.sprite_lists == [] for sprite in sprites)
+
+
+def test_draw(window, monkeypatch):
+    """Only chunks visible to the camera are drawn"""
+    sp = arcade.ChunkedSpriteList(chunk_size=1000)
+    sp.extend(make_sprites(100))
+    assert len(sp.chunks) == 10
+
+    drawn = []
+    monkeypatch.setattr(
+        Geometry, "render", lambda self, program, **kwargs: drawn.append(kwargs["vertices"])
+    )
+    camera = arcade.Camera2D(
+        position=(5000, 0), projection=arcade.types.LRBT(-500, 500, -300, 300)
+    )
+    with camera.activate():
+        sp.draw()
+    # Only chunk 4 and 5 overlap x from 4500 to 5500
+    assert drawn == [10, 10]
+    assert sp.sprites_drawn == 20
+    assert sp.sprites_culled == 80
+
+
+def test_pymunk_moves_chunk():
+    """Sprites moved by the pymunk engine change chunk"""
+    sprite = arcade.SpriteSolidColor(10, 10, color=arcade.color.RED)
+    sp = arcade.ChunkedSpriteList(chunk_size=100)
+    sp.append(sprite)
+    assert sp._sprite_chunk[sprite] == (0, 0)
+
+    physics_engine = arcade.PymunkPhysicsEngine(damping=1.0, gravity=(0, 0))
+    physics_engine.add_sprite(sprite)
+    physics_engine.get_physics_object(sprite).body.position = 1050, 0
+    physics_engine.step(1 / 60)
+
+    assert sprite.center_x == 1050
+    assert sprite in sp.chunks[(10, 0)]
+    assert sp._sprite_chunk[sprite] == (10, 0)
+    assert sorted(sp.chunks) == [(10, 0)]
+    assert sprite in sp.chunks[(10, 0)]
+
+
+def test_tilemap_scene():
+    tile_map = arcade.load_tilemap(
+        ":resources:/tiled_maps/test_map_1.json",
+        layer_options={"Platforms": {"chunk_size": 256}},
+    )
+    platforms = tile_map.sprite_lists["Platforms"]
+    assert isinstance(platforms, arcade.ChunkedSpriteList)
+    assert len(platforms) == 10
+    assert sum(len(chunk) for chunk in platforms.chunks.values()) == 10
+    assert not isinstance(tile_map.sprite_lists["Background"], arcade.ChunkedSpriteList)
+
+    scene = arcade.Scene.from_tilemap(tile_map)
+    assert scene["Platforms"] is platforms
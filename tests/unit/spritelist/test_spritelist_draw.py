@@ -28,3 +28,93 @@ def mock_draw(*args, **kwargs):
     # Alpha 0 should not be rendered
     sp.alpha = 0
     sp.draw()
+
+
+def test_culling(window, monkeypatch):
+    """Only chunks visible to the camera are rendered"""
+    sp = arcade.SpriteList()
+    for i in range(100):
+        sp.append(arcade.SpriteSolidColor(10, 10, center_x=i * 100, color=arcade.color.RED))
+    sp.enable_culling(chunk_size=10)
+    assert sp.culling
+
+    calls = []
+    monkeypatch.setattr(Geometry, "render", lambda self, program, **kwargs: calls.append(kwargs))
+
+    camera = arcade.Camera2D(
+        position=(5000, 0), projection=arcade.types.LRBT(-500, 500, -300, 300)
+    )
+    with camera.activate():
+        # Sprites 45 to 55 are visible. Chunk 4 and 5 are merged into one range.
+        sp.draw()
+        assert [(call["first"], call["vertices"]) for call in calls] == [(40, 20)]
+        assert sp.sprites_drawn == 20
+        assert sp.sprites_culled == 80
+
+        # Moving a sprite updates the bounds
+        sp[0].center_x = 5000
+        calls.clear()
+        sp.draw()
+        assert [(call["first"], call["vertices"]) for call in calls] == [(0, 10), (40, 20)]
+        assert sp.sprites_drawn == 30
+
+    sp.disable_culling()
+    sp.draw()
+    assert sp.sprites_drawn == 100
+    assert sp.sprites_culled == 0
+
+
+def test_culling_updates_changed_chunks(monkeypatch):
+    """Only the chunks with changed sprites get new bounds"""
+    sp = arcade.SpriteList(lazy=True)
+    sprites = [
+        arcade.SpriteSolidColor(10, 10, center_x=i * 100, color=arcade.color.RED)
+        for i in range(90)
+    ]
+    sp.extend(sprites)
+    sp.enable_culling(chunk_size=10)
+
+    def reset_buffers():
+        """Reset the changes like writing the buffers does"""
+        for name in ("pos", "size", "angle", "color", "texture", "index"):
+            setattr(sp, f"_sprite_{name}_changed", False)
+            getattr(sp, f"_sprite_{name}_dirty")[:] = [2**31, 0]
+
+    reset_buffers()
+    sp._cull_bounds = sp._build_cull_bounds()
+
+    calls = []
+    get_chunk_bounds = sp._get_chunk_bounds
+
+    def count_chunk_bounds(chunk):
+        calls.append(chunk)
+        return get_chunk_bounds(chunk)
+
+    def update():
+        """Update the bounds and compare them with a full rebuild"""
+        monkeypatch.setattr(sp, "_get_chunk_bounds", count_chunk_bounds)
+        sp._update_cull_bounds()
+        reset_buffers()
+        monkeypatch.setattr(sp, "_get_chunk_bounds", get_chunk_bounds)
+        assert sp._cull_bounds == sp._build_cull_bounds()
+
+    sprites[55].center_x = 20000
+    update()
+    assert calls == [5]
+
+    calls.clear()
+    sp.append(arcade.SpriteSolidColor(10, 10, center_x=-500, color=arcade.color.RED))
+    update()
+    assert calls == [9]
+    assert len(sp._cull_bounds) == 10 * 4
+
+    calls.clear()
+    sp.pop()
+    update()
+    assert calls == []
+    assert len(sp._cull_bounds) == 9 * 4
+
+    calls.clear()
+    sp.swap(5, 25)
+    update()
+    assert sorted(calls) == [0, 1, 2]
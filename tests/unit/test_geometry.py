@@ -1,6 +1,12 @@
+import math
+
+import pytest
+
 from arcade.geometry import (
     is_point_in_polygon,
+    are_points_in_polygon,
     are_polygons_intersecting,
+    are_polygons_intersecting_many,
     get_triangle_orientation,
     are_lines_intersecting,
     is_point_in_box,
@@ -60,6 +66,65 @@ def test_are_mismatched_polygons_breaking():
     assert are_polygons_intersecting(poly_a, poly_b) is False
 
 
+def test_are_rectangles_intersecting():
+    """Unrotated rectangles take a shortcut that has to agree with SAT"""
+    rect = [(0, 0), (0, 50), (50, 50), (50, 0)]
+    # Touching edges are not intersecting
+    assert are_polygons_intersecting(rect, [(50, 0), (100, 0), (100, 50), (50, 50)]) is False
+    assert are_polygons_intersecting(rect, [(49, 49), (100, 49), (100, 100), (49, 100)]) is True
+    # A zero area rectangle is never intersecting
+    assert are_polygons_intersecting(rect, [(25, 0), (25, 0), (25, 50), (25, 50)]) is False
+    # Not a rectangle
+    assert are_polygons_intersecting(rect, [(60, 0), (100, 0), (100, 50), (49, 50)]) is True
+
+
+def _make_polygon(x, y, size, angle, points):
+    angles = [angle + i * math.tau / points for i in range(points)]
+    return [(x + size * math.cos(a), y + size * math.sin(a)) for a in angles]
+
+
+def test_are_polygons_intersecting_many():
+    pytest.importorskip("numpy")
+    polygons = [
+        _make_polygon(x * 13, y * 11, 10 + x, (x + y) / 7, 3 + (x + y) % 4)
+        for x in range(-5, 6)
+        for y in range(-5, 6)
+    ]
+    polygons.append([])
+    for polygon in (
+        _make_polygon(0, 0, 30, 0.5, 5),
+        [(-20, -10), (-20, 10), (20, 10), (20, -10)],
+    ):
+        expected = [are_polygons_intersecting(polygon, other) for other in polygons]
+        assert are_polygons_intersecting_many(polygon, polygons) == expected
+        assert True in expected and False in expected
+
+    # Only rectangles
+    rects = [
+        [(x, y), (x + 10, y), (x + 10, y + 5), (x, y + 5)]
+        for x in range(-30, 30, 5)
+        for y in range(-30, 30, 5)
+    ]
+    rect = [(0, 0), (0, 12), (12, 12), (12, 0)]
+    expected = [are_polygons_intersecting(rect, other) for other in rects]
+    assert are_polygons_intersecting_many(rect, rects) == expected
+    assert are_polygons_intersecting_many([], rects) == [False] * len(rects)
+
+
+def test_are_points_in_polygon():
+    pytest.importorskip("numpy")
+    polygon = [(0, 0), (0, 50), (50, 50), (50, 0)]
+    points = [(25, 25), (0, 25), (50, 50), (100, 100), (-1, 25), (49.5, 0.5)]
+    assert are_points_in_polygon(points, polygon) == [True, False, False, False, False, True]
+    assert are_points_in_polygon(points, []) == [False] * len(points)
+
+    # Concave polygon, with points away from the rows of its vertices
+    polygon = [(0, 0), (40, 0), (40, 40), (20, 10), (0, 40)]
+    points = [(x + 0.5, y + 0.5) for x in range(-5, 45, 3) for y in range(-5, 45, 3)]
+    expected = [is_point_in_polygon(x, y, polygon) for x, y in points]
+    assert are_points_in_polygon(points, polygon) == expected
+
+
 def test_get_triangle_orientation():
     triangle_colinear = [(0, 0), (0, 50), (0, 100)]
     assert get_triangle_orientation(*triangle_colinear) == 0
@@ -0,0 +1,74 @@
+import pytest
+import arcade
+
+
+def test_create(window):
+    sprite_list = arcade.SpriteList()
+    text = arcade.GlyphText("ab a", 10, 20, color=arcade.color.RED, sprite_list=sprite_list)
+    assert text.text == "ab a"
+    assert text.sprite_list is sprite_list
+    # Spaces have no sprite
+    assert len(text.sprites) == 3
+    assert len(sprite_list) == 3
+    assert all(sprite.color == arcade.color.RED for sprite in text.sprites)
+    # Same glyphs share a texture
+    assert text.sprites[0].texture is text.sprites[2].texture
+    assert text.sprites[0].texture is not text.sprites[1].texture
+    # Glyphs are placed left to right starting at x
+    assert text.sprites[0].left == pytest.approx(10)
+    assert text.sprites[0].center_x < text.sprites[1].center_x < text.sprites[2].center_x
+    assert text.content_width > 0
+    text.draw()
+
+
+def test_change_text(window):
+    """Changing the text reuses sprites and glyphs"""
+    text = arcade.GlyphText("123", 0, 0)
+    atlas = window.ctx.default_atlas
+    texture_count = len(atlas.textures)
+    sprites = text.sprites
+    textures = [sprite.texture for sprite in sprites]
+
+    text.text = "321"
+    assert len(atlas.textures) == texture_count
+    assert text.sprites == sprites
+    assert [sprite.texture for sprite in sprites] == textures[::-1]
+
+    # Shorter text hides the remaining sprites
+    text.text = "1"
+    assert len(text.sprites) == 1
+    assert len(text.sprite_list) == 3
+    assert not sprites[1].visible
+    assert not sprites[2].visible
+
+    text.text = 12
+    assert text.text == "12"
+    assert sprites[1].visible
+    assert len(text.sprite_list) == 3
+
+    text.delete()
+    assert len(text.sprite_list) == 0
+
+
+def test_position(window):
+    text = arcade.GlyphText("ab\nc", 100, 100, anchor_x="right", anchor_y="top")
+    a, b, c = text.sprites
+    assert b.right == pytest.approx(100, abs=1)
+    assert c.right == pytest.approx(100, abs=1)
+    assert a.top == pytest.approx(100, abs=1)
+    assert c.center_y < a.center_y
+
+    text.position = 110, 90
+    assert text.position == (110, 90)
+    assert b.right == pytest.approx(110, abs=1)
+    assert a.top == pytest.approx(90, abs=1)
+    text.x = 100
+    assert text.x == 100
+    assert b.right == pytest.approx(100, abs=1)
+
+
+def test_invalid_anchor(window):
+    with pytest.raises(ValueError):
+        arcade.GlyphText("a", 0, 0, anchor_x="top")
+    with pytest.raises(ValueError):
+        arcade.GlyphText("a", 0, 0, anchor_y="left")
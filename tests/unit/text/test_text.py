@@ -152,3 +152,16 @@ def new_text(*args, **kwargs) -> None:
         text.draw()
 
     window.flip()
+
+
+def test_draw_text_label_cache(window):
+    """draw_text keeps one label per text for each style"""
+    cache = window.ctx.label_cache
+    cache.flush()
+    for _ in range(3):
+        arcade.draw_text("Score", 10, 10, font_size=14)
+        arcade.draw_text("Lives", 10, 30, font_size=14)
+        arcade.draw_text("Lives", 10, 50, font_size=14, rotation=45)
+    assert len(cache) == 2
+    assert cache.stats["styles"] == 1
+    assert cache.get(next(iter(cache._entries)), "Score") is not None
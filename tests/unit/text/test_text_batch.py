@@ -0,0 +1,50 @@
+import arcade
+
+
+def test_reuse(window):
+    """Labels are reused between frames"""
+    text_batch = arcade.TextBatch()
+    for name in ("a", "b", "c"):
+        text_batch.draw_text(name, 10, 10)
+    assert len(text_batch) == 3
+    text_batch.draw()
+    assert len(text_batch) == 0
+    assert text_batch.stats == {"labels": 3, "created": 3, "reused": 0, "changed": 0}
+
+    # Same text is reused as is
+    label = text_batch.draw_text("a", 20, 30, color=arcade.color.RED)
+    assert label.text == "a"
+    assert label.position == (20, 30)
+    assert label.color == arcade.color.RED
+    assert text_batch.reused == 1
+
+    # New text takes a label of the same style
+    label = text_batch.draw_text("d", 10, 10)
+    assert label.text == "d"
+    assert text_batch.changed == 1
+
+    # Another style needs a new label
+    text_batch.draw_text("a", 10, 10, font_size=20)
+    assert text_batch.created == 4
+    text_batch.draw()
+    assert text_batch.stats["labels"] == 4
+
+
+def test_hide_unused(window):
+    """Labels not used in a frame are hidden and kept up to max_unused"""
+    text_batch = arcade.TextBatch(max_unused=1)
+    labels = [text_batch.draw_text(str(i), 10, 10) for i in range(3)]
+    text_batch.draw()
+    assert all(label.visible for label in labels)
+
+    text_batch.draw()
+    assert not labels[0].visible
+    assert text_batch.stats["labels"] == 1
+
+    label = text_batch.draw_text("0", 10, 10)
+    assert label is labels[0]
+    assert label.visible
+    assert text_batch.reused == 1
+
+    text_batch.clear()
+    assert text_batch.stats["labels"] == 0
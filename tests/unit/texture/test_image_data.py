@@ -50,3 +50,65 @@ def test_uniqueness():
     assert len({data_1, data_2, data_3}) == 2
     assert len({data_2, data_3}) == 2
     assert len({data_1, data_2}) == 1
+
+
+def test_hash_func(monkeypatch):
+    import hashlib
+
+    img = Image.effect_noise((300, 200), 50).convert("RGBA")
+    monkeypatch.setattr(ImageData, "hash_func", "sha256")
+    # Hashing in chunks gives the same result as hashing all the bytes
+    assert ImageData(img).hash == hashlib.sha256(img.tobytes()).hexdigest()
+    assert ImageData(Image.new("RGBA", (0, 0))).hash == hashlib.sha256().hexdigest()
+
+    monkeypatch.setattr(ImageData, "hash_func", "blake2b")
+    assert ImageData(img).hash == hashlib.blake2b(img.tobytes()).hexdigest()
+
+    monkeypatch.setattr(ImageData, "hash_func", lambda image: f"{image.size}")
+    assert ImageData(img).hash == "(300, 200)"
+
+
+def test_hash_chunks_match_tobytes(monkeypatch):
+    """Hashing in bands of rows should match hashing tobytes()"""
+    import hashlib
+
+    monkeypatch.setattr(ImageData, "hash_func", "sha256")
+    # Bands are about 1 MiB of rows and at least one row
+    sizes = [(1, 1), (7, 3), (300, 200), (1000, 700), (300000, 3)]
+    for mode in ("RGBA", "RGB", "LA", "L", "P", "1"):
+        for size in sizes:
+            img = Image.effect_noise(size, 50).convert(mode)
+            expected = hashlib.sha256(img.tobytes()).hexdigest()
+            assert ImageData.calculate_hash(img) == expected, (mode, size)
+
+
+def test_hash_func_xxhash(monkeypatch):
+    import pytest
+
+    xxhash = pytest.importorskip("xxhash")
+    img = Image.new("RGBA", (10, 20), (255, 0, 0, 255))
+    monkeypatch.setattr(ImageData, "hash_func", "xxh3_64")
+    assert ImageData(img).hash == xxhash.xxh3_64(img.tobytes()).hexdigest()
+
+
+def test_hash_from_path(tmp_path, monkeypatch):
+    import os
+
+    path = tmp_path / "image.png"
+    Image.new("RGBA", (10, 20), (255, 0, 0, 255)).save(path)
+    img = Image.open(path).convert("RGBA")
+
+    # Disabled by default
+    assert ImageData(img, file_path=path).hash == ImageData(img).hash
+
+    monkeypatch.setattr(ImageData, "hash_from_path", True)
+    data = ImageData(img, file_path=path)
+    assert data.hash != ImageData(img).hash
+    assert data.hash == ImageData(img, file_path=str(path)).hash
+    assert data.hash != ImageData(img, file_path=path, crop=(0, 0, 5, 5)).hash
+    assert ImageData(img, "test", file_path=path).hash == "test"
+
+    # Changing the file changes the hash
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert ImageData(img, file_path=path).hash != data.hash
@@ -62,3 +62,48 @@ def test_load_or_get_texture():
     manager.flush()
     assert len(manager.texture_cache._file_entries) == 0
     assert len(manager.texture_cache._entries) == 0
+
+
+def test_hit_box_cache_dir(tmp_path, monkeypatch):
+    """Hit boxes are reused from the cache directory"""
+    algo = arcade.hitbox.algo_detailed
+    manager = arcade.texture.TextureCacheManager(hit_box_cache_dir=tmp_path)
+    texture = manager.load_or_get_texture(TEST_TEXTURE, hit_box_algorithm=algo)
+    cropped = manager.load_or_get_spritesheet_texture(SPRITESHEET_PATH, 9, 0, 8, 16)
+    assert manager.hit_box_cache.get(texture) == texture.hit_box_points
+    assert len(manager.hit_box_cache) == 2
+
+    # A new manager loads the hit boxes instead of calculating them
+    def calculate(self, image, **kwargs):
+        raise AssertionError("Hit box should not be calculated")
+
+    monkeypatch.setattr(type(algo), "calculate", calculate)
+    monkeypatch.setattr(type(arcade.hitbox.algo_default), "calculate", calculate)
+    manager = arcade.texture.TextureCacheManager(hit_box_cache_dir=tmp_path)
+    reloaded = manager.load_or_get_texture(TEST_TEXTURE, hit_box_algorithm=algo)
+    assert reloaded.hit_box_points == texture.hit_box_points
+    reloaded = manager.load_or_get_spritesheet_texture(SPRITESHEET_PATH, 9, 0, 8, 16)
+    assert reloaded.hit_box_points == cropped.hit_box_points
+    assert reloaded.crop_values == (9, 0, 8, 16)
+
+
+def test_eviction_keeps_atlas_textures(ctx):
+    """Textures in a live atlas are not evicted"""
+    manager = arcade.texture.TextureCacheManager()
+    manager.texture_cache.max_entries = 1
+    manager.image_data_cache.max_entries = 1
+    atlas = arcade.DefaultTextureAtlas((256, 256))
+    texture = manager.load_or_get_spritesheet_texture(SPRITESHEET_PATH, 0, 0, 8, 16)
+    atlas.add(texture)
+    for i in range(1, 4):
+        manager.load_or_get_spritesheet_texture(SPRITESHEET_PATH, i * 9, 0, 8, 16)
+
+    assert texture in manager.texture_cache
+    # The pinned texture pushes out each new texture instead
+    assert len(manager.texture_cache) == 1
+    stats = manager.stats
+    assert stats["textures"]["evictions"] == 3
+    assert stats["textures"]["misses"] == 4
+    assert stats["image_data"]["entries"] == 1
+    assert manager.load_or_get_spritesheet_texture(SPRITESHEET_PATH, 0, 0, 8, 16) is texture
+    assert manager.stats["textures"]["hits"] == 1